@@ -7,6 +7,8 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
+from html_trim import trim_serp_html
+from serp_script import segment_items
 import time
 import argparse
 from urllib.parse import quote
@@ -52,7 +54,7 @@ def check_section_titles(keyword):
             try:
                 # 섹션 HTML 가져오기
                 section_html = section.get_attribute('outerHTML')
-                soup = BeautifulSoup(section_html, 'html.parser')
+                soup = BeautifulSoup(trim_serp_html(section_html), 'html.parser')
                 
                 # 섹션 클래스 출력
                 section_class = section.get_attribute('class')
@@ -73,7 +75,7 @@ def check_section_titles(keyword):
                                 print(f"  !!! 인기/브랜드 콘텐츠 발견 !!! - '{title_text}'")
                                 
                                 # 이 섹션 내의 콘텐츠 항목 찾기
-                                content_items = soup.select("li, div.content_item")
+                                content_items = segment_items(soup, 20)
                                 print(f"  콘텐츠 항목 수: {len(content_items)}")
                                 
                                 # 첫 번째 콘텐츠 항목의 정보 표시
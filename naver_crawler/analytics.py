@@ -0,0 +1,439 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+여러 실행 결과에 대한 사후 분석
+
+여러 번의 크롤링 결과(CSV 결과 파일, Parquet, SQLite)를 하나의 긴 테이블로 모은 뒤
+pandas 그룹 연산만으로 다음 요약 표를 만든다. 행 단위 반복이나 엑셀 수식이 필요 없다.
+
+    순위 변동       키워드 x URL별 첫/최근/최고/최저 순위와 직전 실행 대비 변화
+    게시처 점유율   게시처별 노출 수, 점유율, 순위 가중 점유율
+    아이디 점유율   아이디별 노출 수, 점유율, 순위 가중 점유율
+    인기글 변동     키워드별 인기글 탭 존재 비율과 존재 여부가 바뀐 횟수
+    섹션 변동성     키워드별 섹션 순서가 실행 사이에 움직인 평균 칸 수와 1순위 변경 횟수
+
+사용 예:
+    python analytics.py results/ --output results/analytics
+    python analytics.py history.sqlite --top 20
+"""
+
+import argparse
+import glob
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from records import SECTION_COLUMNS
+from value_normalizer import NORMALIZED_VIEW_COLUMN, normalize_content_frame
+
+RUN_COLUMN = "실행"
+RUN_TIME_COLUMN = "실행_시각"
+
+# 결과 파일 이름 끝의 타임스탬프 (GUI 기본 형식: 이름_YYYYmmdd_HHMMSS)
+_RUN_TIMESTAMP = re.compile(r"(\d{8}_\d{6})$")
+
+TABLES = ("summary", "sections", "contents")
+
+
+def _run_time(run_base):
+    """결과 파일 이름의 타임스탬프 (없으면 요약 파일 수정 시각)"""
+    match = _RUN_TIMESTAMP.search(os.path.basename(run_base))
+    if match:
+        return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+    return datetime.fromtimestamp(os.path.getmtime(f"{run_base}_summary.csv"))
+
+
+def find_runs(sources):
+    """
+    결과 파일 경로에서 실행 목록 찾기
+
+    Args:
+        sources (list): 결과 폴더, 글롭 패턴 또는 확장자를 제외한 결과 파일 경로 목록
+
+    Returns:
+        list: 실행별 결과 파일 경로 (확장자와 _summary.csv를 제외한 부분)
+    """
+    runs = set()
+    for source in sources:
+        if os.path.isdir(source):
+            pattern = os.path.join(source, "*_summary.csv")
+        elif source.endswith("_summary.csv") or any(ch in source for ch in "*?["):
+            pattern = source
+        else:
+            pattern = f"{source}_summary.csv"
+        for path in glob.glob(pattern):
+            if path.endswith("_summary.csv"):
+                runs.add(path[:-len("_summary.csv")])
+    return sorted(runs)
+
+
+def load_csv_runs(sources):
+    """
+    CSV 결과 파일로 저장된 여러 실행 불러오기
+
+    Args:
+        sources (list): 결과 폴더, 글롭 패턴 또는 결과 파일 경로 목록
+
+    Returns:
+        dict: "summary", "sections", "contents" -> 실행/실행_시각 열이 추가된 DataFrame
+    """
+    frames = {table: [] for table in TABLES}
+
+    for run_base in find_runs(sources):
+        run = os.path.basename(run_base)
+        run_time = _run_time(run_base)
+        for table in TABLES:
+            path = f"{run_base}_{table}.csv"
+            if not os.path.exists(path):
+                continue
+            df = pd.read_csv(path, encoding='utf-8-sig', keep_default_na=False)
+            df[RUN_COLUMN] = run
+            df[RUN_TIME_COLUMN] = run_time
+            frames[table].append(df)
+
+    return {table: pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame() for table, dfs in frames.items()}
+
+
+def load_parquet_runs(directory):
+    """
+    Parquet로 모아 둔 실행 기록 불러오기 (summary.parquet, sections.parquet, contents.parquet)
+
+    각 파일에는 실행, 실행_시각 열이 있어야 한다. pyarrow 또는 fastparquet가 필요하다.
+    """
+    history = {}
+    for table in TABLES:
+        path = os.path.join(directory, f"{table}.parquet")
+        history[table] = pd.read_parquet(path) if os.path.exists(path) else pd.DataFrame()
+    return history
+
+
+def load_sqlite_runs(path):
+    """
+    SQLite DB의 summary, sections, contents 테이블에서 실행 기록 불러오기
+
+    각 테이블에는 실행, 실행_시각 열이 있어야 한다.
+    """
+    history = {}
+    with sqlite3.connect(path) as conn:
+        existing = set(pd.read_sql_query("SELECT name FROM sqlite_master WHERE type='table'", conn)["name"])
+        for table in TABLES:
+            if table in existing:
+                history[table] = pd.read_sql_query(f'SELECT * FROM "{table}"', conn, parse_dates=[RUN_TIME_COLUMN])
+            else:
+                history[table] = pd.DataFrame()
+    return history
+
+
+def load_history(sources):
+    """
+    실행 기록 불러오기 (형식은 경로로 판단)
+
+    Args:
+        sources (list): CSV 결과 폴더/파일, Parquet 폴더, 또는 SQLite 파일(.db, .sqlite) 경로 목록
+
+    Returns:
+        dict: "summary", "sections", "contents" -> DataFrame. contents에는 작성일_정규화(날짜),
+            조회수_정규화(정수) 열이 있다 (정규화 열이 없던 실행은 실행_시각 기준으로 계산).
+    """
+    history = None
+    if len(sources) == 1:
+        source = sources[0]
+        if source.endswith((".db", ".sqlite", ".sqlite3")):
+            history = load_sqlite_runs(source)
+        elif os.path.isdir(source) and os.path.exists(os.path.join(source, "summary.parquet")):
+            history = load_parquet_runs(source)
+    if history is None:
+        history = load_csv_runs(sources)
+    if not history["contents"].empty:
+        history["contents"] = normalize_content_frame(history["contents"], RUN_TIME_COLUMN)
+    return history
+
+
+def save_history(history, path):
+    """
+    불러온 실행 기록을 Parquet 폴더 또는 SQLite 파일로 저장 (다음 분석 시 CSV 재파싱 생략)
+
+    Args:
+        history (dict): load_history 결과
+        path (str): .db/.sqlite 파일 경로 또는 Parquet 폴더 경로
+    """
+    if path.endswith((".db", ".sqlite", ".sqlite3")):
+        with sqlite3.connect(path) as conn:
+            for table, df in history.items():
+                if not df.empty:
+                    df.to_sql(table, conn, if_exists="replace", index=False)
+        return
+
+    os.makedirs(path, exist_ok=True)
+    for table, df in history.items():
+        if not df.empty:
+            df.to_parquet(os.path.join(path, f"{table}.parquet"), index=False)
+
+
+def _to_bool(series):
+    """CSV에서 읽은 참/거짓 열을 bool로 변환"""
+    if series.dtype == bool:
+        return series
+    return series.astype(str).str.strip().str.lower().isin(("true", "1", "있음"))
+
+
+def rank_movement(contents):
+    """
+    키워드 x URL별 순위 변동
+
+    같은 실행에서 한 URL이 여러 섹션에 나오면 가장 높은 순위를 사용한다.
+    정규화_URL 열이 있는 실행은 정규화 URL(광고/추적 링크의 최종 주소)로 URL을 묶는다.
+    순위_변화와 직전_변화는 양수일수록 순위가 올랐다는 뜻이다.
+
+    Args:
+        contents (DataFrame): 실행 기록의 contents 테이블
+
+    Returns:
+        DataFrame: 키워드, URL, 최근_제목, 등장_횟수, 첫_순위, 최근_순위, 최고_순위, 최저_순위,
+            평균_순위, 순위_변화, 직전_변화
+    """
+    if contents.empty:
+        return pd.DataFrame()
+
+    df = contents[["키워드", "URL", "제목", "순번", RUN_COLUMN, RUN_TIME_COLUMN]].copy()
+    if "정규화_URL" in contents.columns:
+        canonical = contents["정규화_URL"].fillna("").astype(str)
+        df["URL"] = canonical.where(canonical != "", df["URL"])
+    df["순번"] = pd.to_numeric(df["순번"], errors="coerce")
+    df = df.dropna(subset=["순번"])
+
+    # 실행 x 키워드 x URL당 한 행 (최고 순위)
+    df = (df.sort_values([RUN_TIME_COLUMN, "순번"])
+            .drop_duplicates(["키워드", "URL", RUN_COLUMN], keep="first"))
+
+    grouped = df.groupby(["키워드", "URL"], sort=False)
+    df["이전_순위"] = grouped["순번"].shift()
+
+    summary = grouped.agg(
+        최근_제목=("제목", "last"),
+        등장_횟수=("순번", "size"),
+        첫_순위=("순번", "first"),
+        최근_순위=("순번", "last"),
+        최고_순위=("순번", "min"),
+        최저_순위=("순번", "max"),
+        평균_순위=("순번", "mean"),
+        직전_순위=("이전_순위", "last"),
+    ).reset_index()
+
+    summary["순위_변화"] = summary["첫_순위"] - summary["최근_순위"]
+    summary["직전_변화"] = summary["직전_순위"] - summary["최근_순위"]
+    summary["평균_순위"] = summary["평균_순위"].round(2)
+
+    columns = ["키워드", "URL", "최근_제목", "등장_횟수", "첫_순위", "최근_순위", "최고_순위",
+               "최저_순위", "평균_순위", "순위_변화", "직전_변화"]
+    return summary[columns].sort_values(["키워드", "최근_순위"], ignore_index=True)
+
+
+def share_of_voice(contents, column):
+    """
+    게시처 또는 아이디별 노출 점유율
+
+    순위 가중 점유율은 노출마다 1/순위를 더한 값의 비율로, 상위 노출에 더 큰 비중을 준다.
+
+    Args:
+        contents (DataFrame): 실행 기록의 contents 테이블
+        column (str): "게시처" 또는 "아이디"
+
+    Returns:
+        DataFrame: column, 노출_수, 키워드_수, 실행_수, 평균_순위, 점유율, 순위가중_점유율
+            (조회수_정규화 열이 있으면 평균_조회수 포함)
+    """
+    if contents.empty:
+        return pd.DataFrame()
+
+    with_views = NORMALIZED_VIEW_COLUMN in contents.columns
+    df = contents[[column, "키워드", "순번", RUN_COLUMN] + ([NORMALIZED_VIEW_COLUMN] if with_views else [])].copy()
+    df[column] = df[column].astype(str).str.strip()
+    df = df[df[column] != ""]
+    if df.empty:
+        return pd.DataFrame()
+
+    ranks = pd.to_numeric(df["순번"], errors="coerce")
+    df["순번"] = ranks
+    df["순위_가중치"] = np.where(ranks > 0, 1.0 / ranks, 0.0)
+
+    aggregations = dict(
+        노출_수=("키워드", "size"),
+        키워드_수=("키워드", "nunique"),
+        실행_수=(RUN_COLUMN, "nunique"),
+        평균_순위=("순번", "mean"),
+        순위_가중치=("순위_가중치", "sum"),
+    )
+    if with_views:
+        df[NORMALIZED_VIEW_COLUMN] = df[NORMALIZED_VIEW_COLUMN].astype("float64")
+        aggregations["평균_조회수"] = (NORMALIZED_VIEW_COLUMN, "mean")
+    summary = df.groupby(column).agg(**aggregations)
+
+    summary["점유율"] = (summary["노출_수"] / summary["노출_수"].sum()).round(4)
+    summary["순위가중_점유율"] = (summary["순위_가중치"] / summary["순위_가중치"].sum()).round(4)
+    summary["평균_순위"] = summary["평균_순위"].round(2)
+    if with_views:
+        summary["평균_조회수"] = summary["평균_조회수"].round(0)
+
+    return (summary.drop(columns="순위_가중치")
+                   .sort_values(["순위가중_점유율", "노출_수"], ascending=False)
+                   .reset_index())
+
+
+def popular_churn(summary):
+    """
+    키워드별 인기글 탭 존재 변동
+
+    Args:
+        summary (DataFrame): 실행 기록의 summary 테이블
+
+    Returns:
+        DataFrame: 키워드, 실행_수, 존재_횟수, 존재_비율, 변경_횟수, 최근_존재
+    """
+    if summary.empty:
+        return pd.DataFrame()
+
+    df = summary[["키워드", "인기글_탭_존재", RUN_TIME_COLUMN]].copy()
+    df["인기글_탭_존재"] = _to_bool(df["인기글_탭_존재"])
+    df = df.sort_values(RUN_TIME_COLUMN, kind="stable")
+
+    grouped = df.groupby("키워드", sort=False)["인기글_탭_존재"]
+    previous = grouped.shift()
+    df["변경"] = previous.notna() & (df["인기글_탭_존재"] != previous)
+
+    result = df.groupby("키워드").agg(
+        실행_수=("인기글_탭_존재", "size"),
+        존재_횟수=("인기글_탭_존재", "sum"),
+        변경_횟수=("변경", "sum"),
+        최근_존재=("인기글_탭_존재", "last"),
+    )
+    result["존재_비율"] = (result["존재_횟수"] / result["실행_수"]).round(4)
+
+    return (result[["실행_수", "존재_횟수", "존재_비율", "변경_횟수", "최근_존재"]]
+            .sort_values(["변경_횟수", "존재_비율"], ascending=[False, False])
+            .reset_index())
+
+
+def section_volatility(sections):
+    """
+    키워드별 섹션 순서 변동성
+
+    섹션 순위 표를 (키워드, 실행, 순위, 섹션) 긴 형식으로 바꾼 뒤, 연속한 두 실행에 모두
+    나온 섹션이 평균 몇 칸 움직였는지(평균_이동)와 1순위 섹션이 바뀐 횟수를 계산한다.
+
+    Args:
+        sections (DataFrame): 실행 기록의 sections 테이블
+
+    Returns:
+        DataFrame: 키워드, 실행_수, 평균_이동, 최대_이동, 1순위_변경_횟수, 최근_1순위
+    """
+    if sections.empty:
+        return pd.DataFrame()
+
+    rank_columns = [column for column in SECTION_COLUMNS[1:] if column in sections.columns]
+    long = sections.melt(
+        id_vars=["키워드", RUN_COLUMN, RUN_TIME_COLUMN],
+        value_vars=rank_columns,
+        var_name="순위",
+        value_name="섹션"
+    )
+    long["섹션"] = long["섹션"].astype(str).str.strip()
+    long = long[(long["섹션"] != "") & (long["섹션"] != "nan")]
+    long["순위"] = long["순위"].str.replace("순위", "", regex=False).astype(int)
+
+    # 같은 실행에서 같은 제목이 여러 번 나오면 첫 위치만 사용
+    long = (long.sort_values([RUN_TIME_COLUMN, "순위"], kind="stable")
+                .drop_duplicates(["키워드", RUN_COLUMN, "섹션"], keep="first"))
+
+    # 키워드별 실행 순서 번호를 매겨 연속한 실행끼리만 비교
+    runs = (sections[["키워드", RUN_COLUMN, RUN_TIME_COLUMN]]
+            .drop_duplicates(["키워드", RUN_COLUMN])
+            .sort_values(RUN_TIME_COLUMN, kind="stable"))
+    runs["실행_순서"] = runs.groupby("키워드").cumcount()
+    long = long.merge(runs[["키워드", RUN_COLUMN, "실행_순서"]], on=["키워드", RUN_COLUMN])
+
+    long = long.sort_values(["키워드", "섹션", "실행_순서"])
+    grouped = long.groupby(["키워드", "섹션"], sort=False)
+    consecutive = grouped["실행_순서"].diff() == 1
+    long["이동"] = grouped["순위"].diff().abs().where(consecutive)
+
+    movement = long.groupby("키워드")["이동"].agg(평균_이동="mean", 최대_이동="max")
+
+    # 1순위 섹션 변경 횟수
+    first = long[long["순위"] == 1].sort_values(["키워드", "실행_순서"])
+    previous_first = first.groupby("키워드")["섹션"].shift()
+    first = first.assign(변경=previous_first.notna() & (first["섹션"] != previous_first))
+    first_changes = first.groupby("키워드").agg(**{
+        "1순위_변경_횟수": ("변경", "sum"),
+        "최근_1순위": ("섹션", "last"),
+    })
+
+    result = runs.groupby("키워드").size().rename("실행_수").to_frame()
+    result = result.join(movement).join(first_changes)
+    result["평균_이동"] = result["평균_이동"].round(2)
+    result["1순위_변경_횟수"] = result["1순위_변경_횟수"].fillna(0).astype(int)
+
+    return (result[["실행_수", "평균_이동", "최대_이동", "1순위_변경_횟수", "최근_1순위"]]
+            .sort_values(["평균_이동", "1순위_변경_횟수"], ascending=False, na_position="last")
+            .reset_index())
+
+
+def build_report(history):
+    """
+    모든 요약 표 계산
+
+    Args:
+        history (dict): load_history 결과
+
+    Returns:
+        dict: 시트 이름 -> DataFrame
+    """
+    contents = history.get("contents", pd.DataFrame())
+    return {
+        "순위 변동": rank_movement(contents),
+        "게시처 점유율": share_of_voice(contents, "게시처"),
+        "아이디 점유율": share_of_voice(contents, "아이디"),
+        "인기글 변동": popular_churn(history.get("summary", pd.DataFrame())),
+        "섹션 변동성": section_volatility(history.get("sections", pd.DataFrame())),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='여러 크롤링 실행 결과의 순위 변동, 점유율, 인기글/섹션 변동 분석')
+    parser.add_argument('sources', nargs='+', help='결과 폴더/파일(CSV), Parquet 폴더 또는 SQLite 파일')
+    parser.add_argument('--output', '-o', type=str, default='analytics', help='분석 결과 엑셀 파일 경로 (확장자 제외, 기본값: analytics)')
+    parser.add_argument('--top', type=int, default=10, help='화면에 표시할 표별 행 수 (기본값: 10)')
+    parser.add_argument('--save-history', type=str, default=None, help='불러온 실행 기록을 저장할 Parquet 폴더 또는 .db/.sqlite 파일')
+
+    args = parser.parse_args()
+
+    history = load_history(args.sources)
+    run_count = history["summary"][RUN_COLUMN].nunique() if not history["summary"].empty else 0
+    print(f"실행 {run_count}개, 컨텐츠 {len(history['contents'])}행을 불러왔습니다.")
+
+    if args.save_history:
+        save_history(history, args.save_history)
+        print(f"실행 기록 저장: {args.save_history}")
+
+    report = build_report(history)
+
+    output_file = f"{os.path.splitext(args.output)[0]}.xlsx"
+    with pd.ExcelWriter(output_file) as writer:
+        for sheet_name, df in report.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+    with pd.option_context('display.max_columns', None, 'display.width', 200):
+        for sheet_name, df in report.items():
+            print(f"\n=== {sheet_name} (상위 {args.top}행) ===")
+            print(df.head(args.top).to_string(index=False) if not df.empty else "(데이터 없음)")
+
+    print(f"\n분석 결과 저장: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
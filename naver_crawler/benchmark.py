@@ -0,0 +1,342 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+오프라인 파싱/내보내기 벤치마크
+
+저장된 검색 결과 HTML(naver_data/*.html)과 합성 SERP 코퍼스를
+섹션 탐색, 섹션 제목 추출, 콘텐츠 추출, URL 분류, CSV/엑셀 내보내기
+단계에 차례로 통과시키며 단계별 처리량과 최대 메모리를 측정한다.
+네트워크와 Chrome 없이 실행되며, 저장해 둔 기준값과 비교해 성능 저하를 찾을 수 있다.
+
+사용 예:
+    python benchmark.py --save-baseline benchmark_baseline.json
+    python benchmark.py --baseline benchmark_baseline.json --tolerance 0.2
+    python benchmark.py --check-script   # 자바스크립트 추출 결과가 HTML 추출과 같은지 확인 (Chrome 필요)
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from naver_search_crawler_url_analysis import MAX_ITEMS_PER_SECTION, NaverSearchCrawler
+from records import SummaryRecord, SectionRankRecord
+from result_sinks import CsvSink, ExcelSink, close_sinks
+from serp_script import SECTION_SELECTOR, extract_serp
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "naver_data")
+
+_SYNTHETIC_URLS = (
+    "https://blog.naver.com/user{n}/22379{n:05d}",
+    "https://cafe.naver.com/cafe{n}/7507{n:04d}?art=ZXh0ZXJuYWwtc2VydmljZQ",
+    "https://post.naver.com/viewer/postView.naver?volumeNo={n}",
+    "https://kin.naver.com/qna/detail.naver?d1id=7&docId={n}",
+    "https://user{n}.tistory.com/{n}",
+    "https://www.youtube.com/watch?v=vid{n}",
+    "https://news.example.co.kr/article/{n}",
+    "https://smartstore.naver.com/shop{n}/products/{n}",
+    "https://adcr.naver.com/adcr?x={n}",
+    "https://www.example{n}.com/page",
+)
+
+
+def build_synthetic_serp(section_count=30, items_per_section=20, seed=0):
+    """
+    섹션과 항목이 많은 합성 검색 결과 페이지 생성
+
+    Args:
+        section_count (int): 섹션 수
+        items_per_section (int): 섹션당 콘텐츠 항목 수
+        seed (int): 난수 시드
+
+    Returns:
+        str: 검색 결과 페이지 HTML
+    """
+    rng = random.Random(seed)
+    parts = ['<html><head><script>var data = {};</script></head><body>',
+             '<div id="header">헤더</div><div id="main_pack">']
+
+    for section_idx in range(section_count):
+        title = "건강·의학 인기글" if section_idx % 3 == 0 else f"주제 섹션 {section_idx}"
+        parts.append(f'<div class="api_subject_bx"><div class="title_area"><h2>{title}</h2></div><ul class="lst_view">')
+        for item_idx in range(items_per_section):
+            n = section_idx * items_per_section + item_idx
+            url = rng.choice(_SYNTHETIC_URLS).format(n=n)
+            parts.append(
+                '<li class="bx">'
+                f'<div class="user_box"><a class="name" href="#">작성자{n}</a>'
+                f'<span class="sub">{rng.randint(1, 30)}일 전</span></div>'
+                f'<a class="api_txt_lines total_tit" href="{url}">합성 콘텐츠 제목 {n}</a>'
+                f'<div class="dsc_area">본문 요약 {n}</div>'
+                '<ul class="tag_list"><li><a href="#">태그1</a></li><li><a href="#">태그2</a></li></ul>'
+                f'<span class="view">조회 {rng.randint(1, 99)},{rng.randint(100, 999)}</span>'
+                '</li>'
+            )
+        parts.append('</ul></div>')
+
+    parts.append('</div><div id="footer">푸터</div></body></html>')
+    return "".join(parts)
+
+
+def load_corpus(fixture_dir=FIXTURE_DIR, synthetic_pages=5, sections=30, items=20):
+    """
+    벤치마크 코퍼스 구성 (저장된 SERP + 합성 SERP)
+
+    Returns:
+        list: (이름, HTML) 목록
+    """
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            corpus.append((os.path.basename(path), f.read()))
+    for seed in range(synthetic_pages):
+        corpus.append((f"synthetic_{seed}", build_synthetic_serp(sections, items, seed)))
+    return corpus
+
+
+def _measure(func, repeat):
+    """
+    함수를 반복 실행해 최소 소요 시간과 최대 메모리 측정
+
+    Returns:
+        tuple: (함수 반환값, 최소 소요 시간(초), 최대 메모리(바이트))
+    """
+    best = None
+    value = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    # 메모리는 추적 오버헤드가 시간 측정에 섞이지 않도록 따로 한 번 더 실행
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return value, best, peak
+
+
+def export_results(all_results, section_results, content_results, output_base):
+    """
+    모아 둔 레코드를 CSV 및 엑셀 파일로 저장 (내보내기 단계 측정용)
+
+    Args:
+        all_results (list): SummaryRecord 목록
+        section_results (list): SectionRankRecord 목록
+        content_results (list): ContentItem 목록
+        output_base (str): 확장자를 제외한 출력 파일 경로
+    """
+    sinks = [CsvSink(output_base), ExcelSink(output_base)]
+    try:
+        for sink in sinks:
+            for record in all_results:
+                sink.write_summary(record)
+            for record in section_results:
+                sink.write_sections(record)
+            sink.write_contents(content_results)
+    finally:
+        close_sinks(sinks)
+
+
+def run_benchmark(corpus, repeat=3):
+    """
+    코퍼스를 단계별로 통과시키며 처리량과 메모리 측정
+
+    Args:
+        corpus (list): (이름, HTML) 목록
+        repeat (int): 단계별 반복 횟수 (최소 시간 사용)
+
+    Returns:
+        dict: 단계 이름 -> {"단위", "처리량", "소요_시간", "최대_메모리_MB", "건수"}
+    """
+    from bs4 import BeautifulSoup
+
+    crawler = NaverSearchCrawler(start_driver=False)
+    pages = [html for _, html in corpus]
+    results = {}
+
+    def record(stage, unit, count, elapsed, peak):
+        results[stage] = {
+            "단위": unit,
+            "건수": count,
+            "소요_시간": round(elapsed, 6),
+            "처리량": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+            "최대_메모리_MB": round(peak / (1024 * 1024), 3),
+        }
+
+    # 1. 섹션 탐색 (HTML 파싱 포함). 비교를 위해 사전 정리 없이 전체 페이지를 파싱한 값도 기록
+    _, elapsed, peak = _measure(
+        lambda: [BeautifulSoup(html, 'html.parser').select(SECTION_SELECTOR) for html in pages], repeat)
+    record("parse_page_untrimmed", "pages/s", len(pages), elapsed, peak)
+
+    sections_per_page, elapsed, peak = _measure(
+        lambda: [crawler.parse_sections_from_html(html) for html in pages], repeat)
+    record("find_content_sections", "pages/s", len(pages), elapsed, peak)
+    all_sections = [section for sections in sections_per_page for section in sections]
+
+    # 2. 섹션 제목 추출
+    _, elapsed, peak = _measure(
+        lambda: [crawler.get_section_title_from_html(section) for section in all_sections], repeat)
+    record("section_titles", "sections/s", len(all_sections), elapsed, peak)
+
+    # 3. 콘텐츠 추출
+    contents_per_section, elapsed, peak = _measure(
+        lambda: [crawler.extract_content_info_from_html(section) for section in all_sections], repeat)
+    items = [content for contents in contents_per_section for content in contents]
+    record("extract_content_info_from_section", "items/s", len(items), elapsed, peak)
+
+    # 4. URL 분류
+    urls = [content.url for content in items]
+    _, elapsed, peak = _measure(
+        lambda: [crawler.analyze_url_for_content_type(url) for url in urls], repeat)
+    record("analyze_url_for_content_type", "urls/s", len(urls), elapsed, peak)
+
+    # 5. CSV/엑셀 내보내기
+    all_results, section_results = [], []
+    for page_idx, (name, _) in enumerate(corpus):
+        all_results.append(SummaryRecord(name, "", True, "", ""))
+        titles = [crawler.get_section_title_from_html(section) for section in sections_per_page[page_idx]]
+        section_results.append(SectionRankRecord.create(name, titles))
+    content_results = [content._replace(keyword="benchmark") for content in items]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_base = os.path.join(temp_dir, "benchmark")
+        _, elapsed, peak = _measure(
+            lambda: export_results(all_results, section_results, content_results, output_base), repeat)
+    record("export_results", "rows/s", len(all_results) + len(section_results) + len(content_results), elapsed, peak)
+
+    return results
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """
+    기준값 대비 처리량이 tolerance 비율 이상 떨어진 단계 찾기
+
+    Returns:
+        list: (단계, 기준 처리량, 현재 처리량, 변화율) 목록
+    """
+    regressions = []
+    for stage, current in results.items():
+        base = baseline.get(stage)
+        if not base or not base.get("처리량"):
+            continue
+        change = current["처리량"] / base["처리량"] - 1
+        if change < -tolerance:
+            regressions.append((stage, base["처리량"], current["처리량"], change))
+    return regressions
+
+
+def check_script_extraction(fixture_dir=FIXTURE_DIR, headless=True):
+    """
+    저장된 SERP를 브라우저로 열어 스크립트 추출 결과가 HTML 추출 결과와 같은지 확인 (Chrome 필요)
+
+    섹션 제목은 브라우저 표시 텍스트와 HTML 텍스트의 공백 처리가 다를 수 있어 공백을 정리해 비교한다.
+
+    Returns:
+        list: 불일치 설명 목록 (비어 있으면 일치)
+    """
+    crawler = NaverSearchCrawler(headless=headless, enrich_cafe=False, enrich_details=False, extraction="script")
+    mismatches = []
+    try:
+        for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html"))):
+            name = os.path.basename(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                html_sections = crawler.parse_sections_from_html(f.read())
+            crawler.driver.get("file://" + os.path.abspath(path))
+            script_sections = extract_serp(crawler.driver, MAX_ITEMS_PER_SECTION)
+
+            if len(script_sections) != len(html_sections):
+                mismatches.append(f"{name}: 섹션 수 {len(script_sections)} != {len(html_sections)}")
+                continue
+
+            for idx, (script_section, html_section) in enumerate(zip(script_sections, html_sections), 1):
+                title = crawler.get_section_title_from_html(html_section)
+                if " ".join(crawler.get_section_title(script_section).split()) != " ".join(title.split()):
+                    mismatches.append(f"{name} {idx}번째 섹션: 제목 '{script_section.title.strip()}' != '{title}'")
+                script_items = crawler.extract_content_info_from_section(script_section, section_title=title)
+                html_items = crawler.extract_content_info_from_html(html_section, section_title=title)
+                if script_items != html_items:
+                    mismatches.append(f"{name} {idx}번째 섹션 '{title}': 항목 불일치")
+    finally:
+        crawler.close()
+    return mismatches
+
+
+def print_report(results, baseline=None):
+    """단계별 결과 표 출력"""
+    print(f"{'단계':<36}{'건수':>8}{'처리량':>14}{'단위':>12}{'메모리(MB)':>12}{'기준 대비':>10}")
+    for stage, values in results.items():
+        change = ""
+        if baseline and baseline.get(stage, {}).get("처리량"):
+            change = f"{values['처리량'] / baseline[stage]['처리량'] - 1:+.1%}"
+        print(f"{stage:<36}{values['건수']:>8}{values['처리량']:>14.1f}{values['단위']:>12}"
+              f"{values['최대_메모리_MB']:>12.2f}{change:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='네이버 검색 크롤러 오프라인 벤치마크 (네트워크/Chrome 불필요)')
+    parser.add_argument('--fixtures', type=str, default=FIXTURE_DIR, help='저장된 SERP HTML 폴더 (기본값: naver_data)')
+    parser.add_argument('--synthetic-pages', type=int, default=5, help='합성 SERP 페이지 수 (기본값: 5)')
+    parser.add_argument('--sections', type=int, default=30, help='합성 SERP의 섹션 수 (기본값: 30)')
+    parser.add_argument('--items', type=int, default=20, help='합성 SERP의 섹션당 항목 수 (기본값: 20)')
+    parser.add_argument('--repeat', type=int, default=3, help='단계별 반복 횟수 (기본값: 3)')
+    parser.add_argument('--json', type=str, default=None, help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--save-baseline', type=str, default=None, help='결과를 기준값 파일로 저장')
+    parser.add_argument('--baseline', type=str, default=None, help='비교할 기준값 파일')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용하는 처리량 감소 비율 (기본값: 0.2)')
+    parser.add_argument('--check-script', action='store_true', help='저장된 SERP에서 자바스크립트 추출과 HTML 추출 결과가 같은지 확인 (Chrome 필요)')
+
+    args = parser.parse_args()
+
+    if args.check_script:
+        logging.disable(logging.WARNING)
+        mismatches = check_script_extraction(args.fixtures)
+        for line in mismatches:
+            print(f"- {line}")
+        print("스크립트 추출 결과가 HTML 추출과 일치합니다." if not mismatches else f"불일치 {len(mismatches)}건")
+        sys.exit(1 if mismatches else 0)
+
+    # 반복 측정 중에는 크롤러 로그 출력이 시간에 섞이지 않도록 억제
+    logging.disable(logging.WARNING)
+
+    corpus = load_corpus(args.fixtures, args.synthetic_pages, args.sections, args.items)
+    print(f"코퍼스: 페이지 {len(corpus)}개 (저장된 SERP {len(corpus) - args.synthetic_pages}개, 합성 {args.synthetic_pages}개)")
+
+    results = run_benchmark(corpus, args.repeat)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print_report(results, baseline)
+
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            print(f"결과 저장: {path}")
+
+    if baseline:
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("\n성능 저하 감지:")
+            for stage, base, current, change in regressions:
+                print(f"- {stage}: {base:.1f} -> {current:.1f} ({change:+.1%})")
+            sys.exit(1)
+        print("\n기준값 대비 성능 저하 없음")
+
+
+if __name__ == "__main__":
+    main()
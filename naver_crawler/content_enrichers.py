@@ -0,0 +1,402 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+컨텐츠 상세 페이지 보강 (블로그, 포스트, 지식iN)
+
+검색 결과 카드에 작성일이나 조회수가 없으면 상세 페이지에서 가져온다.
+도메인마다 보강기(ContentEnricher)가 글 URL을 상세 페이지 URL과 캐시 키로 바꾸고,
+받아 온 HTML에서 값을 찾는다. 보강기의 parse는 HTML 문자열만 받으므로 저장해 둔
+페이지로도 확인할 수 있다 (python content_enrichers.py URL --html 파일).
+
+DetailFetcher는 셀레니움 대신 urllib3 연결 풀로 상세 페이지를 받아 온다.
+스레드 수와 풀 크기가 같아 모든 도메인을 합쳐 동시에 workers개까지만 요청하며,
+연결/읽기 시간 제한과 글 단위 캐시를 사용한다. 네이버 카페 글은 iframe과 로그인 때문에
+기존처럼 웹드라이버로 보강한다 (NaverSearchCrawler.extract_detailed_cafe_info).
+"""
+
+import argparse
+import logging
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+# 상세 페이지에서 찾은 값 (없으면 빈 문자열)
+Enrichment = namedtuple("Enrichment", ["user_id", "date", "view_count"])
+EMPTY_ENRICHMENT = Enrichment("", "", "")
+
+_NUMBER_PATTERN = re.compile(r'\d[\d,.]*\s*[만천]?')
+
+
+def _first_text(soup, selectors):
+    """선택자 중 처음 찾은 요소의 텍스트 (없으면 빈 문자열)"""
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element is not None:
+            text = element.get_text(" ", strip=True)
+            if text:
+                return text
+    return ""
+
+
+def _strip_label(text, labels):
+    """'작성일 2022.07.09.' 같은 텍스트에서 이름표 제거"""
+    for label in labels:
+        text = text.replace(label, "")
+    return text.strip()
+
+
+def _count(text):
+    """'조회수 1,234' / '1.2만 읽음' 같은 텍스트에서 숫자 부분만 추출"""
+    match = _NUMBER_PATTERN.search(text)
+    return match.group(0).replace(" ", "") if match else ""
+
+
+def make_pool_manager(workers, timeout, retries=1):
+    """
+    상세 페이지/리다이렉트 요청용 urllib3 연결 풀 생성
+
+    block=True이므로 호스트마다 workers개를 넘는 연결은 만들지 않고 기다린다.
+    재시도 횟수는 연결/읽기 오류에만 적용하고, 리다이렉트는 따로 3번까지 따라간다.
+
+    Args:
+        workers (int): 호스트별 최대 연결 수 (동시 요청 스레드 수와 같게 사용)
+        timeout (float): 연결/읽기 시간 제한 (초)
+        retries (int): 연결/읽기 오류 시 다시 시도할 횟수
+
+    Returns:
+        urllib3.PoolManager: 연결 풀
+    """
+    import urllib3
+
+    return urllib3.PoolManager(
+        num_pools=16,
+        maxsize=workers,
+        block=True,
+        headers={"User-Agent": USER_AGENT},
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        retries=urllib3.Retry(total=None, connect=retries, read=retries, redirect=3, raise_on_status=False),
+    )
+
+
+def _query(parsed, name):
+    values = parse_qs(parsed.query).get(name)
+    return values[0] if values else ""
+
+
+class ContentEnricher(ABC):
+    """도메인별 상세 페이지 보강기 (detail_request와 parse를 구현)"""
+    name = ""
+    # parse가 채울 수 있는 Enrichment 필드 (빈 필드를 채울 수 없는 글은 요청하지 않음)
+    provides = frozenset()
+
+    @abstractmethod
+    def detail_request(self, url):
+        """
+        글 URL을 상세 페이지 요청으로 변환
+
+        Args:
+            url (str): 검색 결과의 글 URL
+
+        Returns:
+            tuple: (캐시 키, 상세 페이지 URL). 이 보강기가 처리하지 않는 URL이면 None
+        """
+
+    @abstractmethod
+    def parse(self, html):
+        """
+        상세 페이지 HTML에서 값 찾기
+
+        Args:
+            html (str): 상세 페이지 HTML
+
+        Returns:
+            Enrichment: 찾은 값
+        """
+
+    @staticmethod
+    def _soup(html):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(html, 'html.parser')
+
+
+class BlogEnricher(ContentEnricher):
+    """네이버 블로그 (PostView 페이지에서 작성일, 블로그 글은 조회수를 공개하지 않음)"""
+    name = "블로그"
+    provides = frozenset(("date",))
+
+    DATE_SELECTORS = ("span.se_publishDate", "p.se_date", "span.se_date", "p.date", "span.date")
+
+    def detail_request(self, url):
+        parsed = urlparse(url)
+        if not parsed.netloc.endswith("blog.naver.com"):
+            return None
+        blog_id, log_no = _query(parsed, "blogId"), _query(parsed, "logNo")
+        if not (blog_id and log_no):
+            parts = [part for part in parsed.path.split("/") if part]
+            if len(parts) < 2 or not parts[1].isdigit():
+                return None
+            blog_id, log_no = parts[0], parts[1]
+        return (self.name, blog_id, log_no), f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
+
+    def parse(self, html):
+        soup = self._soup(html)
+        return Enrichment("", _first_text(soup, self.DATE_SELECTORS), "")
+
+
+class PostEnricher(ContentEnricher):
+    """네이버 포스트 (작성자, 작성일, 읽음 수)"""
+    name = "포스트"
+    provides = frozenset(Enrichment._fields)
+
+    AUTHOR_SELECTORS = ("span.se_author", "a.se_author", "span.writer", "a.nick")
+    DATE_SELECTORS = ("span.se_publishDate", "p.se_date", "span.post_date", "span.date")
+    VIEW_SELECTORS = ("span.post_view", "span.se_view", "span.view")
+
+    def detail_request(self, url):
+        parsed = urlparse(url)
+        if not parsed.netloc.endswith("post.naver.com"):
+            return None
+        volume_no = _query(parsed, "volumeNo")
+        if not volume_no:
+            return None
+        member_no = _query(parsed, "memberNo")
+        detail_url = f"https://post.naver.com/viewer/postView.naver?volumeNo={volume_no}"
+        if member_no:
+            detail_url += f"&memberNo={member_no}"
+        return (self.name, volume_no), detail_url
+
+    def parse(self, html):
+        soup = self._soup(html)
+        return Enrichment(
+            _first_text(soup, self.AUTHOR_SELECTORS),
+            _first_text(soup, self.DATE_SELECTORS),
+            _count(_first_text(soup, self.VIEW_SELECTORS))
+        )
+
+
+class KinEnricher(ContentEnricher):
+    """지식iN 질문 (작성자, 작성일, 조회수)"""
+    name = "지식iN"
+    provides = frozenset(Enrichment._fields)
+
+    INFO_SELECTOR = "span.c-userinfo__info"
+    AUTHOR_SELECTORS = ("span.c-userinfo__author", "a.c-userinfo__author")
+    HIDDEN_AUTHORS = ("비공개",)
+
+    def detail_request(self, url):
+        parsed = urlparse(url)
+        if not parsed.netloc.endswith("kin.naver.com"):
+            return None
+        doc_id = _query(parsed, "docId")
+        if not doc_id:
+            return None
+        params = "&".join(f"{name}={_query(parsed, name)}" for name in ("d1id", "dirId") if _query(parsed, name))
+        detail_url = f"https://kin.naver.com/qna/detail.naver?{params + '&' if params else ''}docId={doc_id}"
+        return (self.name, doc_id), detail_url
+
+    def parse(self, html):
+        soup = self._soup(html)
+        date = view_count = ""
+        for element in soup.select(self.INFO_SELECTOR):
+            text = element.get_text(" ", strip=True)
+            if not date and "작성일" in text:
+                date = _strip_label(text, ("작성일",))
+            elif not view_count and "조회" in text:
+                view_count = _count(text)
+        author = _first_text(soup, self.AUTHOR_SELECTORS)
+        if any(hidden in author for hidden in self.HIDDEN_AUTHORS):
+            author = ""
+        return Enrichment(author, date, view_count)
+
+
+DEFAULT_ENRICHERS = (BlogEnricher(), PostEnricher(), KinEnricher())
+
+
+class DetailFetcher:
+    def __init__(self, workers=4, timeout=5.0, retries=1, enrichers=DEFAULT_ENRICHERS):
+        """
+        상세 페이지 보강 초기화 (연결 풀과 스레드는 처음 요청할 때 만든다)
+
+        Args:
+            workers (int): 모든 도메인을 합친 최대 동시 요청 수
+            timeout (float): 연결/읽기 시간 제한 (초)
+            retries (int): 연결 오류 시 다시 시도할 횟수
+            enrichers (tuple): 사용할 ContentEnricher 목록
+        """
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.retries = retries
+        self.enrichers = enrichers
+        self.cache = {}     # 캐시 키 -> Enrichment
+        self._http = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._http is None:
+                self._http = make_pool_manager(self.workers, self.timeout, self.retries)
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="detail-fetch")
+            return self._http
+
+    def find(self, url):
+        """
+        URL을 처리할 보강기 찾기
+
+        Returns:
+            tuple: (보강기, 캐시 키, 상세 페이지 URL). 처리할 보강기가 없으면 None
+        """
+        if not url or url == "링크 없음":
+            return None
+        for enricher in self.enrichers:
+            request = enricher.detail_request(url)
+            if request is not None:
+                return (enricher,) + request
+        return None
+
+    def can_enrich(self, url, fields):
+        """
+        상세 페이지에서 fields 중 하나라도 채울 수 있는지 확인
+
+        Args:
+            url (str): 글 URL
+            fields (set): 비어 있는 Enrichment 필드 이름
+
+        Returns:
+            bool: 처리할 보강기가 있고 그 보강기가 채울 수 있는 필드가 있으면 True
+        """
+        found = self.find(url)
+        return found is not None and bool(found[0].provides & set(fields))
+
+    def fetch(self, url):
+        """
+        상세 페이지 HTML 받기
+
+        Args:
+            url (str): 상세 페이지 URL
+
+        Returns:
+            str: HTML (응답 코드가 200이 아니면 None)
+        """
+        response = self._pool().request("GET", url)
+        if response.status != 200:
+            logger.warning(f"상세 페이지 응답 코드 {response.status}: {url}")
+            return None
+        charset = "utf-8"
+        match = re.search(r'charset=([\w-]+)', response.headers.get("Content-Type", ""))
+        if match:
+            charset = match.group(1)
+        return response.data.decode(charset, errors="replace")
+
+    def _enrich(self, enricher, detail_url):
+        started = time.perf_counter()
+        try:
+            html = self.fetch(detail_url)
+        except Exception as e:
+            logger.warning(f"{enricher.name} 상세 페이지 요청 실패: {e}")
+            metrics.DETAIL_FETCH_ERRORS.inc()
+            return None
+        finally:
+            metrics.DETAIL_FETCH_SECONDS.observe(time.perf_counter() - started)
+        metrics.DETAIL_FETCHES.inc()
+        if html is None:
+            metrics.DETAIL_FETCH_ERRORS.inc()
+            return None
+        try:
+            return enricher.parse(html)
+        except Exception as e:
+            logger.warning(f"{enricher.name} 상세 페이지 분석 중 오류: {e}")
+            return EMPTY_ENRICHMENT
+
+    def enrich_urls(self, urls):
+        """
+        여러 글의 상세 페이지를 동시에 받아 값 찾기
+
+        같은 글(캐시 키)은 한 번만 요청하며, 요청에 실패한 글은 캐시하지 않아 다음 키워드에서 다시 시도한다.
+
+        Args:
+            urls (iterable): 글 URL 목록
+
+        Returns:
+            dict: 글 URL -> Enrichment (보강기가 없거나 요청에 실패한 URL은 제외)
+        """
+        keys = {}
+        pending = {}
+        for url in urls:
+            found = self.find(url)
+            if found is None:
+                continue
+            enricher, key, detail_url = found
+            keys[url] = key
+            if key in self.cache:
+                metrics.DETAIL_CACHE_HITS.inc()
+            elif key not in pending:
+                pending[key] = (enricher, detail_url)
+
+        if pending:
+            self._pool()
+            futures = {key: self._executor.submit(self._enrich, enricher, detail_url)
+                       for key, (enricher, detail_url) in pending.items()}
+            for key, future in futures.items():
+                enrichment = future.result()
+                if enrichment is not None:
+                    self.cache[key] = enrichment
+
+        return {url: self.cache[key] for url, key in keys.items() if key in self.cache}
+
+    def close(self):
+        """스레드와 연결 풀 정리"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._http is not None:
+                self._http.clear()
+                self._http = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='컨텐츠 상세 페이지 보강 확인 (블로그, 포스트, 지식iN)')
+    parser.add_argument('url', type=str, help='검색 결과의 글 URL')
+    parser.add_argument('--html', type=str, default=None, help='저장해 둔 상세 페이지 HTML 파일 (지정하면 요청하지 않고 이 파일을 분석)')
+    parser.add_argument('--timeout', type=float, default=5.0, help='연결/읽기 시간 제한 (초, 기본값: 5)')
+    args = parser.parse_args()
+
+    fetcher = DetailFetcher(workers=1, timeout=args.timeout)
+    found = fetcher.find(args.url)
+    if found is None:
+        parser.error("상세 페이지 보강을 지원하지 않는 URL입니다.")
+    enricher, key, detail_url = found
+    print(f"보강기: {enricher.name}, 상세 페이지: {detail_url}")
+
+    try:
+        if args.html:
+            with open(args.html, 'r', encoding='utf-8') as f:
+                enrichment = enricher.parse(f.read())
+        else:
+            enrichment = fetcher.enrich_urls([args.url]).get(args.url)
+    finally:
+        fetcher.close()
+
+    if enrichment is None:
+        print("상세 페이지를 가져오지 못했습니다.")
+        return
+    print(f"아이디: {enrichment.user_id}")
+    print(f"작성일: {enrichment.date}")
+    print(f"조회수: {enrichment.view_count}")
+
+
+if __name__ == "__main__":
+    main()
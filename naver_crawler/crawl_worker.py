@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+GUI용 크롤링 작업 프로세스
+
+Selenium, BeautifulSoup 파싱, pandas/엑셀 저장을 GUI와 다른 프로세스에서 실행해
+Tk 이벤트 루프와 GIL을 다투지 않게 한다. 자식 프로세스는 모든 출력을
+multiprocessing 큐로 보내며, 메시지는 (종류, 내용) 튜플이다.
+
+    ("log", 텍스트)                         print 및 logging 출력
+    ("progress", 진행 상황 딕셔너리)          CrawlProgress.snapshot()
+    ("result", (요약 레코드, 섹션 순위 레코드, 컨텐츠 항목 목록))
+    ("done", None)                          정상 종료
+    ("error", 트레이스백 문자열)               작업 중 예외
+"""
+
+import logging
+import sys
+import traceback
+
+
+class QueueWriter:
+    def __init__(self, message_queue):
+        """print 출력을 ("log", 텍스트) 메시지로 보내는 파일 객체"""
+        self.message_queue = message_queue
+
+    def write(self, string):
+        if string:
+            self.message_queue.put(("log", string))
+
+    def flush(self):
+        pass
+
+
+class QueueLogHandler(logging.Handler):
+    def __init__(self, message_queue):
+        """logging 레코드를 ("log", 텍스트) 메시지로 보내는 핸들러"""
+        super().__init__()
+        self.message_queue = message_queue
+        self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    def emit(self, record):
+        try:
+            self.message_queue.put(("log", self.format(record) + "\n"))
+        except Exception:
+            self.handleError(record)
+
+
+def run_crawl_worker(message_queue, cancel_event, keyword_source, output_path, show_browser, profile_run=False,
+                     resolve_redirects=False):
+    """
+    자식 프로세스에서 크롤링 실행
+
+    Args:
+        message_queue (multiprocessing.Queue): GUI로 보낼 메시지 큐
+        cancel_event (multiprocessing.Event): 설정되면 현재 키워드까지만 처리
+        keyword_source (str|list): 키워드 파일 경로 또는 키워드 목록
+        output_path (str): 확장자를 제외한 결과 파일 경로
+        show_browser (bool): 브라우저 화면 표시 여부
+        profile_run (bool): 작업 전체를 프로파일링할지 여부
+        resolve_redirects (bool): 광고/단축 URL의 최종 주소를 요청해 확인할지 여부
+    """
+    sys.stdout = QueueWriter(message_queue)
+    handler = QueueLogHandler(message_queue)
+    handler.setLevel(logging.INFO)
+    logging.getLogger().addHandler(handler)
+
+    try:
+        from naver_search_crawler_url_analysis import NaverSearchCrawler, setup_logging
+        from profiling import run_with_profile
+
+        setup_logging(console=False)
+
+        def crawl():
+            crawler = NaverSearchCrawler(headless=not show_browser, resolve_redirects=resolve_redirects)
+            crawler.process_keyword_list(
+                keyword_source,
+                output_path,
+                on_result=lambda summary_row, section_row, content_rows: message_queue.put(
+                    ("result", (summary_row, section_row, content_rows))),
+                progress_callback=lambda snapshot: message_queue.put(("progress", snapshot)),
+                cancel_event=cancel_event
+            )
+
+        if profile_run:
+            run_with_profile(crawl, output_path)
+            print(f"성능 프로파일 저장: {output_path}.prof, {output_path}_profile.txt")
+        else:
+            crawl()
+
+        message_queue.put(("done", None))
+
+    except BaseException:
+        message_queue.put(("error", traceback.format_exc()))
+
+    finally:
+        logging.getLogger().removeHandler(handler)
+        sys.stdout = sys.__stdout__
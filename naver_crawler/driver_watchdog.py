@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+웹드라이버 감시 (장시간 실행용 드라이버 재시작 판단)
+
+수천 개 키워드를 처리하는 동안 Chrome 프로세스의 메모리가 계속 늘어나고
+페이지 로딩이 느려지거나 드라이버가 멈추는 경우가 있다. DriverWatchdog은
+키워드마다 브라우저 프로세스 트리(chromedriver와 그 하위 Chrome 프로세스)의
+메모리와 키워드 처리 시간을 기록하고, 처리한 키워드 수나 메모리/지연 시간이
+기준을 넘으면 드라이버를 다시 시작해야 하는 이유를 알려 준다.
+
+메모리는 psutil이 설치되어 있으면 psutil로, 없으면 리눅스의 /proc에서 읽는다.
+둘 다 사용할 수 없으면 메모리 기준은 사용하지 않는다.
+"""
+
+import logging
+import os
+import statistics
+from collections import deque
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def _proc_tree_rss(root_pid):
+    """/proc에서 프로세스 트리의 RSS 합계(바이트) 계산 (리눅스 전용)"""
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", 'r') as f:
+                # comm 필드에 공백이 있을 수 있으므로 마지막 ')' 뒤에서 부모 PID를 읽는다
+                fields = f.read().rsplit(")", 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(int(name))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        try:
+            with open(f"/proc/{pid}/statm", 'r') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            pass
+        stack.extend(children.get(pid, ()))
+    return total
+
+
+def browser_memory_mb(driver):
+    """
+    웹드라이버 프로세스 트리의 메모리(RSS, MB)
+
+    Args:
+        driver: 셀레니움 웹드라이버
+
+    Returns:
+        float: 메모리 사용량 (MB), 측정할 수 없으면 None
+    """
+    try:
+        root_pid = driver.service.process.pid
+    except AttributeError:
+        return None
+
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    try:
+        if psutil is not None:
+            root = psutil.Process(root_pid)
+            total = root.memory_info().rss
+            for child in root.children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except psutil.Error:
+                    continue
+        elif os.path.isdir("/proc"):
+            total = _proc_tree_rss(root_pid)
+        else:
+            return None
+    except Exception as e:
+        logger.debug(f"브라우저 메모리 측정 실패: {e}")
+        return None
+
+    return total / (1024 * 1024)
+
+
+class DriverWatchdog:
+    def __init__(self, max_keywords=None, max_memory_mb=None, max_latency=None, latency_window=5):
+        """
+        드라이버 감시 초기화 (기준을 지정하지 않으면 해당 조건은 확인하지 않음)
+
+        Args:
+            max_keywords (int, optional): 드라이버 하나로 처리할 최대 키워드 수
+            max_memory_mb (float, optional): 브라우저 프로세스 트리 메모리 한도 (MB)
+            max_latency (float, optional): 최근 키워드 처리 시간 중앙값 한도 (초)
+            latency_window (int): 지연 시간 중앙값을 계산할 최근 키워드 수
+        """
+        self.max_keywords = max_keywords
+        self.max_memory_mb = max_memory_mb
+        self.max_latency = max_latency
+        self.latencies = deque(maxlen=latency_window)
+        self.keywords = 0           # 현재 드라이버로 처리한 키워드 수
+        self.recycles = 0
+        self.last_memory_mb = None
+        self._memory_warned = False
+
+    def record(self, driver, seconds):
+        """
+        키워드 하나의 처리 결과를 기록하고 드라이버를 다시 시작해야 하는지 판단
+
+        Args:
+            driver: 셀레니움 웹드라이버
+            seconds (float): 키워드 처리 시간 (초)
+
+        Returns:
+            str: 다시 시작해야 하는 이유 (필요 없으면 None)
+        """
+        self.keywords += 1
+        self.latencies.append(seconds)
+
+        if self.max_memory_mb:
+            memory_mb = browser_memory_mb(driver)
+            if memory_mb is None:
+                if not self._memory_warned:
+                    logger.warning("브라우저 메모리를 측정할 수 없어 메모리 기준은 사용하지 않습니다.")
+                    self._memory_warned = True
+            else:
+                self.last_memory_mb = memory_mb
+                metrics.BROWSER_MEMORY_MB.set(round(memory_mb, 1))
+                if memory_mb > self.max_memory_mb:
+                    return f"브라우저 메모리 {memory_mb:.0f}MB > {self.max_memory_mb:.0f}MB"
+
+        if self.max_latency and len(self.latencies) == self.latencies.maxlen:
+            latency = statistics.median(self.latencies)
+            if latency > self.max_latency:
+                return f"최근 {len(self.latencies)}개 키워드 처리 시간 중앙값 {latency:.1f}초 > {self.max_latency:.1f}초"
+
+        if self.max_keywords and self.keywords >= self.max_keywords:
+            return f"키워드 {self.keywords}개 처리"
+
+        return None
+
+    def reset(self):
+        """드라이버를 다시 시작한 뒤 기록 초기화"""
+        self.keywords = 0
+        self.latencies.clear()
+        self.recycles += 1
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+키워드 검색 결과 지문 저장소 (변경 감지)
+
+키워드마다 섹션 제목 목록과 인기글 항목 URL로 지문(해시)을 만들어 저장한다.
+다음 실행에서 지문이 같으면 검색 결과 구조가 바뀌지 않은 것이므로
+카페 상세 정보 보강처럼 비용이 큰 후속 작업을 다시 하지 않고 저장해 둔 값을 재사용한다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# 변경 상태 값
+STATUS_NEW = "신규"
+STATUS_CHANGED = "변경"
+STATUS_UNCHANGED = "동일"
+
+
+def compute_fingerprint(section_titles, items):
+    """
+    검색 결과 지문 계산
+
+    Args:
+        section_titles (list): 페이지의 모든 섹션 제목 (순서 포함)
+        items (list): 인기글 컨텐츠 항목 (ContentItem 목록, 섹션과 정규화 URL만 사용)
+
+    Returns:
+        str: 32자리 16진수 지문
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for title in section_titles:
+        digest.update(title.encode('utf-8'))
+        digest.update(b"\x1e")
+    digest.update(b"\x1d")
+    for item in items:
+        digest.update(f"{item.section}\x1f{item.key_url}".encode('utf-8'))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+class FingerprintStore:
+    def __init__(self, path=None):
+        """
+        지문 저장소 초기화
+
+        Args:
+            path (str, optional): 저장할 JSON 파일 경로. 없으면 메모리에서만 유지
+        """
+        self.path = path
+        self.entries = {}   # 정규형 키워드 -> {"fingerprint", "updated", "enrichment"}
+        self.load()
+
+    def load(self):
+        """저장된 지문 불러오기"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+            logger.info(f"검색 결과 지문 로드: {len(self.entries)}개 키워드 ({self.path})")
+        except (OSError, ValueError) as e:
+            logger.warning(f"검색 결과 지문을 불러오지 못했습니다: {e}")
+
+    def save(self):
+        """지문을 파일에 저장 (경로가 없으면 무시)"""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def check(self, keyword, fingerprint):
+        """
+        이전 지문과 비교
+
+        Args:
+            keyword (str): 정규형 키워드
+            fingerprint (str): 이번 검색 결과 지문
+
+        Returns:
+            str: STATUS_NEW, STATUS_CHANGED 또는 STATUS_UNCHANGED
+        """
+        entry = self.entries.get(keyword)
+        if entry is None:
+            return STATUS_NEW
+        return STATUS_UNCHANGED if entry.get("fingerprint") == fingerprint else STATUS_CHANGED
+
+    def get_enrichment(self, keyword):
+        """
+        저장해 둔 보강 정보
+
+        Returns:
+            dict: URL -> [아이디, 조회수, 작성일]
+        """
+        entry = self.entries.get(keyword)
+        return entry.get("enrichment", {}) if entry else {}
+
+    def update(self, keyword, fingerprint, enrichment):
+        """
+        키워드 지문과 보강 정보 저장
+
+        Args:
+            keyword (str): 정규형 키워드
+            fingerprint (str): 검색 결과 지문
+            enrichment (dict): URL -> [아이디, 조회수, 작성일] (보강한 항목만)
+        """
+        self.entries[keyword] = {
+            "fingerprint": fingerprint,
+            "updated": datetime.now().isoformat(timespec='seconds'),
+            "enrichment": enrichment,
+        }
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+검색 결과 HTML 사전 정리 (파싱 전 불필요한 부분 제거)
+
+네이버 검색 결과 페이지는 수백 KB이고 그중 상당 부분이 머리말(헤더, GNB),
+<script>/<style> 블록, 인라인 JSON이라 분석에 전혀 쓰이지 않는다.
+trim_serp_html은 첫 번째 div.api_subject_bx 섹션 앞부분을 잘라 내고
+script/style/주석 블록과 아이콘용 인라인 <svg>를 지운 뒤 파서에 넘긴다.
+BeautifulSoup의 .text는 원래 script/style/주석 내용을 포함하지 않고, 검색 결과의
+svg 아이콘에는 텍스트가 없으므로 추출 결과는 바뀌지 않는다.
+
+SoupStrainer로 섹션 하위 트리만 만드는 방법은 저장된 SERP에서 섹션 14개 중
+5개만 찾았기 때문에(닫는 태그가 맞지 않는 섹션 뒤의 섹션을 놓침) 사용하지 않는다.
+"""
+
+import re
+
+SECTION_CLASS = "api_subject_bx"
+
+_STRIP_PATTERN = re.compile(
+    r"<script\b[^>]*>.*?</script\s*>|<style\b[^>]*>.*?</style\s*>|<svg\b[^>]*>.*?</svg\s*>|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def strip_unused_markup(html):
+    """
+    script/style/svg/주석 블록 제거 (페이지 구조와 관계없이 사용 가능)
+
+    Args:
+        html (str): HTML 문자열
+
+    Returns:
+        str: 블록이 제거된 HTML
+    """
+    return _STRIP_PATTERN.sub("", html)
+
+
+def trim_serp_html(html):
+    """
+    검색 결과 HTML(페이지 전체 또는 섹션)에서 분석에 쓰지 않는 부분 제거
+
+    Args:
+        html (str): 페이지 HTML 또는 섹션 outerHTML
+
+    Returns:
+        str: 첫 번째 섹션 태그부터 시작하고 script/style/svg/주석이 제거된 HTML
+    """
+    first = html.find(SECTION_CLASS)
+    if first > 0:
+        start = html.rfind("<", 0, first)
+        if start > 0:
+            html = html[start:]
+    return strip_unused_markup(html)
+
+
+def parse_serp_sections(page_source):
+    """
+    페이지 HTML에서 섹션(div.api_subject_bx) 요소만 파싱
+
+    Args:
+        page_source (str): 검색 결과 페이지 HTML
+
+    Returns:
+        list: 섹션별 BeautifulSoup 요소 목록 (페이지 순서)
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(trim_serp_html(page_source), 'html.parser')
+    return soup.select(f"div.{SECTION_CLASS}")
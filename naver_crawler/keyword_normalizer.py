@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+키워드 정규화 및 중복 색인
+
+공백, 유니코드 정규화(NFC/NFD 한글), 전각 문자만 다른 키워드를
+같은 검색어로 취급하기 위한 정규형을 만들고, 한 번의 실행에서 이미
+검색한 정규형을 기록하는 색인을 제공한다.
+"""
+
+import re
+import unicodedata
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def canonicalize_keyword(keyword):
+    """
+    키워드의 정규형 반환
+
+    NFKC 정규화로 NFD 한글 자모를 완성형으로 합치고 전각 문자를
+    반각으로 바꾼 뒤, 연속된 공백을 하나로 줄이고 앞뒤 공백을 제거한다.
+
+    Args:
+        keyword (str): 원본 키워드
+
+    Returns:
+        str: 정규화된 키워드
+    """
+    if not isinstance(keyword, str):
+        keyword = str(keyword)
+    keyword = unicodedata.normalize('NFKC', keyword)
+    return _WHITESPACE_RE.sub(' ', keyword).strip()
+
+
+class KeywordIndex:
+    def __init__(self):
+        """
+        정규형 키워드 색인 초기화
+
+        중복 판단은 한 번의 실행 안에서만 한다. 이전 실행의 결과는
+        저장하지 않으므로 같은 키워드도 실행마다 다시 검색한다.
+        """
+        self.seen = set()   # 이번 실행에서 이미 나온 정규형
+
+    def add(self, keyword):
+        """
+        키워드를 색인에 추가
+
+        Args:
+            keyword (str): 원본 키워드
+
+        Returns:
+            tuple: (정규형, 이번 실행에서 처음 나온 정규형인지 여부)
+        """
+        canonical = canonicalize_keyword(keyword)
+        is_new = canonical not in self.seen
+        self.seen.add(canonical)
+        return canonical, is_new
+
+    def __len__(self):
+        return len(self.seen)
+
+
+def count_near_duplicates(keywords):
+    """
+    정규형 기준으로 중복되는 키워드 수 계산
+
+    Args:
+        keywords (list): 키워드 목록
+
+    Returns:
+        int: 다른 키워드와 정규형이 같아 검색을 생략할 수 있는 키워드 수
+    """
+    canonical_forms = set(canonicalize_keyword(keyword) for keyword in keywords)
+    return len(keywords) - len(canonical_forms)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+키워드 파일 스트리밍 리더
+
+대용량 키워드 파일(.csv, .xlsx)을 한 번에 메모리에 올리지 않고
+읽는 즉시 키워드를 하나씩 돌려준다. CSV는 청크 단위로, xlsx는
+openpyxl 읽기 전용 모드의 행 반복으로 처리하므로 메모리 사용량이
+파일 크기와 무관하게 일정하게 유지된다.
+"""
+
+import os
+
+# 열 이름을 지정하지 않았을 때 찾는 기본 키워드 열
+DEFAULT_KEYWORD_COLUMNS = ('keyword', '키워드')
+
+# CSV 청크 크기 (행 수)
+DEFAULT_CHUNK_SIZE = 5000
+
+SUPPORTED_EXTENSIONS = ('.xlsx', '.xls', '.csv')
+
+
+def resolve_keyword_column(columns, column=None):
+    """
+    헤더 목록에서 키워드 열의 위치 결정
+
+    Args:
+        columns (list): 헤더 목록
+        column (str|int, optional): 열 이름 또는 0부터 시작하는 열 번호.
+            지정하지 않으면 'keyword' 또는 '키워드' 열을 찾는다.
+
+    Returns:
+        int: 키워드 열의 위치
+    """
+    columns = [str(c).strip() if c is not None else "" for c in columns]
+
+    if column is None:
+        for name in DEFAULT_KEYWORD_COLUMNS:
+            if name in columns:
+                return columns.index(name)
+        raise ValueError("파일에 'keyword' 또는 '키워드' 열이 없습니다.")
+
+    if isinstance(column, int) or (isinstance(column, str) and column.isdigit() and column not in columns):
+        position = int(column)
+        if 0 <= position < len(columns):
+            return position
+        raise ValueError(f"키워드 열 번호가 범위를 벗어났습니다: {column} (열 개수: {len(columns)})")
+
+    if column in columns:
+        return columns.index(column)
+    raise ValueError(f"파일에 '{column}' 열이 없습니다. 사용 가능한 열: {', '.join(columns)}")
+
+
+def _to_keyword(value):
+    """셀 값을 키워드 문자열로 변환 (빈 값은 None)"""
+    if value is None:
+        return None
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return None
+        if value.is_integer():
+            value = int(value)
+    keyword = value if isinstance(value, str) else str(value)
+    return keyword if keyword.strip() else None
+
+
+def _iter_csv(input_file, column, chunk_size):
+    import pandas as pd
+
+    header = pd.read_csv(input_file, encoding='utf-8', nrows=0).columns.tolist()
+    position = resolve_keyword_column(header, column)
+
+    def generate():
+        reader = pd.read_csv(
+            input_file,
+            encoding='utf-8',
+            usecols=[position],
+            dtype=str,
+            keep_default_na=False,
+            chunksize=chunk_size
+        )
+        with reader:
+            for chunk in reader:
+                for value in chunk.iloc[:, 0]:
+                    keyword = _to_keyword(value)
+                    if keyword is not None:
+                        yield keyword
+
+    return generate()
+
+
+def _iter_xlsx(input_file, column):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(input_file, read_only=True, data_only=True)
+    rows = workbook.active.iter_rows(values_only=True)
+    try:
+        header = next(rows)
+    except StopIteration:
+        workbook.close()
+        raise ValueError("키워드 파일이 비어 있습니다.")
+
+    try:
+        position = resolve_keyword_column(header, column)
+    except ValueError:
+        workbook.close()
+        raise
+
+    def generate():
+        try:
+            for row in rows:
+                if position >= len(row):
+                    continue
+                keyword = _to_keyword(row[position])
+                if keyword is not None:
+                    yield keyword
+        finally:
+            workbook.close()
+
+    return generate()
+
+
+def _iter_xls(input_file, column):
+    # 구형 .xls 형식은 스트리밍 리더가 없으므로 키워드 열만 읽는다
+    import pandas as pd
+
+    header = pd.read_excel(input_file, nrows=0).columns.tolist()
+    position = resolve_keyword_column(header, column)
+    values = pd.read_excel(input_file, usecols=[position], dtype=str).iloc[:, 0]
+
+    def generate():
+        for value in values:
+            keyword = _to_keyword(value)
+            if keyword is not None:
+                yield keyword
+
+    return generate()
+
+
+def iter_keywords(input_file, column=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    키워드 파일에서 키워드를 읽는 즉시 하나씩 반환
+
+    파일 형식과 키워드 열은 호출 시점에 바로 확인하므로 잘못된 입력은
+    크롤링을 시작하기 전에 ValueError로 드러난다.
+
+    Args:
+        input_file (str): 키워드 파일 경로 (.xlsx, .xls, .csv)
+        column (str|int, optional): 키워드 열 이름 또는 열 번호
+        chunk_size (int): CSV를 읽을 때의 청크 크기
+
+    Returns:
+        iterator: 키워드 문자열 이터레이터 (빈 셀은 건너뜀)
+    """
+    file_ext = os.path.splitext(input_file)[1].lower()
+
+    if file_ext == '.csv':
+        return _iter_csv(input_file, column, chunk_size)
+    elif file_ext == '.xlsx':
+        return _iter_xlsx(input_file, column)
+    elif file_ext == '.xls':
+        return _iter_xls(input_file, column)
+
+    raise ValueError("지원하지 않는 파일 형식입니다. .xlsx, .xls, .csv 형식만 지원합니다.")
+
+
+def count_keywords(input_file):
+    """
+    키워드 파일의 행 수를 빠르게 추정 (진행률 표시용)
+
+    CSV는 줄 수를, xlsx는 시트에 기록된 범위를 사용하며 빈 셀도 포함한 값이다.
+    추정할 수 없으면 None을 반환한다.
+
+    Args:
+        input_file (str): 키워드 파일 경로
+
+    Returns:
+        int|None: 헤더를 제외한 행 수
+    """
+    file_ext = os.path.splitext(input_file)[1].lower()
+
+    try:
+        if file_ext == '.csv':
+            lines = 0
+            last = b"\n"
+            with open(input_file, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    lines += block.count(b"\n")
+                    last = block[-1:]
+            if last != b"\n":
+                lines += 1
+            return max(0, lines - 1)
+
+        if file_ext == '.xlsx':
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(input_file, read_only=True)
+            try:
+                max_row = workbook.active.max_row
+            finally:
+                workbook.close()
+            return max(0, max_row - 1) if max_row else None
+    except OSError:
+        return None
+
+    return None
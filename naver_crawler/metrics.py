@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤러 실행 지표 레지스트리
+
+장시간 배치 실행을 모니터링하기 위한 카운터, 게이지, 히스토그램을 모아 두고
+Prometheus 텍스트 형식(textfile collector 파일 또는 로컬 /metrics 엔드포인트)과
+JSON(/metrics.json)으로 내보낸다. 모든 지표는 스레드 안전하다.
+"""
+
+import json
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+logger = logging.getLogger(__name__)
+
+# SERP 로딩 시간 히스토그램 구간 (초)
+DEFAULT_LATENCY_BUCKETS = (0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+
+
+class Counter:
+    def __init__(self, name, description, lock):
+        """단조 증가 카운터"""
+        self.name = name
+        self.description = description
+        self.value = 0
+        self._lock = lock
+
+    def inc(self, amount=1):
+        """값 증가"""
+        with self._lock:
+            self.value += amount
+
+    def render(self):
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} counter",
+            f"{self.name} {self.value}",
+        ]
+
+    def as_dict(self):
+        return self.value
+
+
+class Gauge(Counter):
+    """증가/감소가 가능한 현재 값"""
+
+    def dec(self, amount=1):
+        """값 감소"""
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value):
+        """값 설정"""
+        with self._lock:
+            self.value = value
+
+    def render(self):
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {self.value}",
+        ]
+
+
+class Histogram:
+    def __init__(self, name, description, lock, buckets=DEFAULT_LATENCY_BUCKETS):
+        """누적 구간 히스토그램"""
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = lock
+
+    def observe(self, value):
+        """관측값 기록"""
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            for idx, upper in enumerate(self.buckets):
+                if value <= upper:
+                    self.bucket_counts[idx] += 1
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for upper, count in zip(self.buckets, self.bucket_counts):
+            lines.append(f'{self.name}_bucket{{le="{upper}"}} {count}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {self.sum}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+    def as_dict(self):
+        return {
+            "buckets": {str(upper): count for upper, count in zip(self.buckets, self.bucket_counts)},
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """지표 레지스트리 초기화"""
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _get_or_create(self, cls, name, description, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, description, threading.Lock(), **kwargs)
+                self._metrics[name] = metric
+            return metric
+
+    def counter(self, name, description):
+        """카운터 반환 (없으면 생성)"""
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name, description):
+        """게이지 반환 (없으면 생성)"""
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(self, name, description, buckets=DEFAULT_LATENCY_BUCKETS):
+        """히스토그램 반환 (없으면 생성)"""
+        return self._get_or_create(Histogram, name, description, buckets=buckets)
+
+    def render_prometheus(self):
+        """Prometheus 텍스트 형식으로 변환"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def as_dict(self):
+        """JSON 직렬화용 딕셔너리로 변환"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: metric.as_dict() for metric in metrics}
+
+    def write_textfile(self, path):
+        """
+        Prometheus textfile collector용 파일 저장
+
+        수집기가 쓰는 도중의 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체한다.
+
+        Args:
+            path (str): 저장할 .prom 파일 경로
+        """
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render_prometheus())
+        os.replace(temp_path, path)
+
+
+# 크롤러 기본 레지스트리와 지표
+REGISTRY = MetricsRegistry()
+
+KEYWORDS_DONE = REGISTRY.counter("naver_crawler_keywords_done_total", "분석을 마친 키워드 수")
+KEYWORDS_FAILED = REGISTRY.counter("naver_crawler_keywords_failed_total", "분석 중 오류가 발생한 키워드 수")
+KEYWORDS_RETRIED = REGISTRY.counter("naver_crawler_keywords_retried_total", "다시 시도한 키워드 수")
+KEYWORDS_UNCHANGED = REGISTRY.counter("naver_crawler_keywords_unchanged_total", "검색 결과가 이전 실행과 같은 키워드 수")
+SERP_FETCH_SECONDS = REGISTRY.histogram("naver_crawler_serp_fetch_seconds", "검색 결과 페이지 로딩 시간(초)")
+CAFE_CACHE_HITS = REGISTRY.counter("naver_crawler_cafe_detail_cache_hits_total", "카페 상세 정보 캐시 적중 수")
+CAFE_CACHE_MISSES = REGISTRY.counter("naver_crawler_cafe_detail_cache_misses_total", "카페 상세 정보 캐시 미적중 수")
+DETAIL_FETCHES = REGISTRY.counter("naver_crawler_detail_fetches_total", "블로그/포스트/지식iN 상세 페이지 요청 수")
+DETAIL_FETCH_ERRORS = REGISTRY.counter("naver_crawler_detail_fetch_errors_total", "상세 페이지 요청 실패 수")
+DETAIL_CACHE_HITS = REGISTRY.counter("naver_crawler_detail_cache_hits_total", "상세 페이지 보강 캐시 적중 수")
+DETAIL_FETCH_SECONDS = REGISTRY.histogram("naver_crawler_detail_fetch_seconds", "상세 페이지 요청 시간(초)")
+REDIRECTS_RESOLVED = REGISTRY.counter("naver_crawler_redirects_resolved_total", "최종 주소를 확인한 리다이렉트 URL 수")
+REDIRECT_ERRORS = REGISTRY.counter("naver_crawler_redirect_errors_total", "리다이렉트 확인 실패 수")
+REDIRECT_CACHE_HITS = REGISTRY.counter("naver_crawler_redirect_cache_hits_total", "리다이렉트 캐시 적중 수")
+ACTIVE_DRIVERS = REGISTRY.gauge("naver_crawler_active_drivers", "실행 중인 웹드라이버 수")
+DRIVER_RECYCLES = REGISTRY.counter("naver_crawler_driver_recycles_total", "다시 시작한 웹드라이버 수")
+BROWSER_MEMORY_MB = REGISTRY.gauge("naver_crawler_browser_memory_mb", "브라우저 프로세스 트리 메모리(MB)")
+ROWS_WRITTEN = REGISTRY.counter("naver_crawler_rows_written_total", "결과 파일에 기록한 행 수")
+
+
+class TextfileExporter:
+    def __init__(self, path, interval=15, registry=REGISTRY):
+        """
+        지표를 주기적으로 textfile collector 파일에 기록
+
+        Args:
+            path (str): .prom 파일 경로
+            interval (float): 기록 주기 (초)
+            registry (MetricsRegistry): 내보낼 레지스트리
+        """
+        self.path = path
+        self.interval = interval
+        self.registry = registry
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-textfile", daemon=True)
+
+    def _write(self):
+        try:
+            self.registry.write_textfile(self.path)
+        except OSError as e:
+            logger.warning(f"지표 파일 저장 중 오류 발생: {e}")
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self._write()
+
+    def start(self):
+        """주기적 기록 시작"""
+        self._write()
+        self._thread.start()
+        logger.info(f"지표 파일을 {self.interval}초마다 기록합니다: {self.path}")
+        return self
+
+    def stop(self):
+        """기록 중지 (마지막 값을 한 번 더 기록)"""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._write()
+
+
+class MetricsHTTPServer(ThreadingMixIn, HTTPServer):
+    """요청마다 스레드를 쓰는 지표 HTTP 서버"""
+    daemon_threads = True
+
+
+def serve_metrics(port, host="127.0.0.1", registry=REGISTRY):
+    """
+    로컬 /metrics (Prometheus) 및 /metrics.json 엔드포인트 실행
+
+    Args:
+        port (int): 포트 번호
+        host (str): 바인딩할 주소 (기본값: 로컬 전용)
+        registry (MetricsRegistry): 내보낼 레지스트리
+
+    Returns:
+        MetricsHTTPServer: 실행 중인 서버 (종료 시 shutdown() 호출)
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split('?', 1)[0]
+            if path == "/metrics":
+                body = registry.render_prometheus().encode('utf-8')
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/metrics.json":
+                body = json.dumps(registry.as_dict(), ensure_ascii=False).encode('utf-8')
+                content_type = "application/json; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = MetricsHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    logger.info(f"지표 엔드포인트 실행: http://{host}:{port}/metrics")
+    return server
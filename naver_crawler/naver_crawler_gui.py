@@ -5,30 +5,124 @@ import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 import threading
 import os
-import pandas as pd
 import sys
-import io
 import time
+import queue
+import logging
+import multiprocessing
 import subprocess
 import platform
-from naver_search_crawler_url_analysis import NaverSearchCrawler
+from keyword_normalizer import count_near_duplicates
+from profiling import run_with_profile
+from progress import format_duration
+from crawl_worker import run_crawl_worker
+from records import CONTENT_COLUMNS
 import webbrowser
 import urllib.parse  # URL 인코딩을 위한 모듈 추가
 from datetime import datetime  # 날짜, 시간 처리를 위한 모듈 추가
 
-class RedirectText:
-    def __init__(self, text_widget):
+# 결과 트리뷰 반영 설정
+RESULT_DRAIN_INTERVAL = 50      # 대기열 확인 주기 (밀리초)
+RESULT_TIME_SLICE = 0.015       # 한 번에 트리뷰 갱신에 쓰는 최대 시간 (초)
+DETAIL_PAGE_SIZE = 500          # 상세 결과 한 페이지의 행 수
+WORKER_POLL_INTERVAL = 50       # 작업 프로세스 메시지 확인 주기 (밀리초)
+
+DETAIL_COLUMNS = ("키워드", "섹션", "순번", "컨텐츠_유형", "제목", "게시처", "아이디", "작성일", "조회수", "URL")
+DETAIL_INDEXES = tuple(CONTENT_COLUMNS.index(column) for column in DETAIL_COLUMNS)  # ContentItem 필드 위치
+
+class LogPump:
+    def __init__(self, root, text_widget, log_file=None, max_lines=5000, interval=100, batch_size=1000):
+        """
+        로그 출력 펌프
+        
+        어느 스레드에서든 write()는 큐에 넣기만 하고, Tk 타이머가 주기적으로
+        큐를 비워 새 텍스트만 위젯 끝에 덧붙인다. 위젯에는 최근 max_lines줄만
+        남기고(링 버퍼), 전체 로그는 log_file에 그대로 기록한다.
+        
+        Args:
+            root (tk.Tk): Tk 루트 (after 타이머용)
+            text_widget (tk.Text): 로그를 표시할 텍스트 위젯
+            log_file (str, optional): 전체 로그를 기록할 파일 경로
+            max_lines (int): 위젯에 유지할 최대 줄 수
+            interval (int): 큐를 비우는 주기 (밀리초)
+            batch_size (int): 한 번에 처리할 최대 메시지 수
+        """
+        self.root = root
         self.text_widget = text_widget
-        self.buffer = io.StringIO()
+        self.max_lines = max_lines
+        self.interval = interval
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.log_file = open(log_file, 'a', encoding='utf-8') if log_file else None
+        self._after_id = None
         
     def write(self, string):
-        self.buffer.write(string)
-        self.text_widget.delete(1.0, tk.END)
-        self.text_widget.insert(tk.END, self.buffer.getvalue())
-        self.text_widget.see(tk.END)
+        """출력 텍스트를 큐에 추가 (스레드 안전)"""
+        if string:
+            self.queue.put(string)
         
     def flush(self):
         pass
+    
+    def start(self):
+        """주기적 반영 시작"""
+        self._after_id = self.root.after(self.interval, self._drain)
+    
+    def stop(self):
+        """반영 중지 및 남은 로그 파일 기록"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        chunks = self._take(None)
+        if self.log_file:
+            if chunks:
+                self.log_file.write("".join(chunks))
+            self.log_file.close()
+            self.log_file = None
+    
+    def _take(self, limit):
+        chunks = []
+        while limit is None or len(chunks) < limit:
+            try:
+                chunks.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return chunks
+    
+    def _drain(self):
+        chunks = self._take(self.batch_size)
+        if chunks:
+            text = "".join(chunks)
+            if self.log_file:
+                self.log_file.write(text)
+                self.log_file.flush()
+            
+            self.text_widget.insert(tk.END, text)
+            
+            # 최근 max_lines줄만 유지
+            line_count = int(self.text_widget.index("end-1c").split(".")[0])
+            if line_count > self.max_lines:
+                self.text_widget.delete("1.0", f"{line_count - self.max_lines + 1}.0")
+            
+            self.text_widget.see(tk.END)
+        
+        # 큐가 밀려 있으면 바로 이어서 처리
+        delay = 1 if self.queue.qsize() else self.interval
+        self._after_id = self.root.after(delay, self._drain)
+
+
+class LogPumpHandler(logging.Handler):
+    def __init__(self, pump):
+        """logging 레코드를 LogPump로 보내는 핸들러"""
+        super().__init__()
+        self.pump = pump
+        self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    
+    def emit(self, record):
+        try:
+            self.pump.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
 
 class NaverCrawlerGUI:
     def __init__(self, root):
@@ -131,6 +225,22 @@ class NaverCrawlerGUI:
         self.show_browser_check = ttk.Checkbutton(self.input_frame, text="브라우저 화면 표시", variable=self.show_browser)
         self.show_browser_check.grid(row=5, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
         
+        # 성능 프로파일 저장 여부
+        self.profile_run = tk.BooleanVar(value=False)
+        self.profile_check = ttk.Checkbutton(self.input_frame, text="성능 프로파일 저장 (.prof)", variable=self.profile_run)
+        self.profile_check.grid(row=6, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        
+        # 별도 프로세스 실행 여부 (GUI 응답성 유지, 작업 중 오류가 창을 닫지 않음)
+        self.use_worker_process = tk.BooleanVar(value=True)
+        self.worker_process_check = ttk.Checkbutton(self.input_frame, text="별도 프로세스에서 크롤링 실행", variable=self.use_worker_process)
+        self.worker_process_check.grid(row=7, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        
+        # 광고/단축 URL 최종 주소 확인 여부 (광고 클릭 추적 주소에 요청하므로 기본값은 끔)
+        self.resolve_redirects = tk.BooleanVar(value=False)
+        self.resolve_redirects_check = ttk.Checkbutton(self.input_frame, text="광고 URL 최종 주소 확인 (광고 클릭으로 집계될 수 있음)",
+                                                       variable=self.resolve_redirects)
+        self.resolve_redirects_check.grid(row=8, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        
         # 실행 버튼 프레임
         self.button_frame = ttk.Frame(self.main_frame)
         self.button_frame.pack(fill=tk.X, pady=10)
@@ -138,6 +248,9 @@ class NaverCrawlerGUI:
         self.run_button = ttk.Button(self.button_frame, text="크롤링 시작", command=self.start_crawling)
         self.run_button.pack(side=tk.RIGHT, padx=5)
         
+        self.stop_button = ttk.Button(self.button_frame, text="중지", command=self.stop_crawling, state="disabled")
+        self.stop_button.pack(side=tk.RIGHT, padx=5)
+        
         self.clear_button = ttk.Button(self.button_frame, text="초기화", command=self.clear_fields)
         self.clear_button.pack(side=tk.RIGHT, padx=5)
         
@@ -303,6 +416,17 @@ class NaverCrawlerGUI:
         self.detail_scrollbar.grid(row=0, column=1, sticky="ns")
         self.detail_h_scrollbar.grid(row=1, column=0, sticky="ew")
         
+        # 상세 결과 페이지 이동 (현재 페이지의 행만 트리뷰에 올림)
+        self.detail_page = 0
+        self.detail_page_var = tk.StringVar(value="")
+        self.detail_page_frame = ttk.Frame(self.detail_frame)
+        self.detail_page_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(5, 0))
+        self.detail_next_button = ttk.Button(self.detail_page_frame, text="다음 ▶", command=lambda: self.show_detail_page(self.detail_page + 1))
+        self.detail_next_button.pack(side=tk.RIGHT, padx=5)
+        self.detail_prev_button = ttk.Button(self.detail_page_frame, text="◀ 이전", command=lambda: self.show_detail_page(self.detail_page - 1))
+        self.detail_prev_button.pack(side=tk.RIGHT, padx=5)
+        ttk.Label(self.detail_page_frame, textvariable=self.detail_page_var).pack(side=tk.RIGHT, padx=5)
+        
         # 상세 프레임 그리드 설정
         self.detail_frame.grid_rowconfigure(0, weight=1)
         self.detail_frame.grid_columnconfigure(0, weight=1)
@@ -315,16 +439,34 @@ class NaverCrawlerGUI:
         self.status_bar = ttk.Label(root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # 로그 리다이렉션 설정
-        self.redirect = RedirectText(self.log_text)
-        sys.stdout = self.redirect
-        
-        # 현재 실행 중인 스레드
+        # 진행률 표시줄
+        self.progress_bar = ttk.Progressbar(root, mode="determinate")
+        self.progress_bar.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=(0, 2))
+        self.cancel_event = threading.Event()
+        
+        # 로그 리다이렉션 설정 (print와 logging 모두 같은 펌프로 전달)
+        self.log_pump = LogPump(self.root, self.log_text, log_file=os.path.join(self.results_dir, "naver_crawler_gui.log"))
+        self.log_pump.start()
+        sys.stdout = self.log_pump
+        self.log_handler = LogPumpHandler(self.log_pump)
+        self.log_handler.setLevel(logging.INFO)
+        logging.getLogger().addHandler(self.log_handler)
+        logging.getLogger().setLevel(logging.INFO)
+        
+        # 현재 실행 중인 스레드 또는 작업 프로세스
         self.crawling_thread = None
+        self.crawl_process = None
+        self.worker_queue = None
         
         # 현재 결과 파일 경로
         self.current_result_files = []
         
+        # 크롤링 결과 (메모리) 및 트리뷰 반영 대기열
+        self.result_store = {"summary": [], "sections": [], "contents": []}
+        self.result_queue = queue.Queue()
+        self.update_detail_page_label()
+        self.root.after(RESULT_DRAIN_INTERVAL, self.drain_result_queue)
+        
         # 초기 포커스 설정
         self.keywords_text.focus_set()
         
@@ -433,6 +575,9 @@ class NaverCrawlerGUI:
         self.file_path.set("")
         self.output_path.set("네이버_검색_결과")
         self.show_browser.set(False)
+        self.profile_run.set(False)
+        self.use_worker_process.set(True)
+        self.resolve_redirects.set(False)
         self.log_text.delete(1.0, tk.END)
         self.status_var.set("준비")
         self.disable_result_buttons()
@@ -536,27 +681,6 @@ class NaverCrawlerGUI:
         else:  # Linux
             subprocess.run(["xdg-open", filepath])
     
-    def create_keywords_file(self, keywords):
-        """
-        키워드 목록으로 임시 CSV 파일 생성
-        
-        Args:
-            keywords (list): 키워드 목록
-            
-        Returns:
-            str: 생성된 파일 경로
-        """
-        # 현재 디렉토리에 임시 파일 생성
-        temp_file = "temp_keywords.csv"
-        
-        # 키워드를 데이터프레임으로 변환
-        df = pd.DataFrame({"키워드": keywords})
-        
-        # CSV 파일로 저장
-        df.to_csv(temp_file, index=False, encoding="utf-8")
-        
-        return temp_file
-    
     def process_keywords_text(self):
         """
         텍스트 상자에서 키워드 목록 추출
@@ -589,12 +713,17 @@ class NaverCrawlerGUI:
         if len(unique_keywords) < len(keywords):
             print(f"중복된 키워드 {len(keywords) - len(unique_keywords)}개가 제거되었습니다.")
         
+        # 공백/유니코드/전각 문자만 다른 키워드는 한 번만 검색하고 결과를 공유
+        near_duplicates = count_near_duplicates(unique_keywords)
+        if near_duplicates:
+            print(f"표기만 다른 키워드 {near_duplicates}개는 한 번만 검색하고 결과를 함께 사용합니다.")
+        
         return unique_keywords
     
     def start_crawling(self):
         """크롤링 작업 시작"""
         # 실행 중이면 중단
-        if self.crawling_thread and self.crawling_thread.is_alive():
+        if self.is_crawling():
             print("이미 실행 중인 작업이 있습니다.")
             return
         
@@ -635,34 +764,141 @@ class NaverCrawlerGUI:
         self.status_var.set("크롤링 작업 준비 중...")
         self.log_text.delete(1.0, tk.END)
         
-        # 결과 파일 버튼 비활성화
+        # 결과 파일 버튼 비활성화 및 이전 결과 초기화
         self.disable_result_buttons()
+        self.reset_result_views()
         
-        # 키워드 입력 방식에 따라 처리
-        input_file = file_path
-        
-        # 직접 입력한 키워드가 있으면 임시 파일 생성
-        has_keywords = False
+        # 키워드 입력 방식에 따라 처리 (직접 입력한 키워드는 목록 그대로 전달)
+        keyword_source = file_path
         if keywords:
-            has_keywords = True
             print(f"입력한 키워드 {len(keywords)}개: {', '.join(keywords[:5])}" + ("..." if len(keywords) > 5 else ""))
-            input_file = self.create_keywords_file(keywords)
-            print(f"임시 키워드 파일 생성: {input_file}")
+            keyword_source = keywords
         
         # 브라우저 표시 여부
         show_browser = self.show_browser.get()
+        profile_run = self.profile_run.get()
+        resolve_redirects = self.resolve_redirects.get()
+        
+        # 진행률 초기화
+        self.progress_bar.configure(value=0, maximum=max(1, len(keywords)))
         
         # UI 요소 비활성화
         self.disable_ui()
         
+        if self.use_worker_process.get():
+            # 별도 프로세스에서 크롤링 작업 실행 (메시지 큐로 로그/진행률/결과 수신)
+            context = multiprocessing.get_context("spawn")
+            self.cancel_event = context.Event()
+            self.worker_queue = context.Queue()
+            self.crawl_process = context.Process(
+                target=run_crawl_worker,
+                args=(self.worker_queue, self.cancel_event, keyword_source, output_path_with_timestamp, show_browser, profile_run,
+                      resolve_redirects),
+                daemon=True
+            )
+            self.crawl_process.start()
+            self.status_var.set("크롤링 작업 실행 중... (별도 프로세스)")
+            self.root.after(WORKER_POLL_INTERVAL, lambda: self.poll_worker_queue(output_path_with_timestamp))
+            return
+        
         # 별도 스레드에서 크롤링 작업 실행
+        self.cancel_event = threading.Event()
         self.crawling_thread = threading.Thread(
             target=self.run_crawler,
-            args=(input_file, output_path_with_timestamp, show_browser, has_keywords)
+            args=(keyword_source, output_path_with_timestamp, show_browser, profile_run, resolve_redirects)
         )
         self.crawling_thread.daemon = True
         self.crawling_thread.start()
     
+    def is_crawling(self):
+        """크롤링 스레드 또는 작업 프로세스가 실행 중인지 여부"""
+        if self.crawling_thread and self.crawling_thread.is_alive():
+            return True
+        return bool(self.crawl_process and self.crawl_process.is_alive())
+    
+    def poll_worker_queue(self, output_path):
+        """작업 프로세스 메시지를 정해진 시간만큼 처리"""
+        finished = False
+        error = None
+        deadline = time.perf_counter() + RESULT_TIME_SLICE
+        
+        while time.perf_counter() < deadline:
+            try:
+                kind, payload = self.worker_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == "log":
+                self.log_pump.write(payload)
+            elif kind == "progress":
+                self.show_progress(payload)
+            elif kind == "result":
+                self.result_queue.put(([payload[0]], [payload[1]], payload[2]))
+            elif kind == "done":
+                finished = True
+                break
+            elif kind == "error":
+                error = payload
+                break
+        
+        # 메시지 없이 프로세스가 끝났다면 비정상 종료
+        if not finished and error is None and not self.crawl_process.is_alive() and self.worker_queue.empty():
+            error = f"작업 프로세스가 비정상 종료되었습니다 (종료 코드: {self.crawl_process.exitcode})"
+        
+        if error is not None:
+            print(f"\n오류 발생:\n{error}")
+            self.status_var.set("오류: 크롤링 작업 프로세스 실패")
+            self.cleanup_worker()
+            self.enable_ui()
+        elif finished:
+            self.cleanup_worker()
+            self.finish_crawl(output_path)
+            self.enable_ui()
+        else:
+            self.root.after(WORKER_POLL_INTERVAL, lambda: self.poll_worker_queue(output_path))
+    
+    def cleanup_worker(self):
+        """작업 프로세스 정리"""
+        if self.crawl_process is not None:
+            self.crawl_process.join(timeout=5)
+            if self.crawl_process.is_alive():
+                self.crawl_process.terminate()
+            self.crawl_process = None
+    
+    def stop_crawling(self):
+        """현재 키워드까지만 처리하고 크롤링 중지"""
+        if self.is_crawling():
+            self.cancel_event.set()
+            self.stop_button.configure(state="disabled")
+            self.status_var.set("중지 요청됨: 현재 키워드를 마친 뒤 결과를 저장합니다...")
+            print("\n중지 요청: 현재 키워드를 마친 뒤 지금까지의 결과를 저장합니다.")
+    
+    def on_crawl_progress(self, snapshot):
+        """크롤러 스레드에서 진행 상황 전달"""
+        self.root.after(0, lambda: self.show_progress(snapshot))
+    
+    def show_progress(self, snapshot):
+        """진행률 표시줄과 상태 표시줄(ETA) 갱신"""
+        done = snapshot["done"]
+        total = snapshot["total"]
+        
+        if total:
+            self.progress_bar.configure(maximum=max(total, done), value=done)
+            position = f"{done}/{total} ({done / max(total, 1):.0%})"
+        else:
+            self.progress_bar.configure(maximum=done + 1, value=done)
+            position = f"{done}개 완료"
+        
+        if self.cancel_event.is_set():
+            message = f"중지 중... {position} · '{snapshot['keyword']}' 마무리"
+        else:
+            message = f"진행 {position} · '{snapshot['keyword']}' [{snapshot['stage']}]"
+            if snapshot["rate"] > 0:
+                message += f" · 분당 {snapshot['rate']:.1f}개"
+            if total:
+                message += f" · 남은 시간 {format_duration(snapshot['eta'])}"
+        self.status_var.set(message)
+    
     def on_summary_double_click(self, event):
         """요약 트리뷰 더블 클릭 시 브라우저에서 URL 열기"""
         try:
@@ -709,154 +945,126 @@ class NaverCrawlerGUI:
         except (IndexError, Exception) as e:
             pass
     
-    def update_result_trees(self, all_results, content_results, section_results):
-        """결과 트리뷰 업데이트"""
-        # 기존 항목 삭제
+    def reset_result_views(self):
+        """결과 트리뷰와 메모리 결과 초기화"""
         self.summary_tree.delete(*self.summary_tree.get_children())
         self.detail_tree.delete(*self.detail_tree.get_children())
         self.section_tree.delete(*self.section_tree.get_children())
-        
-        # 데이터가 없으면 탭 전환 없이 종료
-        if not all_results and not content_results and not section_results:
-            return
-        
-        # 요약 트리뷰 업데이트
-        for i, result in enumerate(all_results):
-            self.summary_tree.insert("", i, values=(
-                result.get("키워드", ""),
-                result.get("검색_URL", ""),
-                "있음" if result.get("인기글_탭_존재") else "없음",
-                result.get("인기글_탭_제목", ""),
-                result.get("첫번째_섹션", "")
+        self.result_store = {"summary": [], "sections": [], "contents": []}
+        self.result_queue = queue.Queue()
+        self.detail_page = 0
+        self.update_detail_page_label()
+    
+    def on_crawl_result(self, summary_row, section_row, content_rows):
+        """크롤러 스레드에서 키워드 결과 전달 (트리뷰 반영은 Tk 타이머에서 처리)"""
+        self.result_queue.put(([summary_row], [section_row], content_rows))
+    
+    def drain_result_queue(self):
+        """대기 중인 결과를 정해진 시간만큼만 트리뷰에 반영"""
+        deadline = time.perf_counter() + RESULT_TIME_SLICE
+        while time.perf_counter() < deadline:
+            try:
+                summary_rows, section_rows, content_rows = self.result_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.add_result_rows(summary_rows, section_rows, content_rows)
+        
+        delay = 1 if self.result_queue.qsize() else RESULT_DRAIN_INTERVAL
+        self.root.after(delay, self.drain_result_queue)
+    
+    def add_result_rows(self, summary_rows, section_rows, content_rows):
+        """결과 레코드를 메모리에 추가하고 트리뷰에 반영"""
+        for result in summary_rows:
+            self.result_store["summary"].append(result)
+            self.summary_tree.insert("", tk.END, values=(
+                result.keyword,
+                result.search_url,
+                "있음" if result.popular_exists else "없음",
+                result.popular_titles,
+                result.first_section
             ))
         
-        # 섹션 트리뷰 업데이트
-        for i, section_row in enumerate(section_results):
-            # 섹션 정보 행 구성
-            values = [section_row.get("키워드", "")]
+        for section_row in section_rows:
+            self.result_store["sections"].append(section_row)
+            # 섹션 정보 행 구성 (키워드 + 1~10순위)
+            self.section_tree.insert("", tk.END, values=section_row.as_row())
+        
+        if content_rows:
+            contents = self.result_store["contents"]
+            start = len(contents)
+            contents.extend(content_rows)
             
-            # 각 순위별 섹션 추가
-            for rank in range(1, 11):
-                rank_key = f"{rank}순위"
-                values.append(section_row.get(rank_key, ""))
+            # 현재 보고 있는 페이지 범위에 들어오는 행만 트리뷰에 추가
+            page_start = self.detail_page * DETAIL_PAGE_SIZE
+            page_end = page_start + DETAIL_PAGE_SIZE
+            for content in contents[max(start, page_start):min(len(contents), page_end)]:
+                self.detail_tree.insert("", tk.END, values=self.detail_values(content))
             
-            self.section_tree.insert("", i, values=values)
-        
-        # 상세 트리뷰 업데이트
-        for i, content in enumerate(content_results):
-            self.detail_tree.insert("", i, values=(
-                content.get("키워드", ""),
-                content.get("섹션", ""),
-                content.get("순번", ""),
-                content.get("컨텐츠_유형", ""),
-                content.get("제목", ""),
-                content.get("게시처", ""),
-                content.get("아이디", ""),
-                content.get("작성일", ""),
-                content.get("조회수", ""),
-                content.get("URL", "")
-            ))
+            self.update_detail_page_label()
+    
+    def detail_values(self, content):
+        """상세 트리뷰 행 값 구성"""
+        return tuple("" if content[index] is None else content[index] for index in DETAIL_INDEXES)
+    
+    def show_detail_page(self, page):
+        """상세 결과의 지정한 페이지만 트리뷰에 표시"""
+        contents = self.result_store["contents"]
+        page_count = max(1, (len(contents) + DETAIL_PAGE_SIZE - 1) // DETAIL_PAGE_SIZE)
+        page = min(max(page, 0), page_count - 1)
         
-        # 탭 전환하여 결과 보여주기
-        if section_results:
+        self.detail_page = page
+        self.detail_tree.delete(*self.detail_tree.get_children())
+        start = page * DETAIL_PAGE_SIZE
+        for content in contents[start:start + DETAIL_PAGE_SIZE]:
+            self.detail_tree.insert("", tk.END, values=self.detail_values(content))
+        
+        self.update_detail_page_label()
+    
+    def update_detail_page_label(self):
+        """상세 결과 페이지 표시 갱신"""
+        total = len(self.result_store["contents"])
+        page_count = max(1, (total + DETAIL_PAGE_SIZE - 1) // DETAIL_PAGE_SIZE)
+        self.detail_page_var.set(f"{self.detail_page + 1} / {page_count} 페이지 (총 {total}행)")
+        self.detail_prev_button.configure(state="normal" if self.detail_page > 0 else "disabled")
+        self.detail_next_button.configure(state="normal" if self.detail_page < page_count - 1 else "disabled")
+    
+    def select_result_tab(self):
+        """결과가 있는 탭으로 전환"""
+        if self.result_store["sections"]:
             self.tab_control.select(self.section_tab)
-        elif content_results:
+        elif self.result_store["contents"]:
             self.tab_control.select(self.detail_tab)
-        else:
+        elif self.result_store["summary"]:
             self.tab_control.select(self.summary_tab)
     
-    def load_results_from_files(self):
-        """결과 파일에서 데이터 로드하여 트리뷰에 표시"""
-        try:
-            all_results = []
-            content_results = []
-            section_results = []
-            
-            # 현재 결과 파일이 있는지 확인
-            if not self.current_result_files:
-                print("먼저 크롤링을 실행하여 결과 파일을 생성해주세요.")
-                return
-            
-            # 요약 CSV 파일 경로
-            summary_file = next((f for f in self.current_result_files if f.endswith("_summary.csv")), None)
-            
-            # 컨텐츠 CSV 파일 경로
-            contents_file = next((f for f in self.current_result_files if f.endswith("_contents.csv")), None)
-            
-            # 섹션 정보 CSV 파일 경로
-            sections_file = next((f for f in self.current_result_files if f.endswith("_sections.csv")), None)
-            
-            # 요약 데이터 로드
-            if summary_file and os.path.exists(summary_file):
-                try:
-                    summary_df = pd.read_csv(summary_file, encoding='utf-8-sig')
-                    all_results = summary_df.to_dict('records')
-                    print(f"요약 데이터 {len(all_results)}개 로드 완료")
-                except Exception as e:
-                    print(f"요약 데이터 로드 중 오류: {str(e)}")
-            
-            # 컨텐츠 데이터 로드
-            if contents_file and os.path.exists(contents_file):
-                try:
-                    contents_df = pd.read_csv(contents_file, encoding='utf-8-sig')
-                    content_results = contents_df.to_dict('records')
-                    print(f"컨텐츠 데이터 {len(content_results)}개 로드 완료")
-                except Exception as e:
-                    print(f"컨텐츠 데이터 로드 중 오류: {str(e)}")
-            
-            # 섹션 데이터 로드
-            if sections_file and os.path.exists(sections_file):
-                try:
-                    sections_df = pd.read_csv(sections_file, encoding='utf-8-sig')
-                    section_results = sections_df.to_dict('records')
-                    print(f"섹션 데이터 {len(section_results)}개 로드 완료")
-                except Exception as e:
-                    print(f"섹션 데이터 로드 중 오류: {str(e)}")
-            
-            # 트리뷰 업데이트
-            self.update_result_trees(all_results, content_results, section_results)
-            
-        except Exception as e:
-            print(f"결과 파일 로드 중 오류 발생: {str(e)}")
-    
-    def run_crawler(self, input_file, output_path, show_browser, has_keywords):
+    def run_crawler(self, keyword_source, output_path, show_browser, profile_run=False, resolve_redirects=False):
         """별도 스레드에서 크롤러 실행"""
         try:
             # 상태 업데이트
             self.update_status("크롤링 작업 실행 중...")
             
-            # 크롤러 초기화 및 실행
-            crawler = NaverSearchCrawler(headless=not show_browser)
-            crawler.process_keyword_list(input_file, output_path)
-            
-            # 작업 완료 후 임시 파일 삭제
-            if has_keywords and input_file == "temp_keywords.csv":
-                if os.path.exists(input_file):
-                    os.remove(input_file)
-                    print("임시 키워드 파일 삭제")
-            
-            # 결과 파일 경로 출력
-            self.current_result_files = [
-                f"{output_path}.xlsx",
-                f"{output_path}_summary.csv",
-                f"{output_path}_sections.csv",
-                f"{output_path}_contents.csv"
-            ]
-            
-            print("\n크롤링 작업이 완료되었습니다.")
-            print("결과 파일:")
-            for file in self.current_result_files:
-                if os.path.exists(file):
-                    print(f"- {os.path.abspath(file)}")
+            # 크롤러 모듈(selenium, pandas 등)은 작업을 시작할 때 불러온다
+            from naver_search_crawler_url_analysis import NaverSearchCrawler, setup_logging
+            setup_logging(console=False)
             
-            # 결과 파일 버튼 활성화
-            self.root.after(0, self.enable_result_buttons)
+            # 크롤러 초기화 및 실행
+            def crawl():
+                crawler = NaverSearchCrawler(headless=not show_browser, resolve_redirects=resolve_redirects)
+                crawler.process_keyword_list(
+                    keyword_source,
+                    output_path,
+                    on_result=self.on_crawl_result,
+                    progress_callback=self.on_crawl_progress,
+                    cancel_event=self.cancel_event
+                )
             
-            # 결과 데이터 로드 및 표시
-            self.root.after(0, self.load_results_from_files)
+            if profile_run:
+                run_with_profile(crawl, output_path)
+                print(f"성능 프로파일 저장: {output_path}.prof, {output_path}_profile.txt")
+            else:
+                crawl()
             
-            # 완료 상태로 업데이트
-            self.update_status("크롤링 완료")
+            self.finish_crawl(output_path)
             
         except Exception as e:
             # 오류 발생 시 메시지 출력
@@ -867,6 +1075,35 @@ class NaverCrawlerGUI:
             # UI 요소 다시 활성화
             self.enable_ui()
     
+    def finish_crawl(self, output_path):
+        """크롤링 완료 후 처리 (결과 파일 안내, 버튼 활성화)"""
+        # 결과 파일 경로 출력
+        self.current_result_files = [
+            f"{output_path}.xlsx",
+            f"{output_path}_summary.csv",
+            f"{output_path}_sections.csv",
+            f"{output_path}_contents.csv",
+            f"{output_path}_timings.csv"
+        ]
+        
+        print("\n크롤링 작업이 완료되었습니다.")
+        print("결과 파일:")
+        for file in self.current_result_files:
+            if os.path.exists(file):
+                print(f"- {os.path.abspath(file)}")
+        
+        # 결과 파일 버튼 활성화
+        self.root.after(0, self.enable_result_buttons)
+        
+        # 결과는 키워드마다 이미 트리뷰에 반영되었으므로 탭만 전환
+        self.root.after(0, self.select_result_tab)
+        
+        # 완료 상태로 업데이트
+        if self.cancel_event.is_set():
+            self.update_status("크롤링 중지됨 (중지 전까지의 결과 저장 완료)")
+        else:
+            self.update_status("크롤링 완료")
+    
     def update_status(self, message):
         """스레드 안전하게 상태 메시지 업데이트"""
         self.root.after(0, lambda: self.status_var.set(message))
@@ -880,7 +1117,11 @@ class NaverCrawlerGUI:
             self.browse_button.configure(state="disabled"),
             self.output_browse_button.configure(state="disabled"),
             self.run_button.configure(state="disabled"),
-            self.show_browser_check.configure(state="disabled")
+            self.stop_button.configure(state="normal"),
+            self.show_browser_check.configure(state="disabled"),
+            self.profile_check.configure(state="disabled"),
+            self.worker_process_check.configure(state="disabled"),
+            self.resolve_redirects_check.configure(state="disabled")
         ])
     
     def enable_ui(self):
@@ -892,22 +1133,33 @@ class NaverCrawlerGUI:
             self.browse_button.configure(state="normal"),
             self.output_browse_button.configure(state="normal"),
             self.run_button.configure(state="normal"),
-            self.show_browser_check.configure(state="normal")
+            self.stop_button.configure(state="disabled"),
+            self.show_browser_check.configure(state="normal"),
+            self.profile_check.configure(state="normal"),
+            self.worker_process_check.configure(state="normal"),
+            self.resolve_redirects_check.configure(state="normal")
         ])
     
     def on_closing(self):
         """프로그램 종료 시 처리"""
-        # 원래 stdout으로 복원
-        sys.stdout = sys.__stdout__
+        # 실행 중인 작업이 있으면 경고
+        if self.is_crawling():
+            if not messagebox.askokcancel("종료 확인", "크롤링 작업이 실행 중입니다. 정말 종료하시겠습니까?"):
+                return
         
-        # 실행 중인 스레드가 있으면 경고
-        if self.crawling_thread and self.crawling_thread.is_alive():
-            if messagebox.askokcancel("종료 확인", "크롤링 작업이 실행 중입니다. 정말 종료하시겠습니까?"):
-                self.root.destroy()
-        else:
-            self.root.destroy()
+        # 작업 프로세스가 남아 있으면 종료
+        if self.crawl_process is not None and self.crawl_process.is_alive():
+            self.crawl_process.terminate()
+        
+        # 원래 stdout으로 복원하고 남은 로그 기록
+        sys.stdout = sys.__stdout__
+        logging.getLogger().removeHandler(self.log_handler)
+        self.log_pump.stop()
+        self.root.destroy()
 
 def main():
+    # 작업 프로세스(spawn) 및 패키징된 실행 파일 지원
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = NaverCrawlerGUI(root)
     root.mainloop()
@@ -12,6 +12,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
+from html_trim import strip_unused_markup
 import re
 import logging
 import argparse
@@ -103,7 +104,7 @@ class NaverSearchCrawler:
         try:
             # 현재 페이지의 HTML 가져오기
             html = self.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(strip_unused_markup(html), 'html.parser')
             
             # 컨텐츠 항목들 찾기 (여러 형태의 컨텐츠 선택자 시도)
             content_items = soup.select("li.bx")
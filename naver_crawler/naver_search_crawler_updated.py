@@ -12,6 +12,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
+from html_trim import trim_serp_html
+from serp_script import segment_items
 import re
 import logging
 import argparse
@@ -117,14 +119,10 @@ class NaverSearchCrawler:
         try:
             # 섹션 HTML 가져오기
             section_html = section.get_attribute('outerHTML')
-            soup = BeautifulSoup(section_html, 'html.parser')
+            soup = BeautifulSoup(trim_serp_html(section_html), 'html.parser')
             
-            # 콘텐츠 항목 찾기 시도
-            content_items = soup.select("li, div.content_item")
-            
-            if not content_items:
-                # 다른 선택자 시도
-                content_items = soup.select("div.brand_area, div.content_area")
+            # 최상위 콘텐츠 카드만 최대 20개 찾기 (카드 안의 태그 목록 li 등은 제외)
+            content_items = segment_items(soup, 20)
             
             if not content_items:
                 logger.warning("섹션에서 콘텐츠 항목을 찾을 수 없습니다.")
@@ -2,45 +2,200 @@
 # -*- coding: utf-8 -*-
 
 import time
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 import re
 import logging
 import argparse
 import os
 import urllib.parse
+from collections import OrderedDict
+from keyword_source import iter_keywords, count_keywords
+from keyword_normalizer import KeywordIndex, canonicalize_keyword
+from fingerprint_store import FingerprintStore, STATUS_UNCHANGED, compute_fingerprint
+from perf_timing import StageTimer
+from progress import CrawlProgress
+import metrics
+from profiling import PROFILERS, run_with_profile
+from records import KeywordResult, SummaryRecord, SectionRankRecord, ContentItem, intern_text
+from result_sinks import CsvSink, ExcelSink, CallbackSink, close_sinks
+from serp_script import (SECTION_SELECTOR, SECTION_TITLE_SELECTOR,
+                         SerpSection, extract_serp, item_fields_from_html, segment_items)
+from tab_pool import TabPool
+from html_trim import parse_serp_sections, trim_serp_html
+from driver_watchdog import DriverWatchdog
+from content_enrichers import DetailFetcher
+from url_canonical import RedirectCache, UrlCanonicalizer
+
+# pandas, selenium, webdriver_manager, BeautifulSoup은 import 시간이 길어
+# 실제로 사용하는 메서드 안에서 불러온다 (GUI/CLI 시작 시간 단축)
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('naver_crawler.log')
-    ]
-)
 logger = logging.getLogger(__name__)
 
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# 섹션당 추출하는 최대 콘텐츠 수
+MAX_ITEMS_PER_SECTION = 20
+
+# 표기만 다른 중복 키워드에 재사용하려고 보관하는 최근 결과 수 (넘으면 오래된 결과부터 버리고 다시 검색)
+DUPLICATE_RESULT_CACHE_SIZE = 1000
+
+# 검색 후 페이지 로딩 대기 시간 (초)
+SERP_LOAD_WAIT = 5
+
+# 검색 결과 추출 방식 (serp_script 참고)
+EXTRACTION_MODES = ("script", "webdriver")
+
+# 섹션 필터를 지정하지 않았을 때 추출하는 섹션 (제목에 포함된 문자열)
+POPULAR_SECTION_KEYWORDS = ("인기글", "브랜드 콘텐츠")
+
+
+def build_search_url(keyword):
+    """키워드의 네이버 검색 URL"""
+    return f"https://search.naver.com/search.naver?query={urllib.parse.quote(keyword)}"
+
+
+def section_matches(section_title, section_filters=None):
+    """
+    섹션 제목이 섹션 필터와 일치하는지 확인
+    
+    Args:
+        section_title (str): 섹션 제목
+        section_filters (list, optional): 제목에 포함되어야 하는 문자열 목록 (대소문자 무시).
+            지정하지 않으면 인기글/브랜드 콘텐츠 섹션과 일치한다.
+    
+    Returns:
+        bool: 일치 여부
+    """
+    if not section_title:
+        return False
+    if not section_filters:
+        return any(keyword in section_title for keyword in POPULAR_SECTION_KEYWORDS)
+    title = section_title.lower()
+    return any(f.strip().lower() in title for f in section_filters if f and f.strip())
+
+
+def section_title_terms(section_filters=None):
+    """
+    section_matches와 같은 규칙의 제목 비교 조건 (검색 결과 추출 스크립트에 전달)
+    
+    Args:
+        section_filters (list, optional): 섹션 제목 필터 (지정하지 않으면 인기글/브랜드 콘텐츠 섹션)
+    
+    Returns:
+        tuple: (제목에 포함될 문자열 목록, 대소문자 무시 여부)
+    """
+    if not section_filters:
+        return list(POPULAR_SECTION_KEYWORDS), False
+    return [f.strip().lower() for f in section_filters if f and f.strip()], True
+
+
+def normalize_ranks(ranks=None):
+    """
+    추출할 순위 목록 정리
+    
+    Args:
+        ranks (int|list, optional): 순위 목록 또는 최대 순위. 지정하지 않으면 전체 순위.
+    
+    Returns:
+        frozenset|None: 1 이상의 순위 집합 (전체 순위면 None)
+    """
+    if ranks is None:
+        return None
+    if isinstance(ranks, int):
+        ranks = range(1, ranks + 1)
+    normalized = frozenset(int(rank) for rank in ranks if int(rank) >= 1)
+    if not normalized:
+        raise ValueError("추출할 순위가 없습니다. 1 이상의 순위를 지정하세요.")
+    return normalized
+
+
+def rank_limit(ranks=None):
+    """
+    섹션에서 확인할 최대 항목 수 (가장 낮은 요청 순위, 최대 MAX_ITEMS_PER_SECTION)
+    
+    Args:
+        ranks (frozenset, optional): normalize_ranks로 정리한 순위 집합
+    
+    Returns:
+        int: 최대 항목 수
+    """
+    return min(max(ranks), MAX_ITEMS_PER_SECTION) if ranks else MAX_ITEMS_PER_SECTION
+
+
+def setup_logging(log_file='naver_crawler.log', console=True):
+    """
+    크롤러 로깅 설정 (import 시점이 아니라 실행 시점에 호출)
+    
+    여러 번 호출해도 같은 로그 파일 핸들러를 중복으로 추가하지 않는다.
+    
+    Args:
+        log_file (str): 로그 파일 경로 (None이면 파일에 기록하지 않음)
+        console (bool): 콘솔(stderr)에도 출력할지 여부
+    """
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    formatter = logging.Formatter(LOG_FORMAT)
+    
+    if log_file:
+        log_path = os.path.abspath(log_file)
+        if not any(isinstance(h, logging.FileHandler) and h.baseFilename == log_path for h in root.handlers):
+            file_handler = logging.FileHandler(log_path)
+            file_handler.setFormatter(formatter)
+            root.addHandler(file_handler)
+    
+    if console and not any(type(h) is logging.StreamHandler for h in root.handlers):
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        root.addHandler(stream_handler)
+
+
 class NaverSearchCrawler:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, start_driver=True, enrich_cafe=True, extraction="webdriver", tabs=1,
+                 watchdog=None, enrich_details=True, detail_workers=4, detail_timeout=5.0,
+                 resolve_redirects=False, redirect_cache=None):
         """
         네이버 검색 결과 크롤러 초기화
         
         Args:
             headless (bool): 브라우저를 헤드리스 모드로 실행할지 여부
+            start_driver (bool): 웹드라이버를 실행할지 여부 (False면 저장된 HTML 분석만 가능)
+            enrich_cafe (bool): 네이버 카페 글에 접속해 닉네임과 조회수를 보강할지 여부
+            extraction (str): 검색 결과 추출 방식 ("webdriver": 섹션마다 웹드라이버 요소와 outerHTML로 추출,
+                "script": execute_script 한 번으로 추출. benchmark.py --check-script로 저장된 SERP에서
+                결과가 같은지 확인한 뒤 사용)
+            tabs (int): 한 Chrome에서 검색 결과를 동시에 로딩할 탭 수 (analyze_keywords에서 사용)
+            watchdog (DriverWatchdog, optional): 드라이버 재시작 기준 (없으면 드라이버가 멈췄을 때만 다시 시작)
+            enrich_details (bool): 작성일/조회수가 없는 블로그, 포스트, 지식iN 글의 상세 페이지를 HTTP로 받아 보강할지 여부
+            detail_workers (int): 상세 페이지 최대 동시 요청 수
+            detail_timeout (float): 상세 페이지 연결/읽기 시간 제한 (초)
+            resolve_redirects (bool): 쿼리에 최종 주소가 없는 광고/단축 URL에 HEAD 요청을 보내 정규화_URL을 확인할지 여부.
+                광고 클릭 추적 주소에 요청하면 광고주에게 클릭으로 집계될 수 있으므로 기본값은 False
+                (쿼리의 최종 주소와 추적 파라미터 정리만 사용)
+            redirect_cache (str, optional): 리다이렉트 결과를 저장할 JSON 파일 경로 (여러 실행에서 재사용)
         """
-        self.setup_driver(headless)
+        if extraction not in EXTRACTION_MODES:
+            raise ValueError(f"지원하지 않는 추출 방식입니다: {extraction}")
+        self.timer = StageTimer()
+        self.extraction = extraction
+        self.tabs = max(1, tabs)
+        self.tab_pool = None
+        self.headless = headless
+        self.watchdog = (watchdog or DriverWatchdog()) if start_driver else None
+        self.cafe_info_cache = {}  # (카페 ID, 글 번호) -> (닉네임, 조회수)
+        self.enrich_cafe = enrich_cafe and start_driver
+        self.detail_fetcher = DetailFetcher(detail_workers, detail_timeout) if enrich_details and start_driver else None
+        self.url_canonicalizer = UrlCanonicalizer(RedirectCache(redirect_cache), resolve=resolve_redirects and start_driver,
+                                                  timeout=detail_timeout)
+        if start_driver:
+            self.setup_driver(headless)
         
     def setup_driver(self, headless):
         """셀레니움 웹드라이버 설정"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.support.ui import WebDriverWait
+        from webdriver_manager.chrome import ChromeDriverManager
+        
         chrome_options = Options()
         if headless:
             chrome_options.add_argument("--headless")
@@ -52,7 +207,87 @@ class NaverSearchCrawler:
         service = Service(ChromeDriverManager().install())
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         self.wait = WebDriverWait(self.driver, 10)
+        metrics.ACTIVE_DRIVERS.inc()
         
+    def driver_alive(self):
+        """웹드라이버가 명령에 응답하는지 확인"""
+        try:
+            self.driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+    
+    def recycle_driver(self, reason):
+        """
+        웹드라이버를 다시 시작 (쿠키와 탭 풀의 로딩 순서 유지)
+        
+        Args:
+            reason (str): 다시 시작하는 이유 (로그에 기록)
+        """
+        logger.warning(f"웹드라이버를 다시 시작합니다: {reason}")
+        
+        cookies = []
+        try:
+            cookies = self.driver.get_cookies()
+        except Exception as e:
+            logger.warning(f"쿠키를 가져오지 못했습니다: {e}")
+        
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"이전 웹드라이버 종료 중 오류 발생: {e}")
+        del self.driver
+        metrics.ACTIVE_DRIVERS.dec()
+        
+        self.setup_driver(self.headless)
+        if cookies:
+            # 쿠키는 같은 도메인 페이지에서만 추가할 수 있음
+            self.driver.get("https://search.naver.com/")
+            for cookie in cookies:
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    continue
+        
+        if self.tab_pool is not None:
+            self.tab_pool.rebind(self.driver)
+        
+        metrics.DRIVER_RECYCLES.inc()
+        if self.watchdog is not None:
+            self.watchdog.reset()
+        logger.info(f"웹드라이버를 다시 시작했습니다 (쿠키 {len(cookies)}개 복원)")
+    
+    def check_driver(self, keyword, result, started, fingerprint_store=None):
+        """
+        키워드 처리 후 드라이버 상태 확인
+        
+        드라이버가 응답하지 않으면 다시 시작하고 키워드를 한 번 더 분석하며,
+        감시 기준(키워드 수, 메모리, 지연 시간)을 넘으면 다음 키워드 전에 다시 시작한다.
+        
+        Args:
+            keyword (str): 방금 분석한 검색어
+            result (dict): analyze_search_result 결과
+            started (float): 분석 시작 시각 (time.perf_counter)
+            fingerprint_store (FingerprintStore, optional): 다시 분석할 때 사용할 지문 저장소
+        
+        Returns:
+            dict: 분석 결과 (다시 분석했으면 새 결과)
+        """
+        if not self.driver_alive():
+            self.recycle_driver("웹드라이버 응답 없음")
+            metrics.KEYWORDS_RETRIED.inc()
+            logger.info(f"'{keyword}' 키워드를 다시 분석합니다.")
+            result = self.analyze_search_result(keyword, fingerprint_store)
+            if not self.driver_alive():
+                # 다시 분석해도 멈추면 다음 키워드를 위해 한 번 더 시작하고 넘어감
+                self.recycle_driver("웹드라이버 응답 없음")
+            return result
+        
+        reason = self.watchdog.record(self.driver, time.perf_counter() - started)
+        if reason:
+            self.recycle_driver(reason)
+        return result
+    
     def search_keyword(self, keyword):
         """
         네이버에서 키워드 검색
@@ -60,20 +295,41 @@ class NaverSearchCrawler:
         Args:
             keyword (str): 검색할 키워드
         """
-        encoded_keyword = urllib.parse.quote(keyword)
-        url = f"https://search.naver.com/search.naver?query={encoded_keyword}"
+        url = build_search_url(keyword)
         logger.info(f"검색 URL: {url}")
         
+        started = time.perf_counter()
         self.driver.get(url)
-        time.sleep(3)  # 페이지 로딩 대기
+        metrics.SERP_FETCH_SECONDS.observe(time.perf_counter() - started)
+        time.sleep(SERP_LOAD_WAIT)  # 페이지 로딩 대기
     
-    def find_content_sections(self):
-        """페이지에서 콘텐츠 섹션 찾기"""
+    def find_content_sections(self, section_filters=None, ranks=None):
+        """
+        페이지에서 콘텐츠 섹션 찾기
+        
+        추출 방식이 "script"면 섹션 제목과 항목 필드를 한 번에 가져온 SerpSection 목록을,
+        아니면 웹드라이버 요소 목록을 반환한다. 스크립트는 섹션 필터와 일치하는 섹션에서만
+        요청한 가장 낮은 순위까지 항목을 가져오고, 나머지 섹션은 제목만 가져온다.
+        스크립트 실행이 실패하면 웹드라이버 방식으로 찾는다.
+        
+        Args:
+            section_filters (list, optional): 섹션 제목 필터 (지정하지 않으면 인기글 섹션)
+            ranks (frozenset, optional): normalize_ranks로 정리한 순위 집합
+        """
+        from selenium.webdriver.common.by import By
+        
         try:
-            time.sleep(2)  # 추가 대기
+            if self.extraction == "script":
+                try:
+                    terms, ignore_case = section_title_terms(section_filters)
+                    sections = extract_serp(self.driver, rank_limit(ranks), terms, ignore_case)
+                    logger.info(f"총 {len(sections)}개의 콘텐츠 섹션 발견")
+                    return sections
+                except Exception as e:
+                    logger.warning(f"검색 결과 추출 스크립트 실행 실패, 웹드라이버 방식으로 찾습니다: {e}")
             
             # 검색 페이지에서 모든 콘텐츠 섹션 가져오기
-            sections = self.driver.find_elements(By.CSS_SELECTOR, "div.api_subject_bx")
+            sections = self.driver.find_elements(By.CSS_SELECTOR, SECTION_SELECTOR)
             
             logger.info(f"총 {len(sections)}개의 콘텐츠 섹션 발견")
             return sections
@@ -84,14 +340,40 @@ class NaverSearchCrawler:
     
     def get_section_title(self, section):
         """섹션의 제목 추출"""
+        if isinstance(section, SerpSection):
+            return section.title.strip()
+        
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import NoSuchElementException
+        
         try:
-            section_title_element = section.find_element(By.CSS_SELECTOR, "h3, h2, strong.tit, span.title_area, div.title_area")
+            section_title_element = section.find_element(By.CSS_SELECTOR, SECTION_TITLE_SELECTOR)
             if section_title_element:
                 return section_title_element.text.strip()
         except (NoSuchElementException, Exception):
             pass
         return ""
     
+    def parse_sections_from_html(self, page_source):
+        """
+        페이지 HTML에서 콘텐츠 섹션 찾기 (웹드라이버 없이 분석할 때 사용)
+        
+        Args:
+            page_source (str): 검색 결과 페이지 HTML
+            
+        Returns:
+            list: 섹션별 BeautifulSoup 요소 목록
+        """
+        # 머리말과 script/style 등을 잘라 낸 뒤 파싱
+        return parse_serp_sections(page_source)
+    
+    def get_section_title_from_html(self, section):
+        """BeautifulSoup 섹션 요소에서 제목 추출"""
+        title_element = section.select_one(SECTION_TITLE_SELECTOR)
+        if title_element:
+            return title_element.text.strip()
+        return ""
+    
     def get_all_section_titles(self, sections):
         """모든 섹션의 제목 추출"""
         section_titles = []
@@ -103,6 +385,8 @@ class NaverSearchCrawler:
     
     def find_popular_content_sections(self, sections):
         """인기글이 포함된 모든 섹션 찾기"""
+        from selenium.common.exceptions import NoSuchElementException
+        
         popular_sections = []
         
         for section in sections:
@@ -111,7 +395,7 @@ class NaverSearchCrawler:
                 section_title = self.get_section_title(section)
                 
                 # "인기글"이 포함된 모든 섹션 찾기 (예: 패션·미용 인기글, 건강·의학 인기글 등)
-                if section_title and ("인기글" in section_title or "브랜드 콘텐츠" in section_title):
+                if section_matches(section_title):
                     logger.info(f"인기 콘텐츠 섹션 발견: '{section_title}'")
                     popular_sections.append((section, section_title))
             
@@ -125,6 +409,32 @@ class NaverSearchCrawler:
             logger.info("인기글/브랜드 콘텐츠 섹션을 찾을 수 없습니다.")
             return False, []
     
+    def find_matching_sections(self, sections, section_filters=None, get_title=None):
+        """
+        섹션 필터와 일치하는 섹션 찾기
+        
+        Args:
+            sections (list): 섹션 요소 목록 (웹드라이버 요소 또는 BeautifulSoup 요소)
+            section_filters (list, optional): 섹션 제목 필터 (지정하지 않으면 인기글 섹션)
+            get_title (callable, optional): 섹션 제목 추출 함수 (기본값: get_section_title)
+        
+        Returns:
+            list: (섹션, 섹션 제목) 목록
+        """
+        get_title = get_title or self.get_section_title
+        matched = []
+        
+        for section in sections:
+            try:
+                section_title = get_title(section)
+            except Exception:
+                continue
+            if section_matches(section_title, section_filters):
+                matched.append((section, section_title))
+        
+        logger.info(f"필터와 일치하는 섹션 {len(matched)}개 / 전체 {len(sections)}개")
+        return matched
+    
     def find_first_topic_section(self, sections):
         """인기글이 없을 때 첫 번째 주제 섹션 찾기"""
         if not sections:
@@ -189,6 +499,8 @@ class NaverSearchCrawler:
         if not url or url == '링크 없음':
             return "알 수 없는 블로그"
         
+        from bs4 import BeautifulSoup
+        
         try:
             # HTML에서 블로그 이름 찾기 시도
             soup = BeautifulSoup(html_content, 'html.parser')
@@ -255,6 +567,8 @@ class NaverSearchCrawler:
         if not url or url == '링크 없음':
             return "알 수 없는 카페"
         
+        from bs4 import BeautifulSoup
+        
         try:
             # HTML에서 카페 이름 찾기 시도
             soup = BeautifulSoup(html_content, 'html.parser')
@@ -319,13 +633,24 @@ class NaverSearchCrawler:
         if not url or url == '링크 없음' or "cafe.naver.com" not in url:
             return "", ""
         
+        # 같은 게시글은 추적 파라미터가 달라도 한 번만 조회
+        match = re.search(r'cafe\.naver\.com/([^/?&#]+)/(\d+)', url)
+        cache_key = match.groups() if match else url
+        if cache_key in self.cafe_info_cache:
+            metrics.CAFE_CACHE_HITS.inc()
+            return self.cafe_info_cache[cache_key]
+        metrics.CAFE_CACHE_MISSES.inc()
+        
+        new_window = None
         try:
             # 현재 창 핸들 저장
             current_window = self.driver.current_window_handle
             
-            # 새 탭에서 URL 열기
+            # 새 탭에서 URL 열기 (검색용 탭이 여러 개일 수 있으므로 새로 생긴 핸들만 사용)
+            existing_windows = set(self.driver.window_handles)
             self.driver.execute_script("window.open('');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
+            new_window = next(h for h in self.driver.window_handles if h not in existing_windows)
+            self.driver.switch_to.window(new_window)
             
             # URL 로드
             self.driver.get(url)
@@ -335,6 +660,8 @@ class NaverSearchCrawler:
             view_count = ""
             
             try:
+                from selenium.webdriver.common.by import By
+                
                 # iframe으로 전환 시도
                 iframe = self.driver.find_element(By.ID, "cafe_main")
                 self.driver.switch_to.frame(iframe)
@@ -355,17 +682,22 @@ class NaverSearchCrawler:
             except Exception as e:
                 logger.warning(f"카페 상세 정보 추출 중 오류: {e}")
             
-            # 원래 탭으로 돌아가기
+            # 새 탭만 닫고 원래 탭으로 돌아가기
             self.driver.close()
+            new_window = None
             self.driver.switch_to.window(current_window)
             
+            self.cafe_info_cache[cache_key] = (nickname, view_count)
             return nickname, view_count
         
         except Exception as e:
             logger.error(f"카페 정보 추출 중 오류 발생: {e}")
             
-            # 원래 탭으로 돌아가려고 시도
+            # 열어 둔 새 탭을 닫고 원래 탭으로 돌아가려고 시도
             try:
+                if new_window is not None and new_window in self.driver.window_handles:
+                    self.driver.switch_to.window(new_window)
+                    self.driver.close()
                 self.driver.switch_to.window(current_window)
             except:
                 pass
@@ -513,171 +845,85 @@ class NaverSearchCrawler:
                 return domain
             return content_type
     
-    def extract_content_info_from_section(self, section):
-        """섹션에서 콘텐츠 정보 추출"""
-        results = []
+    def extract_content_info_from_section(self, section, ranks=None, keyword="", search_url="", section_title=""):
+        """섹션에서 콘텐츠 정보 추출 (인자는 extract_content_info_from_html 참고)"""
+        if isinstance(section, SerpSection):
+            # 스크립트로 이미 가져온 항목 필드 사용 (웹드라이버 호출 없음)
+            if not section.items:
+                logger.warning("섹션에서 콘텐츠 항목을 찾을 수 없습니다.")
+                return []
+            return self.build_content_items(section.items, lambda fields: fields, ranks, keyword, search_url, section_title)
         
         try:
             # 섹션 HTML 가져오기
             section_html = section.get_attribute('outerHTML')
-            soup = BeautifulSoup(section_html, 'html.parser')
-            
-            # 콘텐츠 항목 찾기 시도
-            content_items = soup.select("li, div.content_item")
+        except Exception as e:
+            logger.error(f"섹션 HTML을 가져오는 중 오류 발생: {e}")
+            return []
+        
+        return self.extract_content_info_from_html(section_html, ranks, keyword, search_url, section_title)
+    
+    def extract_content_info_from_html(self, section_html, ranks=None, keyword="", search_url="", section_title=""):
+        """
+        섹션 HTML에서 콘텐츠 정보 추출
+        
+        요청한 순위가 아닌 항목은 건너뛰고 가장 낮은 요청 순위 이후로는 추출하지 않는다.
+        
+        Args:
+            section_html (str|Tag): 섹션 HTML 문자열 또는 파싱된 BeautifulSoup 요소
+            ranks (int|list, optional): 추출할 순위 목록 또는 최대 순위 (기본값: 최대 20개 전체)
+            keyword (str): 항목에 기록할 검색 키워드
+            search_url (str): 항목에 기록할 검색 URL
+            section_title (str): 항목에 기록할 섹션 제목
             
-            if not content_items:
-                # 다른 선택자 시도
-                content_items = soup.select("div.brand_area, div.content_area")
+        Returns:
+            list: ContentItem 목록
+        """
+        from bs4 import BeautifulSoup
+        
+        try:
+            if isinstance(section_html, str):
+                soup = BeautifulSoup(trim_serp_html(section_html), 'html.parser')
+            else:
+                soup = section_html
             
-            if not content_items:
-                logger.warning("섹션에서 콘텐츠 항목을 찾을 수 없습니다.")
-                return results
+            # 최상위 콘텐츠 카드만 가장 낮은 요청 순위까지 찾기 (카드 안의 태그 목록 li 등은 제외)
+            content_items = segment_items(soup, rank_limit(normalize_ranks(ranks)))
+        
+        except Exception as e:
+            logger.error(f"콘텐츠 분석 중 오류 발생: {e}")
+            return []
+        
+        if not content_items:
+            logger.warning("섹션에서 콘텐츠 항목을 찾을 수 없습니다.")
+            return []
+        
+        return self.build_content_items(content_items, item_fields_from_html, ranks, keyword, search_url, section_title)
+    
+    def build_content_items(self, items, get_fields, ranks=None, keyword="", search_url="", section_title=""):
+        """
+        항목 요소(또는 원본 필드) 목록을 ContentItem 목록으로 변환
+        
+        Args:
+            items (list): 항목 목록 (BeautifulSoup 요소 또는 RawItem)
+            get_fields (callable): 항목에서 RawItem을 얻는 함수
+            ranks, keyword, search_url, section_title: extract_content_info_from_html 참고
             
+        Returns:
+            list: ContentItem 목록 (오류가 나면 그때까지 추출한 항목)
+        """
+        ranks = normalize_ranks(ranks)
+        section_title = intern_text(section_title)
+        max_items = rank_limit(ranks)
+        results = []
+        
+        try:
             # 각 콘텐츠 항목에서 정보 추출
-            for idx, item in enumerate(content_items[:20], 1):  # 최대 20개
-                # 제목 추출
-                title_element = (
-                    item.select_one("a.api_txt_lines") or
-                    item.select_one("strong.title") or
-                    item.select_one("div.title_area") or
-                    item.select_one("div.title") or
-                    item.select_one("a.title_link")
-                )
-                
-                title = title_element.text.strip() if title_element else "제목 없음"
-                
-                # URL 추출
-                url_element = (
-                    item.select_one("a.api_txt_lines") or
-                    item.select_one("a.title_link") or
-                    item.select_one("a")
-                )
-                
-                url = url_element.get('href', '링크 없음') if url_element else '링크 없음'
-                
-                # 게시처와 아이디 정보 추출
-                # 게시처(작성자) 추출 시도 (a.name 요소)
-                publisher_element = item.select_one("a.name")
-                publisher_from_html = publisher_element.text.strip() if publisher_element else ""
-                
-                # 아이디 추출 (span.sub에서 찾기)
-                user_id = ""
-                sub_elements = item.select("span.sub")
-                for sub in sub_elements:
-                    text = sub.text.strip()
-                    # id가 포함된 텍스트 패턴 찾기
-                    if "@" in text or "by " in text.lower():
-                        user_id = text
-                        break
-                
-                # 작성일 추출 시도 - 더 많은 선택자 추가 및 span.sub 내부 확인
-                date = ""
-                # 직접적인 작성일 요소 먼저 확인
-                date_element = (
-                    item.select_one("div.detail_box span.time") or 
-                    item.select_one("span.date") or
-                    item.select_one("span.time") or
-                    item.select_one("div.sub_info") or
-                    item.select_one("span.sub_time") or
-                    item.select_one("time.sub_time")
-                )
-                
-                if date_element:
-                    date = date_element.text.strip()
-                else:
-                    # span.sub 요소들 중에서 날짜 패턴 찾기
-                    for sub in sub_elements:
-                        text = sub.text.strip()
-                        # 날짜 패턴 확인 (예: "3주 전", "2022.08.02", "5일 전")
-                        if re.search(r'\d+[일주개월년](전|\s?전)|^\d{4}[-\.]\d{1,2}[-\.]\d{1,2}', text) or "전" in text:
-                            if "@" not in text and "by " not in text.lower():  # 아이디가 아닌 경우만
-                                date = text
-                                break
-                
-                # 조회수 추출 시도
-                view_count = ""
-                view_count_element = (
-                    item.select_one("div.detail_box span.view") or
-                    item.select_one("span.view") or
-                    item.select_one("em.view") or
-                    item.select_one("span.sub_view") or
-                    item.select_one("span.count") or
-                    item.select_one("div.info span.view_count") or
-                    item.select_one("span.hit") or
-                    item.select_one("em.hit") or
-                    item.select_one("div.user_info span.view") or
-                    item.select_one("span.view_num") or
-                    item.select_one("div.cont_info span.count")
-                )
-                
-                if view_count_element:
-                    view_count_text = view_count_element.text.strip()
-                    if "조회" in view_count_text:
-                        view_count = view_count_text.replace("조회", "").strip()
-                    elif "조회수" in view_count_text:
-                        view_count = view_count_text.replace("조회수", "").strip()
-                    elif "읽음" in view_count_text:
-                        view_count = view_count_text.replace("읽음", "").strip()
-                    elif "조회 " in view_count_text:
-                        view_count = view_count_text.replace("조회 ", "").strip()
-                    else:
-                        view_count = view_count_text
-                
-                # 조회수가 없는 경우, 모든 span 요소 검사
-                if not view_count:
-                    for span in item.select("span"):
-                        text = span.text.strip()
-                        if any(keyword in text for keyword in ["조회", "읽음", "view", "hit"]):
-                            # 조회수 패턴 추출 (숫자 + 조회|읽음 또는 조회|읽음 + 숫자)
-                            view_match = re.search(r'(\d[\d,.]*\s*[만천]?\s*(조회|읽음|view|hit)|(?:조회|읽음|view|hit)\s*\d[\d,.]*\s*[만천]?)', text, re.IGNORECASE)
-                            if view_match:
-                                view_count = view_match.group(0)
-                                # 숫자만 추출
-                                view_count = re.sub(r'[^\d,.만천]', '', view_count)
-                                break
-                
-                # URL 분석으로 컨텐츠 유형 결정
-                content_type = self.analyze_url_for_content_type(url)
-                
-                # 게시처 정보 가져오기
-                publisher = publisher_from_html if publisher_from_html else self.get_author_from_content_type(content_type, url, str(item))
-                
-                # 아이디 정보 추출
-                if not user_id:
-                    if "블로그" in content_type:
-                        user_id = self.extract_blog_id(url)
-                    elif "카페" in content_type:
-                        user_id = self.extract_cafe_id(url)
-                
-                # 네이버 카페 게시물인 경우 닉네임과 조회수 추출 시도
-                if "네이버 카페" in content_type and url and url != "링크 없음":
-                    nickname, cafe_view_count = self.extract_detailed_cafe_info(url)
-                    if nickname:
-                        user_id = nickname
-                    if cafe_view_count:
-                        view_count = cafe_view_count
-                
-                # 웹사이트의 경우 URL 확인 및 수정
-                if content_type == "웹사이트" and (url == "링크 없음" or not url):
-                    # 다시 한번 URL 찾기 시도
-                    all_links = item.select("a")
-                    if all_links:
-                        for link in all_links:
-                            link_url = link.get('href')
-                            if link_url and link_url != "#" and not link_url.startswith("javascript:"):
-                                url = link_url
-                                break
-                
-                results.append({
-                    "순번": idx,
-                    "컨텐츠_유형": content_type,
-                    "제목": title,
-                    "게시처": publisher,
-                    "아이디": user_id,
-                    "작성일": date,
-                    "조회수": view_count,
-                    "URL": url
-                })
+            for idx, item in enumerate(items[:max_items], 1):  # 최대 20개
+                if ranks and idx not in ranks:
+                    continue
+                results.append(self.content_item_from_fields(
+                    get_fields(item), idx, keyword, search_url, section_title))
             
             logger.info(f"총 {len(results)}개의 콘텐츠 정보 추출 성공")
             return results
@@ -686,38 +932,222 @@ class NaverSearchCrawler:
             logger.error(f"콘텐츠 분석 중 오류 발생: {e}")
             return results
     
-    def analyze_search_result(self, keyword):
+    def content_item_from_fields(self, fields, idx, keyword="", search_url="", section_title=""):
+        """
+        항목 원본 필드를 정리해 ContentItem 생성 (HTML 추출과 스크립트 추출이 함께 사용)
+        
+        Args:
+            fields (RawItem): 항목 원본 필드
+            idx (int): 섹션 안 순번
+            keyword, search_url, section_title: 항목에 기록할 값
+            
+        Returns:
+            ContentItem: 컨텐츠 항목
+        """
+        # 제목 추출
+        title = fields.title.strip() if fields.title is not None else "제목 없음"
+        
+        # URL 추출
+        url = fields.url if fields.url is not None else '링크 없음'
+        
+        # 게시처(작성자) 추출 시도 (a.name 요소)
+        publisher_from_html = fields.publisher.strip() if fields.publisher is not None else ""
+        
+        # 아이디 추출 (span.sub에서 찾기)
+        user_id = ""
+        sub_texts = [text.strip() for text in fields.subs]
+        for text in sub_texts:
+            # id가 포함된 텍스트 패턴 찾기
+            if "@" in text or "by " in text.lower():
+                user_id = text
+                break
+        
+        # 작성일 추출 시도 - 직접적인 작성일 요소 먼저 확인
+        date = ""
+        if fields.date is not None:
+            date = fields.date.strip()
+        else:
+            # span.sub 요소들 중에서 날짜 패턴 찾기
+            for text in sub_texts:
+                # 날짜 패턴 확인 (예: "3주 전", "2022.08.02", "5일 전")
+                if re.search(r'\d+[일주개월년](전|\s?전)|^\d{4}[-\.]\d{1,2}[-\.]\d{1,2}', text) or "전" in text:
+                    if "@" not in text and "by " not in text.lower():  # 아이디가 아닌 경우만
+                        date = text
+                        break
+        
+        # 조회수 추출 시도
+        view_count = ""
+        if fields.view is not None:
+            view_count_text = fields.view.strip()
+            if "조회" in view_count_text:
+                view_count = view_count_text.replace("조회", "").strip()
+            elif "조회수" in view_count_text:
+                view_count = view_count_text.replace("조회수", "").strip()
+            elif "읽음" in view_count_text:
+                view_count = view_count_text.replace("읽음", "").strip()
+            elif "조회 " in view_count_text:
+                view_count = view_count_text.replace("조회 ", "").strip()
+            else:
+                view_count = view_count_text
+        
+        # 조회수가 없는 경우, 조회수 단어가 있는 span 검사
+        if not view_count:
+            for text in fields.view_spans:
+                text = text.strip()
+                # 조회수 패턴 추출 (숫자 + 조회|읽음 또는 조회|읽음 + 숫자)
+                view_match = re.search(r'(\d[\d,.]*\s*[만천]?\s*(조회|읽음|view|hit)|(?:조회|읽음|view|hit)\s*\d[\d,.]*\s*[만천]?)', text, re.IGNORECASE)
+                if view_match:
+                    view_count = view_match.group(0)
+                    # 숫자만 추출
+                    view_count = re.sub(r'[^\d,.만천]', '', view_count)
+                    break
+        
+        # URL 분석으로 컨텐츠 유형 결정
+        content_type = self.analyze_url_for_content_type(url)
+        
+        # 게시처 정보 가져오기
+        publisher = publisher_from_html if publisher_from_html else self.get_author_from_content_type(content_type, url)
+        
+        # 아이디 정보 추출
+        if not user_id:
+            if "블로그" in content_type:
+                user_id = self.extract_blog_id(url)
+            elif "카페" in content_type:
+                user_id = self.extract_cafe_id(url)
+        
+        # 웹사이트의 경우 URL 확인 및 수정 (첫 번째 유효한 링크 사용)
+        if content_type == "웹사이트" and (url == "링크 없음" or not url) and fields.fallback_url:
+            url = fields.fallback_url
+        
+        return ContentItem(
+            keyword, search_url, section_title, idx, intern_text(content_type),
+            title, publisher, user_id, date, view_count, url
+        )
+    
+    def canonicalize_contents(self, items):
+        """
+        컨텐츠 항목에 정규화 URL 기록 (리다이렉트 URL은 키워드의 항목을 모아 한 번에 확인)
+        
+        Args:
+            items (list): ContentItem 목록
+        
+        Returns:
+            list: canonical_url이 채워진 ContentItem 목록 (URL이 없는 항목은 빈 문자열)
+        """
+        if not items:
+            return items
+        with self.timer.stage("canonicalize_urls"):
+            canonical = self.url_canonicalizer.canonicalize_many(item.url for item in items)
+        return [item._replace(canonical_url=canonical.get(item.url, "")) for item in items]
+    
+    def enrich_contents(self, items, cached=None):
+        """
+        상세 페이지에서 컨텐츠 정보 보강
+        
+        네이버 카페 글은 웹드라이버로 접속해 닉네임과 조회수로 덮어쓰고, 블로그/포스트/지식iN 글은
+        비어 있는 작성일이나 조회수를 상세 페이지에서 채울 수 있을 때만 HTTP로 받아(DetailFetcher) 빈 값을 채운다.
+        
+        Args:
+            items (list): ContentItem 목록
+            cached (dict, optional): URL -> [아이디, 조회수, 작성일]. 있으면 접속하지 않고 이 값을 사용
+        
+        Returns:
+            tuple: (보강된 ContentItem 목록, 이번에 보강한 URL -> [아이디, 조회수, 작성일])
+        """
+        enriched = []
+        enrichment = {}
+        
+        details = {}
+        if cached is None and self.detail_fetcher is not None:
+            # 보강기가 빈 값을 채울 수 있는 글만 요청 (블로그는 작성일만 제공하므로 작성일이 있으면 요청하지 않음)
+            urls = [item.url for item in items
+                    if "네이버 카페" not in item.content_type and self.detail_fetcher.can_enrich(
+                        item.url, {field for field in ("date", "view_count") if not getattr(item, field)})]
+            if urls:
+                with self.timer.stage("enrich_details"):
+                    details = self.detail_fetcher.enrich_urls(urls)
+        
+        for item in items:
+            url = item.url
+            if not url or url == "링크 없음":
+                enriched.append(item)
+                continue
+            is_cafe = "네이버 카페" in item.content_type
+            
+            if cached is not None:
+                if url not in cached:
+                    enriched.append(item)
+                    continue
+                # 작성일이 없던 이전 형식([아이디, 조회수])도 사용
+                user_id, view_count, date = (list(cached[url]) + ["", "", ""])[:3]
+            elif is_cafe and self.enrich_cafe:
+                with self.timer.stage("extract_detailed_cafe_info"):
+                    user_id, view_count = self.extract_detailed_cafe_info(url)
+                date = ""
+            elif url in details:
+                user_id, date, view_count = details[url]
+            else:
+                enriched.append(item)
+                continue
+            
+            if user_id or view_count or date:
+                enrichment[url] = [user_id or "", view_count or "", date or ""]
+                if is_cafe:
+                    item = item._replace(user_id=user_id or item.user_id, view_count=view_count or item.view_count)
+                else:
+                    item = item._replace(user_id=item.user_id or user_id, date=item.date or date,
+                                         view_count=item.view_count or view_count)
+            enriched.append(item)
+        
+        return enriched, enrichment
+    
+    def analyze_search_result(self, keyword, fingerprint_store=None, loaded=False):
         """
         키워드 검색 결과 분석
         
+        fingerprint_store가 있으면 섹션 제목 목록과 인기글 URL로 만든 지문을 이전 실행과
+        비교해 "변경_상태"(신규/변경/동일)를 기록한다. 지문이 같으면 카페/블로그 등의 상세 페이지에
+        다시 접속하지 않고 저장해 둔 보강 정보(아이디, 조회수, 작성일)를 재사용한다.
+        처리/실패 키워드 수는 드라이버를 다시 시작해 다시 분석할 수 있으므로 analyze_keywords에서 집계한다.
+        
         Args:
             keyword (str): 검색 키워드
+            fingerprint_store (FingerprintStore, optional): 검색 결과 지문 저장소
+            loaded (bool): 현재 창에 이 키워드의 검색 결과가 이미 로딩되어 있는지 여부 (탭 풀 사용 시)
             
         Returns:
-            dict: 분석 결과
+            dict: 분석 결과 ("오류"는 분석 중 발생한 오류 메시지, 성공하면 빈 문자열)
         """
         result = {
             "키워드": keyword,
-            "검색_URL": f"https://search.naver.com/search.naver?query={urllib.parse.quote(keyword)}",
+            "검색_URL": build_search_url(keyword),
             "인기글_탭_존재": False,
             "인기글_탭_제목": [],
             "인기글_컨텐츠": [],
             "첫번째_섹션": "",
-            "모든_섹션": []
+            "모든_섹션": [],
+            "변경_상태": "",
+            "오류": ""
         }
         
+        self.timer.start_keyword(keyword)
+        
         try:
-            self.search_keyword(keyword)
+            if not loaded:
+                with self.timer.stage("search_keyword"):
+                    self.search_keyword(keyword)
             
             # 모든 콘텐츠 섹션 찾기
-            sections = self.find_content_sections()
-            
-            # 모든 섹션 제목 가져오기
-            all_section_titles = self.get_all_section_titles(sections)
-            result["모든_섹션"] = all_section_titles
+            with self.timer.stage("find_content_sections"):
+                sections = self.find_content_sections()
             
-            # 인기글/브랜드 콘텐츠 섹션 찾기
-            popular_exists, popular_sections = self.find_popular_content_sections(sections)
+            with self.timer.stage("section_titles"):
+                # 모든 섹션 제목 가져오기
+                all_section_titles = self.get_all_section_titles(sections)
+                result["모든_섹션"] = all_section_titles
+                
+                # 인기글/브랜드 콘텐츠 섹션 찾기
+                popular_exists, popular_sections = self.find_popular_content_sections(sections)
             
             result["인기글_탭_존재"] = popular_exists
             
@@ -731,161 +1161,414 @@ class NaverSearchCrawler:
                 
                 for section, title in popular_sections:
                     logger.info(f"'{title}' 섹션에서 콘텐츠 추출 중...")
-                    section_contents = self.extract_content_info_from_section(section)
-                    
-                    # 섹션별 메타데이터 추가
-                    for content in section_contents:
-                        content["섹션"] = title
+                    with self.timer.stage("extract_content_info_from_section"):
+                        section_contents = self.extract_content_info_from_section(
+                            section, keyword=keyword, search_url=result["검색_URL"], section_title=title)
                     
                     all_contents.extend(section_contents)
                 
                 result["인기글_컨텐츠"] = all_contents
             else:
                 # 인기글이 없는 경우 첫 번째 주제 섹션 정보 추출
-                first_section, first_title = self.find_first_topic_section(sections)
+                with self.timer.stage("section_titles"):
+                    first_section, first_title = self.find_first_topic_section(sections)
                 result["첫번째_섹션"] = first_title
             
+            contents = self.canonicalize_contents(result["인기글_컨텐츠"])
+            if fingerprint_store is None:
+                result["인기글_컨텐츠"], _ = self.enrich_contents(contents)
+            else:
+                fingerprint = compute_fingerprint(all_section_titles, contents)
+                status = fingerprint_store.check(keyword, fingerprint)
+                if status == STATUS_UNCHANGED:
+                    logger.info(f"'{keyword}' 검색 결과가 이전 실행과 같아 저장된 보강 정보를 재사용합니다.")
+                    result["인기글_컨텐츠"], _ = self.enrich_contents(contents, fingerprint_store.get_enrichment(keyword))
+                    metrics.KEYWORDS_UNCHANGED.inc()
+                else:
+                    result["인기글_컨텐츠"], enrichment = self.enrich_contents(contents)
+                    fingerprint_store.update(keyword, fingerprint, enrichment)
+                result["변경_상태"] = status
+            
             return result
         
         except Exception as e:
             logger.error(f"검색 결과 분석 중 오류 발생: {str(e)}")
+            result["오류"] = str(e) or type(e).__name__
             return result
+        finally:
+            self.timer.end_keyword()
     
-    def process_keyword_list(self, input_file, output_file):
+    def collect_section_contents(self, keyword, matched_sections, ranks=None):
         """
-        엑셀 파일에서 키워드 목록을 읽어 처리하고 결과를 CSV로 저장
+        선택한 섹션에서 요청한 순위의 콘텐츠 행 추출
         
         Args:
-            input_file (str): 키워드 목록이 있는 엑셀 파일 경로
-            output_file (str): 결과를 저장할 CSV 파일 경로
+            keyword (str): 검색 키워드
+            matched_sections (list): (섹션, 섹션 제목) 목록
+            ranks (int|list, optional): 추출할 순위 목록 또는 최대 순위
+        
+        Returns:
+            list: ContentItem 목록
         """
+        search_url = build_search_url(keyword)
+        items = []
+        
+        for section, title in matched_sections:
+            with self.timer.stage("extract_content_info_from_section"):
+                items.extend(self.extract_content_info_from_section(section, ranks, keyword, search_url, title))
+        
+        items, _ = self.enrich_contents(self.canonicalize_contents(items))
+        return items
+    
+    def crawl_keyword(self, keyword, sections=None, ranks=None):
+        """
+        키워드를 검색해 지정한 섹션과 순위의 콘텐츠만 추출
+        
+        섹션 필터와 일치하는 섹션만 HTML을 가져와 분석하고, 요청한 순위 이후의 항목은
+        추출하지 않는다. 검색은 키워드의 정규형으로 하고, 결과 행에는 원본 표기를 기록한다.
+        
+        Args:
+            keyword (str): 검색 키워드
+            sections (list, optional): 섹션 제목 필터 (지정하지 않으면 인기글 섹션)
+            ranks (int|list, optional): 추출할 순위 목록 또는 최대 순위
+        
+        Returns:
+            list: ContentItem 목록
+        """
+        ranks = normalize_ranks(ranks)
+        canonical = canonicalize_keyword(keyword)
+        self.timer.start_keyword(canonical)
+        
         try:
-            # 파일 확장자 확인
-            file_ext = os.path.splitext(input_file)[1].lower()
-            
-            # 엑셀 또는 CSV 파일 읽기
-            if file_ext == '.xlsx' or file_ext == '.xls':
-                df = pd.read_excel(input_file)
-            elif file_ext == '.csv':
-                df = pd.read_csv(input_file, encoding='utf-8')
-            else:
-                raise ValueError("지원하지 않는 파일 형식입니다. .xlsx, .xls, .csv 형식만 지원합니다.")
+            with self.timer.stage("search_keyword"):
+                self.search_keyword(canonical)
             
-            # 키워드 열 확인
-            if 'keyword' not in df.columns and '키워드' not in df.columns:
-                raise ValueError("파일에 'keyword' 또는 '키워드' 열이 없습니다.")
+            with self.timer.stage("find_content_sections"):
+                all_sections = self.find_content_sections(sections, ranks)
             
-            keyword_col = 'keyword' if 'keyword' in df.columns else '키워드'
-            keywords = df[keyword_col].tolist()
+            with self.timer.stage("section_titles"):
+                matched_sections = self.find_matching_sections(all_sections, sections)
             
-            all_results = []        # 요약 정보
-            content_results = []    # 인기글 컨텐츠 정보
-            section_results = []    # 섹션 정보
-            
-            # 각 키워드에 대해 검색 결과 분석
+            rows = self.collect_section_contents(canonical, matched_sections, ranks)
+            if canonical != keyword:
+                rows = [item._replace(keyword=keyword) for item in rows]
+            metrics.KEYWORDS_DONE.inc()
+            return rows
+        
+        except Exception as e:
+            logger.error(f"'{keyword}' 크롤링 중 오류 발생: {str(e)}")
+            metrics.KEYWORDS_FAILED.inc()
+            return []
+        finally:
+            self.timer.end_keyword()
+    
+    def analyze_keywords(self, keywords, keyword_index=None, progress=None, cancel_event=None,
+                         fingerprint_store=None, omit_unchanged=False):
+        """
+        키워드를 하나씩 분석해 결과가 나오는 즉시 반환하는 제너레이터
+        
+        공백, 유니코드 정규화, 전각 문자만 다른 키워드는 한 번만 검색하고 그 결과를
+        다른 표기에 그대로 사용한다. 재사용할 결과는 최근 DUPLICATE_RESULT_CACHE_SIZE개의
+        정규형만 보관하며(이미 버린 결과의 중복 키워드는 다시 검색), 그 밖의 결과는 모아 두지
+        않으므로 result_sinks의 싱크와 함께 쓰면 키워드 수와 관계없이 메모리 사용량이 일정하다.
+        탭 수(tabs)가 2 이상이면 다음 키워드들의 검색 결과를 다른 탭에서 미리 로딩한다.
+        
+        Args:
+            keywords (iterable): 키워드 문자열 이터러블 (리스트, 제너레이터, iter_keywords 등)
+            keyword_index (KeywordIndex, optional): 키워드 정규형 색인 (없으면 메모리 색인 사용)
+            progress (CrawlProgress, optional): 진행 상황 추적기
+            cancel_event (threading.Event, optional): 설정되면 현재 키워드까지만 처리하고 종료
+            fingerprint_store (FingerprintStore, optional): 검색 결과 지문 저장소 (변경 감지 모드)
+            omit_unchanged (bool): 검색 결과가 이전 실행과 같은 키워드는 컨텐츠 행을 생략
+        
+        Yields:
+            KeywordResult: 키워드별 (SummaryRecord, SectionRankRecord, ContentItem 목록)
+        """
+        if keyword_index is None:
+            keyword_index = KeywordIndex()
+        
+        recent_results = OrderedDict()    # 정규형 -> 정규형 기준 KeywordResult (최근 사용 순)
+        
+        def cancelled():
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info("작업 중지 요청으로 키워드 처리를 중단합니다.")
+                return True
+            return False
+        
+        def entries():
             for keyword in keywords:
-                if not isinstance(keyword, str):
-                    keyword = str(keyword)
-                
-                logger.info(f"\n{'='*50}\n검색 키워드: {keyword}\n{'='*50}")
-                
-                result = self.analyze_search_result(keyword)
-                
-                # 키워드별 인기글 탭 존재 여부 저장
-                all_results.append({
-                    "키워드": keyword,
-                    "검색_URL": result["검색_URL"],
-                    "인기글_탭_존재": result["인기글_탭_존재"],
-                    "인기글_탭_제목": ", ".join(result["인기글_탭_제목"]) if result["인기글_탭_제목"] else "",
-                    "첫번째_섹션": result["첫번째_섹션"] if not result["인기글_탭_존재"] else ""
-                })
-                
-                # 키워드별 모든 섹션 정보 저장
-                section_row = {"키워드": keyword}
-                for idx, section in enumerate(result["모든_섹션"][:10], 1):  # 최대 10개 섹션까지만
-                    section_row[f"{idx}순위"] = section
-                section_results.append(section_row)
-                
-                # 인기글 컨텐츠 정보 저장
-                for content in result["인기글_컨텐츠"]:
-                    content_results.append({
-                        "키워드": keyword,
-                        "검색_URL": result["검색_URL"],
-                        "섹션": content.get("섹션", ""),
-                        "순번": content["순번"],
-                        "컨텐츠_유형": content["컨텐츠_유형"],
-                        "제목": content["제목"],
-                        "게시처": content.get("게시처", ""),
-                        "아이디": content.get("아이디", ""),
-                        "작성일": content.get("작성일", ""),
-                        "조회수": content.get("조회수", ""),
-                        "URL": content["URL"]
-                    })
-            
-            # 결과를 데이터프레임으로 변환
-            all_df = pd.DataFrame(all_results)
-            content_df = pd.DataFrame(content_results)
-            section_df = pd.DataFrame(section_results)
-            
-            # 결과 저장
-            output_base = os.path.splitext(output_file)[0]
-            
-            # 탭 존재 여부 파일
-            all_df.to_csv(f"{output_base}_summary.csv", index=False, encoding='utf-8-sig')
-            
-            # 섹션 정보 파일
-            section_df.to_csv(f"{output_base}_sections.csv", index=False, encoding='utf-8-sig')
-            
-            # 컨텐츠 유형 통계 계산
-            if not content_df.empty:
-                # 컨텐츠 유형별 카운트
-                type_counts = content_df['컨텐츠_유형'].value_counts().reset_index()
-                type_counts.columns = ['컨텐츠_유형', '개수']
-                
-                # 섹션별 카운트
-                section_counts = content_df['섹션'].value_counts().reset_index()
-                section_counts.columns = ['섹션', '개수']
-                
-                # 인기글 컨텐츠 파일 저장
-                content_df.to_csv(f"{output_base}_contents.csv", index=False, encoding='utf-8-sig')
-                
-                # 엑셀 파일로도 저장
-                with pd.ExcelWriter(f"{output_base}.xlsx") as writer:
-                    all_df.to_excel(writer, sheet_name='탭 요약', index=False)
-                    section_df.to_excel(writer, sheet_name='섹션 정보', index=False)
-                    content_df.to_excel(writer, sheet_name='인기글 컨텐츠', index=False)
-                    type_counts.to_excel(writer, sheet_name='컨텐츠 유형 통계', index=False)
-                    section_counts.to_excel(writer, sheet_name='섹션 통계', index=False)
+                if cancelled():
+                    return
+                canonical, is_new = keyword_index.add(keyword)
+                yield keyword, canonical, is_new
+        
+        if self.tabs > 1 and hasattr(self, 'driver'):
+            if self.tab_pool is None:
+                self.tab_pool = TabPool(self.driver, self.tabs, load_wait=SERP_LOAD_WAIT)
+            # 새 검색어만 탭에 배정하고, 중복 키워드는 순서만 유지
+            loaded_entries = self.tab_pool.prefetch(
+                (entry, build_search_url(entry[1]) if entry[2] else None) for entry in entries())
+        else:
+            loaded_entries = ((entry, False) for entry in entries())
+        
+        for (keyword, canonical, is_new), loaded in loaded_entries:
+            if cancelled():
+                break
+            
+            if progress:
+                progress.start_keyword(keyword)
+            
+            if not is_new and canonical in recent_results:
+                # 표기만 다른 중복 키워드는 기존 결과를 재사용
+                logger.info(f"'{keyword}' 키워드는 '{canonical}'와 같은 검색어로 기존 결과를 재사용합니다.")
+                recent_results.move_to_end(canonical)
+                yield rebind_keyword_result(recent_results[canonical], keyword)
+            else:
+                logger.info(f"\n{'='*50}\n검색 키워드: {canonical}\n{'='*50}")
+                started = time.perf_counter()
+                result = self.analyze_search_result(canonical, fingerprint_store, loaded)
+                if self.watchdog is not None:
+                    result = self.check_driver(canonical, result, started, fingerprint_store)
+                # 드라이버를 다시 시작해 다시 분석했으면 마지막 결과만 집계
+                if result["오류"]:
+                    metrics.KEYWORDS_FAILED.inc()
+                else:
+                    metrics.KEYWORDS_DONE.inc()
+                keyword_result = self.build_keyword_result(canonical, result, omit_unchanged)
+                recent_results[canonical] = keyword_result
+                if len(recent_results) > DUPLICATE_RESULT_CACHE_SIZE:
+                    recent_results.popitem(last=False)
+                yield rebind_keyword_result(keyword_result, keyword)
+            
+            if progress:
+                progress.finish_keyword()
+    
+    def build_keyword_result(self, keyword, result, omit_unchanged=False):
+        """
+        analyze_search_result 결과를 원본 키워드 기준의 결과 레코드로 변환
+        
+        Args:
+            keyword (str): 원본 키워드 표기
+            result (dict): analyze_search_result 결과
+            omit_unchanged (bool): 변경_상태가 "동일"이면 컨텐츠 항목을 비움
+        
+        Returns:
+            KeywordResult: (SummaryRecord, SectionRankRecord, ContentItem 목록)
+        """
+        summary = SummaryRecord(
+            keyword,
+            result["검색_URL"],
+            result["인기글_탭_존재"],
+            ", ".join(result["인기글_탭_제목"]) if result["인기글_탭_제목"] else "",
+            intern_text(result["첫번째_섹션"]) if not result["인기글_탭_존재"] else "",
+            result["변경_상태"]
+        )
+        sections = SectionRankRecord.create(keyword, result["모든_섹션"])
+        
+        if omit_unchanged and result["변경_상태"] == STATUS_UNCHANGED:
+            return KeywordResult(summary, sections, [])
+        
+        # 컨텐츠 항목은 분석 시점에 만든 레코드를 그대로 쓰고, 표기만 다른 중복 키워드일 때만 키워드를 바꾼다
+        contents = [
+            item if item.keyword == keyword else item._replace(keyword=keyword)
+            for item in result["인기글_컨텐츠"]
+        ]
+        
+        return KeywordResult(summary, sections, contents)
+    
+    def process_keyword_list(self, input_file, output_file, keyword_column=None, keyword_index=None,
+                             on_result=None, progress_callback=None, cancel_event=None,
+                             fingerprint_store=None, omit_unchanged=False):
+        """
+        키워드 파일(또는 키워드 목록)을 처리하고 결과를 CSV 및 엑셀로 저장
+        
+        analyze_keywords의 결과를 CSV, 엑셀, 콜백 싱크에 키워드마다 바로 기록한다.
+        
+        Args:
+            input_file (str|list): 키워드 파일 경로 (.xlsx, .xls, .csv) 또는 키워드 목록
+            output_file (str): 결과를 저장할 파일 경로 (확장자 제외)
+            keyword_column (str|int, optional): 키워드 열 이름 또는 번호 (기본값: 'keyword' 또는 '키워드')
+            keyword_index (KeywordIndex, optional): 키워드 정규형 색인 (없으면 메모리 색인 사용)
+            on_result (callable, optional): 키워드 처리가 끝날 때마다 (요약 레코드, 섹션 순위 레코드, 컨텐츠 항목 목록)으로 호출
+            progress_callback (callable, optional): 진행 상황(CrawlProgress.snapshot())을 받을 콜백
+            cancel_event (threading.Event, optional): 설정되면 현재 키워드까지만 처리하고 결과를 저장한 뒤 종료
+            fingerprint_store (FingerprintStore, optional): 검색 결과 지문 저장소 (변경 감지 모드)
+            omit_unchanged (bool): 검색 결과가 이전 실행과 같은 키워드는 컨텐츠 행을 생략
+        """
+        if keyword_index is None:
+            keyword_index = KeywordIndex()
+        
+        output_base = os.path.splitext(output_file)[0]
+        progress = None
+        sinks = []
+        
+        try:
+            # 키워드 파일 스트리밍 (형식과 키워드 열은 여기서 바로 확인)
+            if isinstance(input_file, str):
+                keywords = iter_keywords(input_file, column=keyword_column)
+                total = count_keywords(input_file)
             else:
-                # 빈 컨텐츠인 경우도 엑셀 파일 저장
-                with pd.ExcelWriter(f"{output_base}.xlsx") as writer:
-                    all_df.to_excel(writer, sheet_name='탭 요약', index=False)
-                    section_df.to_excel(writer, sheet_name='섹션 정보', index=False)
-                    pd.DataFrame(columns=["키워드", "검색_URL", "섹션", "순번", "컨텐츠_유형", "제목", "게시처", "아이디", "작성일", "조회수", "URL"]).to_excel(writer, sheet_name='인기글 컨텐츠', index=False)
+                keywords = input_file
+                total = len(input_file) if hasattr(input_file, '__len__') else None
+            
+            if progress_callback:
+                progress = CrawlProgress(total=total, callback=progress_callback)
+                self.timer.listener = progress.set_stage
             
+            sinks = [CsvSink(output_base), ExcelSink(output_base)]
+            if on_result:
+                sinks.append(CallbackSink(on_result))
+            
+            results = self.analyze_keywords(keywords, keyword_index, progress, cancel_event,
+                                            fingerprint_store, omit_unchanged)
+            for result in results:
+                with self.timer.run_stage("export"):
+                    for sink in sinks:
+                        sink.write(result)
+            
+            if progress:
+                progress.set_stage("export")
+            
+            with self.timer.run_stage("export"):
+                close_sinks(sinks)
             logger.info(f"결과가 {output_base}_summary.csv, {output_base}_sections.csv, {output_base}_contents.csv, {output_base}.xlsx에 저장되었습니다.")
             
+            # 단계별 소요 시간 저장 및 성능 보고서 출력
+            self.timer.write_csv(f"{output_base}_timings.csv")
+            for line in self.timer.summary_lines():
+                logger.info(line)
+            if self.watchdog is not None and self.watchdog.recycles:
+                logger.info(f"웹드라이버 재시작: {self.watchdog.recycles}회")
+            
         except Exception as e:
             logger.error(f"키워드 처리 중 오류 발생: {str(e)}")
+            try:
+                close_sinks(sinks)
+            except Exception as close_error:
+                logger.warning(f"결과 파일 저장 중 오류 발생: {close_error}")
         finally:
+            self.timer.listener = None
+            if fingerprint_store is not None:
+                try:
+                    fingerprint_store.save()
+                except OSError as e:
+                    logger.warning(f"검색 결과 지문 저장 중 오류 발생: {e}")
             self.close()
     
     def close(self):
         """드라이버 종료"""
+        self.tab_pool = None
+        if self.detail_fetcher is not None:
+            self.detail_fetcher.close()
+        self.url_canonicalizer.close()
         if hasattr(self, 'driver'):
             self.driver.quit()
+            del self.driver
+            metrics.ACTIVE_DRIVERS.dec()
             logger.info("웹드라이버가 종료되었습니다.")
 
+def rebind_keyword_result(result, keyword):
+    """
+    결과 레코드의 키워드를 다른 표기로 변경 (같은 표기면 그대로 반환)
+    
+    Args:
+        result (KeywordResult): 정규형 기준 결과
+        keyword (str): 원본 키워드 표기
+    
+    Returns:
+        KeywordResult: keyword 기준 결과
+    """
+    if result.summary.keyword == keyword:
+        return result
+    return KeywordResult(
+        result.summary._replace(keyword=keyword),
+        result.sections._replace(keyword=keyword),
+        [item._replace(keyword=keyword) for item in result.contents]
+    )
+
+def run_crawler(keyword, sections=None, ranks=None, crawler=None, headless=True):
+    """
+    키워드 하나를 크롤링해 지정한 섹션과 순위의 콘텐츠 행 반환 (라이브러리용 API)
+    
+    Args:
+        keyword (str): 검색 키워드
+        sections (list, optional): 섹션 제목 필터 (예: ["인기글", "VIEW"]). 지정하지 않으면 인기글 섹션
+        ranks (int|list, optional): 추출할 순위 목록 (예: [1, 2, 3]) 또는 최대 순위
+        crawler (NaverSearchCrawler, optional): 재사용할 크롤러. 넘기면 호출 후에도 닫지 않는다.
+        headless (bool): 새 크롤러를 만들 때 헤드리스 모드로 실행할지 여부
+    
+    Returns:
+        list: 키워드, 검색_URL, 섹션, 순번, 컨텐츠_유형, 제목, 게시처, 아이디, 작성일, 조회수, URL 행 목록
+    """
+    owns_crawler = crawler is None
+    if owns_crawler:
+        crawler = NaverSearchCrawler(headless=headless)
+    
+    try:
+        return [item.as_dict() for item in crawler.crawl_keyword(keyword, sections, ranks)]
+    finally:
+        if owns_crawler:
+            crawler.close()
+
 def main():
     parser = argparse.ArgumentParser(description='네이버 검색 결과 크롤러 (URL 분석 기능 추가)')
     parser.add_argument('--input', '-i', type=str, required=True, help='키워드 목록이 있는 파일 경로 (.xlsx, .xls, .csv)')
     parser.add_argument('--output', '-o', type=str, default='naver_search_results', help='결과를 저장할 파일 경로 (확장자 제외)')
     parser.add_argument('--visible', '-v', action='store_true', help='브라우저를 화면에 표시합니다')
+    parser.add_argument('--column', '-c', type=str, default=None, help="키워드 열 이름 또는 번호 (기본값: 'keyword' 또는 '키워드')")
+    parser.add_argument('--extraction', choices=EXTRACTION_MODES, default='webdriver', help='검색 결과 추출 방식 (webdriver: 섹션별 웹드라이버 호출, script: 키워드마다 자바스크립트 한 번으로 추출, 기본값: webdriver)')
+    parser.add_argument('--tabs', type=int, default=1, help='한 Chrome에서 검색 결과를 동시에 로딩할 탭 수 (기본값: 1)')
+    parser.add_argument('--recycle-every', type=int, default=None, help='웹드라이버 하나로 처리할 최대 키워드 수 (넘으면 다시 시작)')
+    parser.add_argument('--max-browser-mb', type=float, default=None, help='브라우저 프로세스 메모리 한도 (MB, 넘으면 웹드라이버 다시 시작)')
+    parser.add_argument('--max-keyword-seconds', type=float, default=None, help='최근 키워드 처리 시간 중앙값 한도 (초, 넘으면 웹드라이버 다시 시작)')
+    parser.add_argument('--no-detail-enrichment', action='store_true', help='블로그, 포스트, 지식iN 상세 페이지로 작성일/조회수를 보강하지 않습니다')
+    parser.add_argument('--detail-workers', type=int, default=4, help='상세 페이지 최대 동시 요청 수 (기본값: 4)')
+    parser.add_argument('--detail-timeout', type=float, default=5.0, help='상세 페이지 연결/읽기 시간 제한 (초, 기본값: 5)')
+    parser.add_argument('--resolve-redirects', action='store_true', help='쿼리에 최종 주소가 없는 광고/단축 URL에 HEAD 요청을 보내 최종 주소를 확인합니다 (광고 클릭으로 집계될 수 있음)')
+    parser.add_argument('--redirect-cache', type=str, default=None, help='리다이렉트 결과를 저장할 JSON 파일 경로 (여러 실행에서 재사용)')
+    parser.add_argument('--fingerprints', type=str, default=None, help='검색 결과 지문을 저장할 JSON 파일 경로 (변경 감지 모드, 결과가 같은 키워드는 보강 정보를 재사용)')
+    parser.add_argument('--omit-unchanged', action='store_true', help='변경 감지 모드에서 결과가 이전 실행과 같은 키워드의 컨텐츠 행을 생략합니다')
+    parser.add_argument('--metrics-file', type=str, default=None, help='Prometheus textfile collector용 지표 파일 경로 (.prom)')
+    parser.add_argument('--metrics-interval', type=float, default=15, help='지표 파일 기록 주기 (초, 기본값: 15)')
+    parser.add_argument('--metrics-port', type=int, default=None, help='로컬 /metrics, /metrics.json 엔드포인트 포트')
+    parser.add_argument('--profile', action='store_true', help='작업 전체를 프로파일링하여 결과 파일 옆에 .prof와 보고서를 저장합니다')
+    parser.add_argument('--profiler', choices=PROFILERS, default='cprofile', help='프로파일러 종류 (sampling은 pyinstrument 필요, 기본값: cprofile)')
+    parser.add_argument('--profile-top', type=int, default=40, help='프로파일 보고서에 표시할 함수 수 (기본값: 40)')
     
     args = parser.parse_args()
     
-    crawler = NaverSearchCrawler(headless=not args.visible)
-    crawler.process_keyword_list(args.input, args.output)
+    if args.omit_unchanged and not args.fingerprints:
+        parser.error("--omit-unchanged는 --fingerprints와 함께 사용해야 합니다.")
+    
+    setup_logging()
+    
+    exporter = metrics.TextfileExporter(args.metrics_file, args.metrics_interval).start() if args.metrics_file else None
+    server = metrics.serve_metrics(args.metrics_port) if args.metrics_port else None
+    
+    def crawl():
+        watchdog = DriverWatchdog(args.recycle_every, args.max_browser_mb, args.max_keyword_seconds)
+        crawler = NaverSearchCrawler(headless=not args.visible, extraction=args.extraction, tabs=args.tabs,
+                                     watchdog=watchdog, enrich_details=not args.no_detail_enrichment,
+                                     detail_workers=args.detail_workers, detail_timeout=args.detail_timeout,
+                                     resolve_redirects=args.resolve_redirects, redirect_cache=args.redirect_cache)
+        crawler.process_keyword_list(
+            args.input,
+            args.output,
+            keyword_column=args.column,
+            fingerprint_store=FingerprintStore(args.fingerprints) if args.fingerprints else None,
+            omit_unchanged=args.omit_unchanged
+        )
+    
+    try:
+        if args.profile:
+            run_with_profile(crawl, os.path.splitext(args.output)[0], profiler=args.profiler, top_n=args.profile_top)
+        else:
+            crawl()
+    finally:
+        if exporter:
+            exporter.stop()
+        if server:
+            server.shutdown()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 단계별 시간 측정
+
+단조 증가 타이머(time.perf_counter)로 키워드별 단계 소요 시간을 기록하고,
+실행이 끝나면 단계별 p50/p95/최대값과 분당 키워드 처리량을 보고한다.
+단계가 중첩되면(예: 콘텐츠 추출 중 카페 상세 조회) 바깥 단계에는
+안쪽 단계를 뺀 순수 시간만 기록한다.
+"""
+
+import csv
+import math
+import time
+from contextlib import contextmanager
+
+
+def percentile(sorted_values, ratio):
+    """
+    정렬된 값 목록에서 백분위수 계산 (최근접 순위 방식)
+
+    Args:
+        sorted_values (list): 오름차순으로 정렬된 값 목록
+        ratio (float): 0~1 사이의 비율 (예: 0.95)
+
+    Returns:
+        float: 백분위수 값 (목록이 비어 있으면 0.0)
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(ratio * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class StageTimer:
+    def __init__(self, listener=None):
+        """
+        단계별 타이머 초기화
+
+        Args:
+            listener (callable, optional): 단계가 시작될 때마다 단계 이름으로 호출 (진행률 표시용)
+        """
+        self.listener = listener
+        self.stages = []        # 기록된 단계 이름 (처음 나온 순서)
+        self.records = []       # 키워드별 {"키워드": ..., 단계: 초}
+        self.run_stages = {}    # 키워드와 무관한 단계 (예: 내보내기)
+        self._current = None
+        self._stack = []
+        self._first_start = None
+        self._last_end = None
+
+    def start_keyword(self, keyword):
+        """키워드 측정 시작"""
+        now = time.perf_counter()
+        if self._first_start is None:
+            self._first_start = now
+        self._current = {"키워드": keyword}
+        self._stack = []
+
+    def end_keyword(self):
+        """키워드 측정 종료"""
+        if self._current is None:
+            return
+        self._last_end = time.perf_counter()
+        self.records.append(self._current)
+        self._current = None
+        self._stack = []
+
+    def _add(self, target, name, elapsed):
+        if name not in self.stages:
+            self.stages.append(name)
+        target[name] = target.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def stage(self, name):
+        """
+        현재 키워드의 단계 시간 측정
+
+        Args:
+            name (str): 단계 이름
+        """
+        if self._current is None:
+            yield
+            return
+
+        if name not in self.stages:
+            self.stages.append(name)
+        if self.listener:
+            self.listener(name)
+        frame = [time.perf_counter(), 0.0]  # [시작 시각, 하위 단계 소요 시간]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            total = time.perf_counter() - frame[0]
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += total
+            if self._current is not None:
+                self._add(self._current, name, total - frame[1])
+
+    @contextmanager
+    def run_stage(self, name):
+        """
+        키워드와 무관한 실행 단계 시간 측정 (예: 결과 내보내기)
+
+        Args:
+            name (str): 단계 이름
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(self.run_stages, name, time.perf_counter() - started)
+
+    def keywords_per_minute(self):
+        """분당 키워드 처리량"""
+        if not self.records or self._first_start is None or self._last_end is None:
+            return 0.0
+        elapsed = self._last_end - self._first_start
+        if elapsed <= 0:
+            return 0.0
+        return len(self.records) / elapsed * 60
+
+    def write_csv(self, path):
+        """
+        키워드별 단계 소요 시간을 CSV로 저장
+
+        Args:
+            path (str): 저장할 CSV 파일 경로
+        """
+        keyword_stages = [name for name in self.stages if any(name in record for record in self.records)]
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(["키워드"] + keyword_stages + ["합계"])
+            for record in self.records:
+                values = [record.get(name, 0.0) for name in keyword_stages]
+                writer.writerow([record["키워드"]] + [f"{value:.4f}" for value in values] + [f"{sum(values):.4f}"])
+
+    def summary_lines(self):
+        """
+        실행 성능 보고서 생성
+
+        Returns:
+            list: 보고서 각 줄의 문자열 목록
+        """
+        lines = [f"성능 보고서: 키워드 {len(self.records)}개, 분당 {self.keywords_per_minute():.1f}개 처리"]
+        lines.append(f"{'단계':<28}{'p50(초)':>10}{'p95(초)':>10}{'최대(초)':>10}{'합계(초)':>10}")
+
+        for name in self.stages:
+            values = sorted(record[name] for record in self.records if name in record)
+            if not values:
+                continue
+            lines.append(
+                f"{name:<28}{percentile(values, 0.5):>10.3f}{percentile(values, 0.95):>10.3f}"
+                f"{values[-1]:>10.3f}{sum(values):>10.3f}"
+            )
+
+        for name, elapsed in self.run_stages.items():
+            lines.append(f"{name:<28}{'':>10}{'':>10}{'':>10}{elapsed:>10.3f}")
+
+        return lines
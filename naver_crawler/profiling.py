@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 실행 프로파일링
+
+작업 전체를 cProfile(기본값) 또는 샘플링 프로파일러(pyinstrument가 설치된 경우)로
+실행하고, 결과 파일 옆에 프로파일 데이터와 상위 N개 함수 보고서를 저장한다.
+프로파일링을 켜지 않으면 이 모듈은 작업에 전혀 관여하지 않는다.
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_N = 40
+
+PROFILERS = ('cprofile', 'sampling')
+
+
+def sampling_profiler_available():
+    """샘플링 프로파일러(pyinstrument) 설치 여부"""
+    try:
+        import pyinstrument  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _run_cprofile(func, output_base, top_n):
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        prof_path = f"{output_base}.prof"
+        report_path = f"{output_base}_profile.txt"
+        profiler.dump_stats(prof_path)
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.strip_dirs()
+        stream.write(f"=== 누적 시간 상위 {top_n}개 함수 ===\n")
+        stats.sort_stats('cumulative').print_stats(top_n)
+        stream.write(f"\n=== 자체 시간 상위 {top_n}개 함수 ===\n")
+        stats.sort_stats('tottime').print_stats(top_n)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(stream.getvalue())
+
+        logger.info(f"프로파일 저장: {prof_path}, {report_path}")
+
+
+def _run_sampling(func, output_base):
+    from pyinstrument import Profiler
+
+    profiler = Profiler()
+    profiler.start()
+    try:
+        return func()
+    finally:
+        profiler.stop()
+        report_path = f"{output_base}_profile.txt"
+        html_path = f"{output_base}_profile.html"
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(profiler.output_text(unicode=True, color=False))
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(profiler.output_html())
+
+        logger.info(f"프로파일 저장: {report_path}, {html_path}")
+
+
+def run_with_profile(func, output_base, profiler='cprofile', top_n=DEFAULT_TOP_N):
+    """
+    함수를 프로파일러로 실행하고 결과 파일 저장
+
+    cprofile: {output_base}.prof (pstats/snakeviz용)와 {output_base}_profile.txt
+    sampling: {output_base}_profile.txt와 {output_base}_profile.html
+    샘플링 프로파일러가 설치되어 있지 않으면 cProfile을 사용한다.
+
+    Args:
+        func (callable): 인자 없이 호출할 작업
+        output_base (str): 확장자를 제외한 결과 파일 경로
+        profiler (str): 'cprofile' 또는 'sampling'
+        top_n (int): 보고서에 표시할 함수 수
+
+    Returns:
+        func의 반환값
+    """
+    if profiler == 'sampling':
+        if sampling_profiler_available():
+            return _run_sampling(func, output_base)
+        logger.warning("샘플링 프로파일러(pyinstrument)가 설치되어 있지 않아 cProfile을 사용합니다.")
+
+    return _run_cprofile(func, output_base, top_n)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 진행 상황 추적
+
+처리한 키워드 수, 현재 키워드와 단계, 최근 키워드 기준의 처리 속도,
+남은 예상 시간을 계산해 콜백으로 전달한다. GUI 진행률 표시줄과
+상태 표시줄이 이 값을 사용한다.
+"""
+
+import time
+from collections import deque
+
+
+def format_duration(seconds):
+    """초를 '1시간 5분', '3분 20초' 형식으로 변환"""
+    if seconds is None:
+        return "계산 중"
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
+
+
+class CrawlProgress:
+    def __init__(self, total=None, callback=None, window=20):
+        """
+        진행 상황 추적기 초기화
+
+        Args:
+            total (int, optional): 전체 키워드 수 (모르면 None)
+            callback (callable, optional): 상태가 바뀔 때마다 snapshot()으로 호출
+            window (int): 처리 속도 계산에 사용할 최근 키워드 수
+        """
+        self.total = total
+        self.callback = callback
+        self.done = 0
+        self.keyword = ""
+        self.stage = ""
+        self.started = time.monotonic()
+        self._finished_at = deque(maxlen=window + 1)
+        self._finished_at.append(self.started)
+
+    def start_keyword(self, keyword):
+        """키워드 처리 시작"""
+        self.keyword = keyword
+        self.stage = "시작"
+        self._emit()
+
+    def set_stage(self, stage):
+        """현재 단계 변경"""
+        self.stage = stage
+        self._emit()
+
+    def finish_keyword(self):
+        """키워드 처리 완료"""
+        self.done += 1
+        self.stage = "완료"
+        self._finished_at.append(time.monotonic())
+        self._emit()
+
+    def rate(self):
+        """최근 키워드 기준 분당 처리 속도"""
+        if len(self._finished_at) < 2:
+            return 0.0
+        elapsed = self._finished_at[-1] - self._finished_at[0]
+        if elapsed <= 0:
+            return 0.0
+        return (len(self._finished_at) - 1) / elapsed * 60
+
+    def eta(self):
+        """남은 예상 시간 (초, 계산할 수 없으면 None)"""
+        rate = self.rate()
+        if not self.total or rate <= 0:
+            return None
+        return max(0, self.total - self.done) / rate * 60
+
+    def snapshot(self):
+        """현재 진행 상황"""
+        return {
+            "done": self.done,
+            "total": self.total,
+            "keyword": self.keyword,
+            "stage": self.stage,
+            "rate": self.rate(),
+            "eta": self.eta(),
+            "elapsed": time.monotonic() - self.started,
+        }
+
+    def _emit(self):
+        if self.callback:
+            self.callback(self.snapshot())
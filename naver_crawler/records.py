@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 결과 레코드
+
+요약, 섹션 순위, 컨텐츠 항목을 한글 키 딕셔너리 대신 필드 순서가 고정된
+튜플 레코드로 보관한다. 필드 순서는 결과 파일의 열 순서와 같으므로 내보낼 때는
+레코드를 그대로 한 행으로 쓰고, 한글 열 이름은 내보내기(CSV/엑셀/딕셔너리 변환)
+단계에서만 붙인다. 컨텐츠 유형과 섹션 제목처럼 값의 종류가 적은 필드는
+sys.intern으로 같은 문자열 객체를 공유한다.
+"""
+
+import sys
+from collections import namedtuple
+
+SUMMARY_COLUMNS = ("키워드", "검색_URL", "인기글_탭_존재", "인기글_탭_제목", "첫번째_섹션", "변경_상태")
+
+# 섹션 정보는 최대 10순위까지 기록
+MAX_SECTION_RANK = 10
+SECTION_COLUMNS = ("키워드",) + tuple(f"{idx}순위" for idx in range(1, MAX_SECTION_RANK + 1))
+
+CONTENT_COLUMNS = ("키워드", "검색_URL", "섹션", "순번", "컨텐츠_유형", "제목", "게시처", "아이디", "작성일", "조회수", "URL",
+                   "정규화_URL")
+
+
+def intern_text(value):
+    """값의 종류가 적은 문자열 필드를 intern (문자열이 아니면 그대로 반환)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class SummaryRecord(namedtuple("SummaryRecord", ["keyword", "search_url", "popular_exists", "popular_titles", "first_section",
+                                                 "status"], defaults=("",))):
+    """키워드별 인기글 탭 요약 (열: SUMMARY_COLUMNS, status는 변경 감지 모드의 신규/변경/동일)"""
+    __slots__ = ()
+    COLUMNS = SUMMARY_COLUMNS
+
+    def as_row(self):
+        """내보내기용 값 목록 (COLUMNS 순서)"""
+        return list(self)
+
+    def as_dict(self):
+        """한글 열 이름 딕셔너리로 변환"""
+        return dict(zip(self.COLUMNS, self))
+
+    @classmethod
+    def from_dict(cls, row):
+        """한글 열 이름 딕셔너리(결과 파일 행)에서 생성"""
+        popular_exists = row.get("인기글_탭_존재", False)
+        if isinstance(popular_exists, str):
+            popular_exists = popular_exists.strip().lower() in ("true", "1", "있음")
+        status = row.get("변경_상태", "")
+        return cls(
+            row.get("키워드", ""),
+            row.get("검색_URL", ""),
+            bool(popular_exists),
+            row.get("인기글_탭_제목", ""),
+            intern_text(row.get("첫번째_섹션", "")),
+            intern_text(status if isinstance(status, str) else "")
+        )
+
+
+class SectionRankRecord(namedtuple("SectionRankRecord", ["keyword", "titles"])):
+    """키워드별 섹션 순위 (titles는 1순위부터의 섹션 제목 튜플, 열: SECTION_COLUMNS)"""
+    __slots__ = ()
+    COLUMNS = SECTION_COLUMNS
+
+    @classmethod
+    def create(cls, keyword, titles):
+        """섹션 제목 목록에서 최대 10순위까지 생성"""
+        return cls(keyword, tuple(intern_text(title) for title in titles[:MAX_SECTION_RANK]))
+
+    def as_row(self):
+        """내보내기용 값 목록 (빈 순위는 빈 문자열)"""
+        return [self.keyword] + list(self.titles) + [""] * (MAX_SECTION_RANK - len(self.titles))
+
+    def as_dict(self):
+        """한글 열 이름 딕셔너리로 변환 (있는 순위만 포함)"""
+        row = {"키워드": self.keyword}
+        for idx, title in enumerate(self.titles, 1):
+            row[f"{idx}순위"] = title
+        return row
+
+    @classmethod
+    def from_dict(cls, row):
+        """한글 열 이름 딕셔너리(결과 파일 행)에서 생성"""
+        titles = []
+        for column in SECTION_COLUMNS[1:]:
+            title = row.get(column, "")
+            if title is None or title == "":
+                break
+            titles.append(title)
+        return cls.create(row.get("키워드", ""), titles)
+
+
+class ContentItem(namedtuple("ContentItem", ["keyword", "search_url", "section", "rank", "content_type",
+                                             "title", "publisher", "user_id", "date", "view_count", "url",
+                                             "canonical_url"], defaults=("",))):
+    """인기글 컨텐츠 항목 (열: CONTENT_COLUMNS, canonical_url은 리다이렉트/추적 파라미터를 정리한 URL)"""
+    __slots__ = ()
+    COLUMNS = CONTENT_COLUMNS
+
+    @property
+    def key_url(self):
+        """같은 페이지 비교용 URL (정규화 URL이 없으면 원본 URL)"""
+        return self.canonical_url or self.url
+
+    def as_row(self):
+        """내보내기용 값 목록 (COLUMNS 순서)"""
+        return list(self)
+
+    def as_dict(self):
+        """한글 열 이름 딕셔너리로 변환"""
+        return dict(zip(self.COLUMNS, self))
+
+    @classmethod
+    def from_dict(cls, row):
+        """한글 열 이름 딕셔너리(결과 파일 행)에서 생성"""
+        rank = row.get("순번", 0)
+        canonical_url = row.get("정규화_URL", "")
+        try:
+            rank = int(rank)
+        except (TypeError, ValueError):
+            pass
+        return cls(
+            row.get("키워드", ""),
+            row.get("검색_URL", ""),
+            intern_text(row.get("섹션", "")),
+            rank,
+            intern_text(row.get("컨텐츠_유형", "")),
+            row.get("제목", ""),
+            row.get("게시처", ""),
+            row.get("아이디", ""),
+            row.get("작성일", ""),
+            row.get("조회수", ""),
+            row.get("URL", ""),
+            canonical_url if isinstance(canonical_url, str) else ""
+        )
+
+
+# 키워드 하나의 분석 결과 (SummaryRecord, SectionRankRecord, ContentItem 목록)
+KeywordResult = namedtuple("KeywordResult", ["summary", "sections", "contents"])
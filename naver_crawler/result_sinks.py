@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+키워드 분석 결과 싱크
+
+NaverSearchCrawler.analyze_keywords()가 키워드마다 내보내는 KeywordResult를
+받아 CSV, 엑셀, 콜백 등으로 전달한다. 레코드(records 모듈)는 여기서 처음으로
+한글 열 이름이 붙은 행이 된다. 싱크는 결과가 나오는 즉시 한 줄씩
+기록하므로 키워드 수와 관계없이 메모리 사용량이 일정하며, 여러 싱크를
+함께 연결해 사용할 수 있다.
+
+사용 예:
+    with CsvSink("results") as csv_sink, ExcelSink("results") as excel_sink:
+        for result in crawler.analyze_keywords(keywords):
+            csv_sink.write(result)
+            excel_sink.write(result)
+"""
+
+import csv
+from collections import Counter
+
+import metrics
+from records import SUMMARY_COLUMNS, SECTION_COLUMNS, CONTENT_COLUMNS
+from value_normalizer import NORMALIZED_COLUMNS, normalized_content_rows
+
+# 결과 파일의 컨텐츠 열 (레코드 필드 + 정규화 열)
+CONTENT_EXPORT_COLUMNS = CONTENT_COLUMNS + NORMALIZED_COLUMNS
+
+
+class ResultSink:
+    """결과 싱크 기본 클래스 (필요한 메서드만 재정의)"""
+
+    def write_summary(self, record):
+        """요약 레코드 기록 (SummaryRecord)"""
+
+    def write_sections(self, record):
+        """섹션 순위 레코드 기록 (SectionRankRecord)"""
+
+    def write_contents(self, items):
+        """컨텐츠 항목 목록 기록 (ContentItem 목록)"""
+
+    def write(self, result):
+        """
+        키워드 하나의 결과 기록
+
+        Args:
+            result (KeywordResult): 요약 레코드, 섹션 순위 레코드, 컨텐츠 항목 목록
+        """
+        self.write_summary(result.summary)
+        self.write_sections(result.sections)
+        self.write_contents(result.contents)
+
+    def close(self):
+        """싱크 종료 (파일 닫기 등)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class CsvSink(ResultSink):
+    def __init__(self, output_base, crawled_at=None):
+        """
+        결과를 {output_base}_summary.csv, _sections.csv, _contents.csv에 바로바로 기록
+
+        컨텐츠 파일은 첫 컨텐츠 행이 나올 때 만든다.
+
+        Args:
+            output_base (str): 확장자를 제외한 출력 파일 경로
+            crawled_at (datetime, optional): 상대 작성일("3주 전")의 기준 시각 (기본값: 행을 기록하는 시각)
+        """
+        self.output_base = output_base
+        self.crawled_at = crawled_at
+        self._files = []
+        self._summary_writer = self._open("summary", SUMMARY_COLUMNS)
+        self._section_writer = self._open("sections", SECTION_COLUMNS)
+        self._content_writer = None
+
+    def _open(self, suffix, columns):
+        f = open(f"{self.output_base}_{suffix}.csv", 'w', encoding='utf-8-sig', newline='')
+        self._files.append(f)
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        return writer
+
+    def write_summary(self, record):
+        self._summary_writer.writerow(record)
+        metrics.ROWS_WRITTEN.inc()
+
+    def write_sections(self, record):
+        self._section_writer.writerow(record.as_row())
+        metrics.ROWS_WRITTEN.inc()
+
+    def write_contents(self, items):
+        if not items:
+            return
+        if self._content_writer is None:
+            self._content_writer = self._open("contents", CONTENT_EXPORT_COLUMNS)
+        self._content_writer.writerows(normalized_content_rows(items, self.crawled_at))
+        metrics.ROWS_WRITTEN.inc(len(items))
+
+    def close(self):
+        for f in self._files:
+            f.close()
+        self._files = []
+
+
+class ExcelSink(ResultSink):
+    def __init__(self, output_base, crawled_at=None):
+        """
+        결과를 {output_base}.xlsx에 기록 (openpyxl 쓰기 전용 모드)
+
+        행은 임시 파일로 바로 흘려보내고, 컨텐츠 유형/섹션 통계는 개수만 누적했다가
+        종료할 때 시트로 추가한다. 정규화 열은 엑셀 날짜/숫자 셀로 기록한다.
+
+        Args:
+            output_base (str): 확장자를 제외한 출력 파일 경로
+            crawled_at (datetime, optional): 상대 작성일("3주 전")의 기준 시각 (기본값: 행을 기록하는 시각)
+        """
+        from openpyxl import Workbook
+
+        self.path = f"{output_base}.xlsx"
+        self.crawled_at = crawled_at
+        self.workbook = Workbook(write_only=True)
+        self.summary_sheet = self._create_sheet('탭 요약', SUMMARY_COLUMNS)
+        self.section_sheet = self._create_sheet('섹션 정보', SECTION_COLUMNS)
+        self.content_sheet = self._create_sheet('인기글 컨텐츠', CONTENT_EXPORT_COLUMNS)
+        self.type_counts = Counter()
+        self.section_counts = Counter()
+        self._closed = False
+
+    def _create_sheet(self, title, columns):
+        sheet = self.workbook.create_sheet(title)
+        sheet.append(columns)
+        return sheet
+
+    def write_summary(self, record):
+        self.summary_sheet.append(record.as_row())
+
+    def write_sections(self, record):
+        self.section_sheet.append(record.as_row())
+
+    def write_contents(self, items):
+        for item, row in zip(items, normalized_content_rows(items, self.crawled_at, date_format=None)):
+            self.content_sheet.append(row)
+            self.type_counts[item.content_type] += 1
+            self.section_counts[item.section] += 1
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+
+        # 컨텐츠가 있을 때만 통계 시트 추가
+        if self.type_counts:
+            for title, column, counts in (('컨텐츠 유형 통계', '컨텐츠_유형', self.type_counts),
+                                          ('섹션 통계', '섹션', self.section_counts)):
+                sheet = self.workbook.create_sheet(title)
+                sheet.append([column, '개수'])
+                for value, count in counts.most_common():
+                    sheet.append([value, count])
+
+        self.workbook.save(self.path)
+
+
+class CallbackSink(ResultSink):
+    def __init__(self, callback):
+        """
+        결과를 콜백으로 전달 (GUI 실시간 표시 등)
+
+        Args:
+            callback (callable): (요약 레코드, 섹션 순위 레코드, 컨텐츠 항목 목록)을 받는 함수
+        """
+        self.callback = callback
+
+    def write(self, result):
+        self.callback(result.summary, result.sections, result.contents)
+
+
+def close_sinks(sinks):
+    """모든 싱크 종료 (하나가 실패해도 나머지는 닫은 뒤 첫 오류를 다시 발생)"""
+    error = None
+    for sink in sinks:
+        try:
+            sink.close()
+        except Exception as e:
+            if error is None:
+                error = e
+    if error is not None:
+        raise error
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+두 실행 결과 비교 (실행 간 변경 사항)
+
+이전 실행과 이번 실행의 결과 파일을 비교해 인기글 컨텐츠 URL의 신규/제외/순위 변동,
+섹션 순위 열(_sections.csv)의 섹션 신규/제외/순위 변동, 인기글 탭 존재 여부 변경을
+찾는다. 키 열(예: 키워드, 섹션, URL)을 8바이트 해시로 바꿔 이전 실행만 색인하고
+이번 실행은 한 줄씩 읽으므로, 행 수에 비례하는 시간에 색인 크기만큼의 메모리로 동작한다.
+결과 행 자체는 메모리에 모으지 않는다.
+변경 감지 모드(--fingerprints)에서 이번 실행의 변경_상태가 "동일"인 키워드는 검색 결과가
+같으므로 컨텐츠 비교에서 제외한다 (--omit-unchanged로 컨텐츠 행을 생략해도 제외로 잡히지 않음).
+
+사용 예:
+    python run_diff.py results/naver_search_results_20240101_090000 results/naver_search_results_20240102_090000
+    python run_diff.py --latest results/ -o results/changes
+"""
+
+import argparse
+import csv
+import glob
+import hashlib
+import os
+import sys
+import time
+from collections import Counter
+
+from fingerprint_store import STATUS_UNCHANGED
+from records import SECTION_COLUMNS
+
+CHANGE_COLUMNS = ["구분", "변경_유형", "키워드", "섹션", "URL", "이전_순위", "현재_순위", "순위_변화", "제목"]
+
+ADDED = "신규"
+REMOVED = "제외"
+MOVED = "순위_변동"
+
+_MISSING = object()
+
+
+def key_hash(*values):
+    """키 열 값을 8바이트 해시(정수)로 변환"""
+    return int.from_bytes(hashlib.blake2b("\x1f".join(values).encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def resolve_run_base(path):
+    """결과 파일 경로 또는 확장자를 제외한 경로에서 실행 경로 구하기"""
+    for suffix in ("_summary.csv", "_sections.csv", "_contents.csv", ".xlsx"):
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+def latest_runs(directory, count=2):
+    """폴더에서 가장 최근 실행 경로 목록 (오래된 순)"""
+    summaries = sorted(glob.glob(os.path.join(directory, "*_summary.csv")), key=os.path.getmtime)
+    return [resolve_run_base(path) for path in summaries[-count:]]
+
+
+def _read_rows(path):
+    """CSV 행을 딕셔너리로 하나씩 읽기 (파일이 없으면 빈 반복)"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            yield row
+
+
+def _to_rank(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_content_keys(run_base):
+    """
+    컨텐츠 행을 (키 해시, 순위, 행 정보)로 반환
+
+    키는 (키워드, 섹션, URL)이며 행 정보는 (키워드, 섹션, URL, 제목)이다.
+    정규화_URL 열이 있으면 광고/추적 링크도 같은 페이지로 비교하도록 정규화 URL을 사용한다.
+    """
+    for row in _read_rows(f"{run_base}_contents.csv"):
+        keyword, section = row.get("키워드", ""), row.get("섹션", "")
+        url = row.get("정규화_URL") or row.get("URL", "")
+        yield key_hash(keyword, section, url), _to_rank(row.get("순번")), (keyword, section, url, row.get("제목", ""))
+
+
+def iter_section_keys(run_base):
+    """
+    섹션 순위 열을 (키 해시, 순위, 행 정보)로 반환
+
+    키는 (키워드, 섹션)이며 행 정보는 (키워드, 섹션, "", "")이다.
+    """
+    for row in _read_rows(f"{run_base}_sections.csv"):
+        keyword = row.get("키워드", "")
+        for rank, column in enumerate(SECTION_COLUMNS[1:], 1):
+            section = row.get(column) or ""
+            if section:
+                yield key_hash(keyword, section), rank, (keyword, section, "", "")
+
+
+def iter_popular_keys(run_base):
+    """
+    요약 행의 인기글 탭 존재 여부를 (키 해시, 존재 여부(1/0), 행 정보)로 반환
+    """
+    for row in _read_rows(f"{run_base}_summary.csv"):
+        keyword = row.get("키워드", "")
+        exists = 1 if str(row.get("인기글_탭_존재", "")).strip().lower() in ("true", "1") else 0
+        yield key_hash(keyword), exists, (keyword, "", "", row.get("인기글_탭_제목", ""))
+
+
+def unchanged_keywords(run_base):
+    """요약 파일에서 변경_상태가 "동일"인 키워드 집합"""
+    return {row.get("키워드", "") for row in _read_rows(f"{run_base}_summary.csv")
+            if row.get("변경_상태") == STATUS_UNCHANGED}
+
+
+def diff_keyed(iter_old, iter_new):
+    """
+    키 해시로 두 실행의 행 비교
+
+    이전 실행은 {키 해시: 순위}로만 색인하고, 이번 실행을 한 번 읽으며 신규/순위 변동을
+    내보낸 뒤, 남은 키만 이전 실행을 한 번 더 읽어 제외 행을 내보낸다.
+    같은 실행에 같은 키가 여러 번 나오면 첫 행을 사용한다.
+
+    Args:
+        iter_old (callable): 이전 실행의 (키 해시, 값, 행 정보) 이터레이터를 만드는 함수
+        iter_new (callable): 이번 실행의 (키 해시, 값, 행 정보) 이터레이터를 만드는 함수
+
+    Yields:
+        tuple: (변경 유형, 이전 값, 현재 값, 행 정보)
+    """
+    old_index = {}
+    for key, value, _ in iter_old():
+        old_index.setdefault(key, value)
+
+    seen = set()
+    for key, value, info in iter_new():
+        if key in seen:
+            continue
+        seen.add(key)
+        if key not in old_index:
+            yield ADDED, None, value, info
+            continue
+        old_value = old_index.pop(key)
+        if old_value != value:
+            yield MOVED, old_value, value, info
+
+    if old_index:
+        for key, value, info in iter_old():
+            if old_index.pop(key, _MISSING) is not _MISSING:
+                yield REMOVED, value, None, info
+
+
+def diff_runs(old_base, new_base, output_base):
+    """
+    두 실행을 비교해 변경 파일({output_base}_changes.csv)과 요약 파일({output_base}_diff_counts.csv) 저장
+
+    Args:
+        old_base (str): 이전 실행 결과 경로 (확장자 제외)
+        new_base (str): 이번 실행 결과 경로 (확장자 제외)
+        output_base (str): 출력 파일 경로 (확장자 제외)
+
+    Returns:
+        Counter: (구분, 변경 유형) -> 건수
+    """
+    counts = Counter()
+    unchanged = unchanged_keywords(new_base)
+    comparisons = (
+        ("컨텐츠", iter_content_keys),
+        ("섹션", iter_section_keys),
+        ("인기글_탭", iter_popular_keys),
+    )
+
+    with open(f"{output_base}_changes.csv", 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CHANGE_COLUMNS)
+
+        for category, iter_keys in comparisons:
+            changes = diff_keyed(lambda: iter_keys(old_base), lambda: iter_keys(new_base))
+            for change_type, old_value, new_value, (keyword, section, url, title) in changes:
+                if category == "컨텐츠" and keyword in unchanged:
+                    continue
+                if category == "인기글_탭":
+                    # 인기글 탭은 값이 존재 여부이므로 생김/사라짐으로 표시
+                    if change_type != MOVED:
+                        continue
+                    change_type = "생김" if new_value else "사라짐"
+                    old_value = new_value = None
+                shift = old_value - new_value if old_value is not None and new_value is not None else ""
+                writer.writerow([category, change_type, keyword, section, url,
+                                 "" if old_value is None else old_value,
+                                 "" if new_value is None else new_value,
+                                 shift, title])
+                counts[(category, change_type)] += 1
+
+    with open(f"{output_base}_diff_counts.csv", 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["구분", "변경_유형", "건수"])
+        for (category, change_type), count in sorted(counts.items()):
+            writer.writerow([category, change_type, count])
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='두 크롤링 실행 결과의 변경 사항 비교')
+    parser.add_argument('runs', nargs='*', help='이전 실행, 이번 실행 결과 경로 (확장자 제외 또는 _summary.csv 경로)')
+    parser.add_argument('--latest', type=str, default=None, help='폴더에서 가장 최근 두 실행을 비교')
+    parser.add_argument('--output', '-o', type=str, default=None, help='출력 파일 경로 (확장자 제외, 기본값: 이번 실행 경로)')
+
+    args = parser.parse_args()
+
+    if args.latest:
+        runs = latest_runs(args.latest)
+    else:
+        runs = [resolve_run_base(path) for path in args.runs]
+
+    if len(runs) != 2:
+        parser.error("비교할 실행 두 개를 지정하거나 --latest 폴더에 실행이 두 개 이상 있어야 합니다.")
+
+    old_base, new_base = runs
+    for run_base in runs:
+        if not os.path.exists(f"{run_base}_summary.csv"):
+            print(f"오류: 결과 파일을 찾을 수 없습니다: {run_base}_summary.csv")
+            sys.exit(1)
+
+    output_base = args.output or new_base
+
+    started = time.perf_counter()
+    counts = diff_runs(old_base, new_base, output_base)
+    elapsed = time.perf_counter() - started
+
+    print(f"이전 실행: {old_base}")
+    print(f"이번 실행: {new_base}")
+    if counts:
+        for (category, change_type), count in sorted(counts.items()):
+            print(f"- {category} {change_type}: {count}건")
+    else:
+        print("변경 사항 없음")
+    print(f"비교 시간: {elapsed:.2f}초")
+    print(f"변경 파일: {output_base}_changes.csv, 요약: {output_base}_diff_counts.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,16 +7,18 @@
 
 import sys
 import os
+import time
+import importlib.util
+
+_started = time.perf_counter()
+
 import tkinter as tk
 
-# 필요한 모듈 확인
-try:
-    import selenium
-    import pandas
-    import bs4
-    from webdriver_manager.chrome import ChromeDriverManager
-except ImportError as e:
-    print(f"오류: 필요한 모듈이 설치되지 않았습니다. {e}")
+# 필요한 모듈 확인 (실제 import는 크롤링 시작 시점까지 미룸)
+REQUIRED_MODULES = ("selenium", "pandas", "bs4", "webdriver_manager", "openpyxl", "urllib3")
+missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+if missing:
+    print(f"오류: 필요한 모듈이 설치되지 않았습니다. {', '.join(missing)}")
     print("다음 명령으로 필요한 모듈을 설치하세요:")
     print("pip install -r requirements.txt")
     sys.exit(1)
@@ -37,6 +39,8 @@ def main():
     print("네이버 검색 크롤러 GUI를 시작합니다...")
     root = tk.Tk()
     app = NaverCrawlerGUI(root)
+    root.update_idletasks()
+    print(f"창 표시까지 {time.perf_counter() - _started:.2f}초")
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+검색 결과 페이지 한 번에 추출 (브라우저 안 자바스크립트)
+
+웹드라이버로 섹션마다 find_element/get_attribute('outerHTML')를 호출하고
+BeautifulSoup으로 다시 파싱하는 대신, 키워드마다 execute_script 한 번으로
+모든 div.api_subject_bx 섹션의 제목과, 제목이 섹션 필터와 일치하는 섹션의 항목 필드를
+JSON으로 받아 온다 (일치하지 않는 섹션은 제목만 가져오고 항목은 찾지 않는다).
+
+항목에서 가져오는 원본 필드(RawItem)와 선택자는 BeautifulSoup 추출기
+(item_fields_from_html)와 같으며, 원본 필드를 컨텐츠 항목으로 바꾸는 후처리는
+NaverSearchCrawler.content_item_from_fields 하나를 함께 사용하므로 두 방식의 결과가 같다.
+"""
+
+import json
+from collections import namedtuple
+from itertools import islice
+
+SECTION_SELECTOR = "div.api_subject_bx"
+SECTION_TITLE_SELECTOR = "h3, h2, strong.tit, span.title_area, div.title_area"
+ITEM_SELECTOR = "li, div.content_item"
+ITEM_FALLBACK_SELECTOR = "div.brand_area, div.content_area"
+
+# 앞에서부터 처음 찾은 요소를 사용
+TITLE_SELECTORS = ("a.api_txt_lines", "strong.title", "div.title_area", "div.title", "a.title_link")
+URL_SELECTORS = ("a.api_txt_lines", "a.title_link", "a")
+DATE_SELECTORS = ("div.detail_box span.time", "span.date", "span.time", "div.sub_info",
+                  "span.sub_time", "time.sub_time")
+VIEW_SELECTORS = ("div.detail_box span.view", "span.view", "em.view", "span.sub_view", "span.count",
+                  "div.info span.view_count", "span.hit", "em.hit", "div.user_info span.view",
+                  "span.view_num", "div.cont_info span.count")
+VIEW_WORDS = ("조회", "읽음", "view", "hit")
+
+# 항목 원본 필드 (텍스트는 공백 정리 전 값, 요소가 없으면 None)
+#   title: 제목 요소 텍스트, url: 링크 요소 href, publisher: a.name 텍스트,
+#   subs: span.sub 텍스트 목록, date: 작성일 요소 텍스트, view: 조회수 요소 텍스트,
+#   view_spans: 조회수 단어가 들어 있는 span 텍스트 목록, fallback_url: 첫 번째 유효한 링크
+RawItem = namedtuple("RawItem", ["title", "url", "publisher", "subs", "date", "view", "view_spans", "fallback_url"])
+
+# 한 번의 실행으로 얻은 섹션 (제목과 RawItem 목록)
+SerpSection = namedtuple("SerpSection", ["title", "items"])
+
+SERP_EXTRACT_SCRIPT = """
+var maxItems = arguments[0];
+var titleTerms = arguments[1];     // null이면 모든 섹션의 항목 추출
+var ignoreCase = arguments[2];
+var SEL = %(selectors)s;
+
+function text(el) {
+    if (!el) return null;
+    if (!el.querySelector('script, style')) return el.textContent;
+    // BeautifulSoup의 .text처럼 script/style 내용은 제외
+    var out = '';
+    var walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        if (!walker.currentNode.parentNode.closest('script, style')) out += walker.currentNode.nodeValue;
+    }
+    return out;
+}
+
+function first(el, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var found = el.querySelector(selectors[i]);
+        if (found) return found;
+    }
+    return null;
+}
+
+// 다른 항목 안에 들어 있지 않은 최상위 항목만 (최대 maxItems개)
+function topLevel(section, selector) {
+    var found = [];
+    var candidates = section.querySelectorAll(selector);
+    for (var i = 0; i < candidates.length && found.length < maxItems; i++) {
+        var outer = candidates[i].parentElement.closest(selector);
+        if (!outer || outer === section || !section.contains(outer)) found.push(candidates[i]);
+    }
+    return found;
+}
+
+function wanted(title) {
+    if (titleTerms === null) return true;
+    if (!title) return false;
+    if (ignoreCase) title = title.toLowerCase();
+    return titleTerms.some(function (term) { return title.indexOf(term) !== -1; });
+}
+
+function hasViewWord(value) {
+    return SEL.viewWords.some(function (word) { return value.indexOf(word) !== -1; });
+}
+
+var result = [];
+document.querySelectorAll(SEL.section).forEach(function (section) {
+    var title = text(section.querySelector(SEL.sectionTitle)) || '';
+    var rows = [];
+    if (!wanted(title.trim())) {
+        result.push([title, rows]);
+        return;
+    }
+    var items = topLevel(section, SEL.item);
+    if (!items.length) items = topLevel(section, SEL.itemFallback);
+
+    for (var i = 0; i < items.length; i++) {
+        var item = items[i];
+        var urlElement = first(item, SEL.url);
+        var fallbackUrl = null;
+        var links = item.querySelectorAll('a');
+        for (var j = 0; j < links.length; j++) {
+            var href = links[j].getAttribute('href');
+            if (href && href !== '#' && href.indexOf('javascript:') !== 0) {
+                fallbackUrl = href;
+                break;
+            }
+        }
+        rows.push([
+            text(first(item, SEL.title)),
+            urlElement ? urlElement.getAttribute('href') : null,
+            text(item.querySelector('a.name')),
+            Array.prototype.map.call(item.querySelectorAll('span.sub'), text),
+            text(first(item, SEL.date)),
+            text(first(item, SEL.view)),
+            Array.prototype.map.call(item.querySelectorAll('span'), text).filter(hasViewWord),
+            fallbackUrl
+        ]);
+    }
+    result.push([title, rows]);
+});
+return result;
+""" % {"selectors": json.dumps({
+    "section": SECTION_SELECTOR,
+    "sectionTitle": SECTION_TITLE_SELECTOR,
+    "item": ITEM_SELECTOR,
+    "itemFallback": ITEM_FALLBACK_SELECTOR,
+    "title": TITLE_SELECTORS,
+    "url": URL_SELECTORS,
+    "date": DATE_SELECTORS,
+    "view": VIEW_SELECTORS,
+    "viewWords": VIEW_WORDS,
+}, ensure_ascii=False)}
+
+
+def extract_serp(driver, max_items, title_terms=None, ignore_case=False):
+    """
+    현재 페이지의 섹션을 execute_script 한 번으로 추출
+
+    Args:
+        driver: 셀레니움 웹드라이버
+        max_items (int): 섹션마다 가져올 최대 항목 수 (가장 낮은 요청 순위)
+        title_terms (list, optional): 항목을 가져올 섹션 제목에 포함될 문자열 목록.
+            없으면 모든 섹션의 항목을 가져온다. 일치하지 않는 섹션은 항목 없이 제목만 반환
+        ignore_case (bool): 제목을 소문자로 바꿔 비교할지 여부 (title_terms는 소문자로 전달)
+
+    Returns:
+        list: SerpSection 목록 (페이지 순서)
+    """
+    terms = list(title_terms) if title_terms is not None else None
+    sections = driver.execute_script(SERP_EXTRACT_SCRIPT, max_items, terms, ignore_case) or []
+    return [SerpSection(title or "", [RawItem._make(row) for row in rows]) for title, rows in sections]
+
+
+def _simple_matchers(selector):
+    """"li, div.content_item" 같은 단순 선택자를 (태그, 클래스) 목록으로 변환"""
+    matchers = []
+    for part in selector.split(","):
+        name, _, class_name = part.strip().partition(".")
+        matchers.append((name, class_name or None))
+    return matchers
+
+
+def iter_top_level_items(root, selector):
+    """
+    선택자와 일치하는 최상위 항목만 문서 순서대로 반환 (일치한 요소의 하위는 탐색하지 않음)
+
+    항목 카드 안의 태그 목록이나 하위 링크 li가 별도 항목으로 잡히지 않는다.
+
+    Args:
+        root (Tag): 섹션 요소 또는 섹션 HTML을 파싱한 문서
+        selector (str): 태그 또는 태그.클래스를 쉼표로 나열한 선택자 (ITEM_SELECTOR 등)
+
+    Yields:
+        Tag: 최상위 항목 요소
+    """
+    from bs4 import Tag
+
+    matchers = _simple_matchers(selector)
+    stack = [iter(root.children)]
+    while stack:
+        for node in stack[-1]:
+            if not isinstance(node, Tag):
+                continue
+            if any(node.name == name and (class_name is None or class_name in node.get("class", ()))
+                   for name, class_name in matchers):
+                yield node
+                continue
+            stack.append(iter(node.children))
+            break
+        else:
+            stack.pop()
+
+
+def segment_items(root, max_items):
+    """
+    섹션의 최상위 컨텐츠 카드를 최대 max_items개까지 찾기
+
+    ITEM_SELECTOR로 찾지 못하면 ITEM_FALLBACK_SELECTOR를 사용한다 (SERP_EXTRACT_SCRIPT와 같은 규칙).
+
+    Args:
+        root (Tag): 섹션 요소 또는 섹션 HTML을 파싱한 문서
+        max_items (int): 최대 항목 수
+
+    Returns:
+        list: 항목 요소 목록
+    """
+    items = list(islice(iter_top_level_items(root, ITEM_SELECTOR), max_items))
+    if not items:
+        items = list(islice(iter_top_level_items(root, ITEM_FALLBACK_SELECTOR), max_items))
+    return items
+
+
+def _first(item, selectors):
+    for selector in selectors:
+        element = item.select_one(selector)
+        if element is not None:
+            return element
+    return None
+
+
+def _text(element):
+    return element.text if element is not None else None
+
+
+def item_fields_from_html(item):
+    """
+    BeautifulSoup 항목 요소에서 원본 필드 추출 (SERP_EXTRACT_SCRIPT와 같은 선택자)
+
+    Args:
+        item (Tag): 컨텐츠 항목 요소
+
+    Returns:
+        RawItem: 항목 원본 필드
+    """
+    url_element = _first(item, URL_SELECTORS)
+    fallback_url = None
+    for link in item.select("a"):
+        href = link.get('href')
+        if href and href != "#" and not href.startswith("javascript:"):
+            fallback_url = href
+            break
+
+    return RawItem(
+        _text(_first(item, TITLE_SELECTORS)),
+        url_element.get('href') if url_element is not None else None,
+        _text(item.select_one("a.name")),
+        [sub.text for sub in item.select("span.sub")],
+        _text(_first(item, DATE_SELECTORS)),
+        _text(_first(item, VIEW_SELECTORS)),
+        [text for text in (span.text for span in item.select("span")) if any(word in text for word in VIEW_WORDS)],
+        fallback_url
+    )
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+시작 시간(import 시간) 벤치마크
+
+GUI와 CLI 진입점 모듈을 매번 새 파이썬 프로세스에서 import해
+걸린 시간을 측정하고, pandas/selenium 같은 무거운 모듈이 시작 시점에
+불러와지지 않았는지 확인한다. `python -X importtime` 결과에서
+누적 시간이 긴 모듈도 함께 보여준다.
+
+사용 예:
+    python startup_benchmark.py
+    python startup_benchmark.py --max-seconds 0.5 --top 15
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 측정할 진입점 모듈
+ENTRY_MODULES = ("naver_crawler_gui", "naver_search_crawler_url_analysis")
+
+# 시작 시점에 불러오면 안 되는 무거운 모듈
+HEAVY_MODULES = ("pandas", "selenium", "webdriver_manager", "bs4", "openpyxl", "numpy")
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def measure_import(module, repeat=5):
+    """
+    새 프로세스에서 모듈 import 시간 측정
+
+    Args:
+        module (str): 모듈 이름
+        repeat (int): 반복 횟수 (최소 시간 사용)
+
+    Returns:
+        dict: {"모듈", "최소_시간", "평균_시간", "무거운_모듈"}
+    """
+    times = []
+    heavy = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=BASE_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+        ).stdout.decode('utf-8')
+        probe = json.loads(output.strip().splitlines()[-1])
+        times.append(probe["elapsed"])
+        heavy = probe["heavy"]
+
+    return {
+        "모듈": module,
+        "최소_시간": round(min(times), 4),
+        "평균_시간": round(sum(times) / len(times), 4),
+        "무거운_모듈": heavy,
+    }
+
+
+def slowest_imports(module, top_n=10):
+    """
+    python -X importtime 결과에서 누적 시간이 긴 모듈 목록
+
+    Returns:
+        list: (누적 시간(초), 모듈 이름) 목록
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BASE_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+    )
+    entries = []
+    for line in result.stderr.decode('utf-8', errors='replace').splitlines():
+        # 형식: "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            entries.append((int(cumulative) / 1e6, name.rstrip()))
+        except ValueError:
+            continue
+    entries.sort(reverse=True)
+    return entries[:top_n]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GUI/CLI 진입점 시작 시간(import 시간) 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='모듈별 반복 횟수 (기본값: 5)')
+    parser.add_argument('--top', type=int, default=10, help='누적 시간이 긴 모듈 표시 개수 (기본값: 10)')
+    parser.add_argument('--max-seconds', type=float, default=None, help='허용하는 최대 import 시간 (초과 시 종료 코드 1)')
+    parser.add_argument('--json', type=str, default=None, help='결과를 저장할 JSON 파일 경로')
+
+    args = parser.parse_args()
+
+    results = [measure_import(module, args.repeat) for module in ENTRY_MODULES]
+    failed = False
+
+    print(f"{'모듈':<40}{'최소(초)':>10}{'평균(초)':>10}  무거운 모듈")
+    for result in results:
+        heavy = ", ".join(result["무거운_모듈"]) or "-"
+        print(f"{result['모듈']:<40}{result['최소_시간']:>10.3f}{result['평균_시간']:>10.3f}  {heavy}")
+        if result["무거운_모듈"]:
+            failed = True
+        if args.max_seconds is not None and result["최소_시간"] > args.max_seconds:
+            failed = True
+
+    for module in ENTRY_MODULES:
+        print(f"\n{module} 누적 import 시간 상위 {args.top}개:")
+        for seconds, name in slowest_imports(module, args.top):
+            print(f"  {seconds:8.3f}초  {name.strip()}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+
+    if failed:
+        print("\n시작 시간 기준을 통과하지 못했습니다 (무거운 모듈이 불러와졌거나 허용 시간 초과).")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
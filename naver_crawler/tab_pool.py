@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Chrome 하나에서 여러 탭으로 검색 결과 페이지 동시 로딩
+
+키워드마다 대부분의 시간은 검색 결과 페이지가 로딩되기를 기다리는 데 쓰인다.
+TabPool은 한 웹드라이버 안에 탭을 여러 개 열고, 각 탭에 다음 키워드의 검색 URL을
+비동기로(window.location) 이동시켜 둔 뒤, 먼저 이동시킨 탭부터 차례로 전환해
+분석하게 한다. 분석 중에도 다른 탭들은 계속 로딩되므로 Chrome을 여러 개 띄우지 않고
+탭 수만큼 키워드를 동시에 처리한다. 탭은 같은 브라우저 프로필(쿠키)을 공유한다.
+
+웹드라이버 명령은 한 번에 하나만 보낼 수 있으므로 스케줄러는 단일 스레드에서
+탭을 돌아가며 전환한다.
+"""
+
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# 탭의 문서 로딩이 끝나기를 기다리는 최대 시간 (초)
+PAGE_LOAD_TIMEOUT = 20
+READY_POLL_INTERVAL = 0.2
+
+
+class TabPool:
+    def __init__(self, driver, size, load_wait=5):
+        """
+        탭 풀 초기화 (현재 탭을 포함해 size개의 탭 사용)
+
+        Args:
+            driver: 셀레니움 웹드라이버
+            size (int): 동시에 로딩할 탭 수
+            load_wait (float): 이동을 시작한 뒤 분석 전까지 기다릴 최소 시간 (초)
+        """
+        self.size = size
+        self.load_wait = load_wait
+        self.pending = deque()  # (작업, 탭 핸들 또는 None, 이동 시작 시각, URL)
+        self._open_tabs(driver)
+
+    def _open_tabs(self, driver):
+        self.driver = driver
+        self.handles = [driver.current_window_handle]
+        for _ in range(self.size - 1):
+            driver.execute_script("window.open('about:blank');")
+            handle = next(h for h in driver.window_handles if h not in self.handles)
+            self.handles.append(handle)
+        driver.switch_to.window(self.handles[0])
+        self.free = deque(self.handles)
+        logger.info(f"검색용 탭 {len(self.handles)}개 준비")
+
+    def _navigate(self, handle, url):
+        """탭을 URL로 이동 (로딩 완료를 기다리지 않음)"""
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script("window.location.href = arguments[0];", url)
+
+    def _wait_ready(self, handle, started):
+        """탭으로 전환하고 최소 대기 시간과 문서 로딩 완료까지 대기"""
+        remaining = started + self.load_wait - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        self.driver.switch_to.window(handle)
+        deadline = time.perf_counter() + PAGE_LOAD_TIMEOUT
+        while self.driver.execute_script("return document.readyState;") != "complete":
+            if time.perf_counter() > deadline:
+                logger.warning("검색 결과 페이지 로딩 시간이 초과되어 현재 상태로 분석합니다.")
+                break
+            time.sleep(READY_POLL_INTERVAL)
+
+    def rebind(self, driver):
+        """
+        새 웹드라이버로 탭을 다시 열고, 로딩 중이던 작업을 같은 순서로 다시 로딩
+        (드라이버를 다시 시작한 뒤 호출)
+
+        Args:
+            driver: 새 셀레니움 웹드라이버
+        """
+        self._open_tabs(driver)
+        pending = self.pending
+        self.pending = deque()
+        for item, handle, started, url in pending:
+            if handle is not None:
+                handle = self.free.popleft()
+                self._navigate(handle, url)
+                started = time.perf_counter()
+            self.pending.append((item, handle, started, url))
+
+    def prefetch(self, jobs):
+        """
+        작업을 탭에 나눠 미리 로딩하고 넣은 순서대로 반환하는 제너레이터
+
+        반환된 작업의 탭이 현재 창으로 전환된 상태이므로, 다음 작업을 요청하기 전에
+        현재 페이지를 분석하면 된다. 그동안 다른 탭은 계속 로딩된다.
+        중간에 rebind()로 드라이버가 바뀌어도 순서를 유지한다.
+
+        Args:
+            jobs (iterable): (작업, URL) 이터러블. URL이 None이면 로딩 없이 순서만 유지
+
+        Yields:
+            tuple: (작업, 로딩 여부)
+        """
+        jobs = iter(jobs)
+        exhausted = False
+
+        while True:
+            # 비어 있는 탭에 다음 작업 배정
+            while self.free and not exhausted:
+                job = next(jobs, None)
+                if job is None:
+                    exhausted = True
+                    break
+                item, url = job
+                if url is None:
+                    self.pending.append((item, None, None, None))
+                    continue
+                handle = self.free.popleft()
+                self._navigate(handle, url)
+                self.pending.append((item, handle, time.perf_counter(), url))
+
+            if not self.pending:
+                return
+
+            item, handle, started, _ = self.pending.popleft()
+            if handle is None:
+                yield item, False
+                continue
+
+            self._wait_ready(handle, started)
+            yield item, True
+            # 분석 중에 드라이버가 바뀌었으면 이전 탭은 반환하지 않음
+            if handle in self.handles:
+                self.free.append(handle)
+
+    def close(self):
+        """첫 탭만 남기고 나머지 탭 닫기"""
+        try:
+            for handle in self.handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(self.handles[0])
+        except Exception as e:
+            logger.warning(f"검색용 탭을 닫는 중 오류 발생: {e}")
+        self.handles = self.handles[:1]
+        self.free = deque(self.handles)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# naver_crawler 모듈은 같은 폴더 기준으로 서로 import하므로 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,158 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from content_enrichers import (BlogEnricher, ContentEnricher, DetailFetcher, EMPTY_ENRICHMENT, Enrichment,
+                               KinEnricher, PostEnricher)
+
+DETAIL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "naver_data", "details")
+
+
+def read_fixture(name):
+    with open(os.path.join(DETAIL_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("enricher, fixture, expected", [
+    (BlogEnricher(), "blog_postview_se.html", Enrichment("", "2024. 3. 5. 14:20", "")),
+    (BlogEnricher(), "blog_postview_legacy.html", Enrichment("", "2019. 8. 2. 11:05", "")),
+    (PostEnricher(), "post_viewer.html", Enrichment("튼튼정형외과", "2023.05.03. 10:00", "1.2만")),
+    (KinEnricher(), "kin_detail.html", Enrichment("운동하는직장인", "2022.11.20", "987")),
+    (KinEnricher(), "kin_detail_hidden_author.html", Enrichment("", "2023.05.03", "1,234")),
+])
+def test_parse_fixture(enricher, fixture, expected):
+    assert enricher.parse(read_fixture(fixture)) == expected
+
+
+@pytest.mark.parametrize("url, key, detail_url", [
+    ("https://blog.naver.com/posture_lab/223378012345",
+     ("블로그", "posture_lab", "223378012345"),
+     "https://blog.naver.com/PostView.naver?blogId=posture_lab&logNo=223378012345"),
+    ("https://m.blog.naver.com/PostView.naver?blogId=posture_lab&logNo=223378012345",
+     ("블로그", "posture_lab", "223378012345"),
+     "https://blog.naver.com/PostView.naver?blogId=posture_lab&logNo=223378012345"),
+    ("https://post.naver.com/viewer/postView.naver?volumeNo=35123456&memberNo=4567",
+     ("포스트", "35123456"),
+     "https://post.naver.com/viewer/postView.naver?volumeNo=35123456&memberNo=4567"),
+    ("https://kin.naver.com/qna/detail.naver?d1id=7&dirId=70109&docId=441234567&qb=abc",
+     ("지식iN", "441234567"),
+     "https://kin.naver.com/qna/detail.naver?d1id=7&dirId=70109&docId=441234567"),
+])
+def test_detail_request(url, key, detail_url):
+    enricher, found_key, found_url = DetailFetcher().find(url)
+    assert (found_key, found_url) == (key, detail_url)
+    assert enricher.name == key[0]
+
+
+def test_unsupported_urls():
+    fetcher = DetailFetcher()
+    assert fetcher.find("https://blog.naver.com/posture_lab") is None
+    assert fetcher.find("https://cafe.naver.com/somecafe/123") is None
+    assert fetcher.find("링크 없음") is None
+
+
+def test_can_enrich_skips_fields_the_enricher_cannot_supply():
+    fetcher = DetailFetcher()
+    blog = "https://blog.naver.com/posture_lab/223378012345"
+    kin = "https://kin.naver.com/qna/detail.naver?docId=441234567"
+    assert fetcher.can_enrich(blog, {"date", "view_count"})
+    assert not fetcher.can_enrich(blog, {"view_count"})
+    assert fetcher.can_enrich(kin, {"view_count"})
+    assert not fetcher.can_enrich(kin, set())
+
+
+def test_enricher_is_abstract():
+    with pytest.raises(TypeError):
+        ContentEnricher()
+
+
+class FixtureFetcher(DetailFetcher):
+    """네트워크 대신 상세 페이지 URL별 저장된 HTML을 반환"""
+
+    def __init__(self, pages):
+        super().__init__(workers=2)
+        self.pages = pages
+        self.requested = []
+
+    def fetch(self, url):
+        self.requested.append(url)
+        name = self.pages.get(url)
+        if name is None:
+            raise OSError("connection refused")
+        return read_fixture(name) if name else None
+
+
+def test_enrich_urls_fetches_each_post_once_and_retries_failures():
+    blog_detail = "https://blog.naver.com/PostView.naver?blogId=posture_lab&logNo=223378012345"
+    fetcher = FixtureFetcher({blog_detail: "blog_postview_se.html"})
+    urls = [
+        "https://blog.naver.com/posture_lab/223378012345",
+        "https://m.blog.naver.com/PostView.naver?blogId=posture_lab&logNo=223378012345",
+        "https://kin.naver.com/qna/detail.naver?docId=441234567",
+        "https://www.example.com/",
+    ]
+    try:
+        result = fetcher.enrich_urls(urls)
+        assert fetcher.requested.count(blog_detail) == 1
+        assert result == {urls[0]: Enrichment("", "2024. 3. 5. 14:20", ""),
+                          urls[1]: Enrichment("", "2024. 3. 5. 14:20", "")}
+
+        # 실패한 지식iN 글은 캐시하지 않아 다음 호출에서 다시 요청, 성공한 블로그 글은 캐시 사용
+        fetcher.enrich_urls(urls[:3])
+        assert fetcher.requested.count(blog_detail) == 1
+        assert fetcher.requested.count("https://kin.naver.com/qna/detail.naver?docId=441234567") == 2
+    finally:
+        fetcher.close()
+
+
+def test_parse_error_is_cached_as_empty():
+    class BrokenEnricher(PostEnricher):
+        def parse(self, html):
+            raise ValueError("unexpected markup")
+
+    detail_url = "https://post.naver.com/viewer/postView.naver?volumeNo=1"
+    fetcher = FixtureFetcher({detail_url: "post_viewer.html"})
+    fetcher.enrichers = (BrokenEnricher(),)
+    try:
+        url = "https://post.naver.com/viewer/postView.naver?volumeNo=1"
+        assert fetcher.enrich_urls([url]) == {url: EMPTY_ENRICHMENT}
+    finally:
+        fetcher.close()
+
+
+class RedirectHandler(BaseHTTPRequestHandler):
+    """/a -> /b -> /c 로 두 번 리다이렉트한 뒤 HTML 반환"""
+    REDIRECTS = {"/a": "/b", "/b": "/c"}
+
+    def do_GET(self):
+        if self.path in self.REDIRECTS:
+            self.send_response(302)
+            self.send_header("Location", self.REDIRECTS[self.path])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = "<html><body>조회 12</body></html>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_fetch_follows_two_redirects():
+    server = HTTPServer(("127.0.0.1", 0), RedirectHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    fetcher = DetailFetcher(workers=1, timeout=2.0, retries=1)
+    try:
+        html = fetcher.fetch(f"http://127.0.0.1:{server.server_port}/a")
+        assert html == "<html><body>조회 12</body></html>"
+    finally:
+        fetcher.close()
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,72 @@
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from value_normalizer import (NORMALIZED_DATE_COLUMN, NORMALIZED_VIEW_COLUMN, normalize_content_frame,
+                              normalize_dates, normalize_view_counts, parse_date, parse_view_count)
+
+CRAWLED_AT = datetime(2024, 3, 10, 9, 30)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2022.08.02.", date(2022, 8, 2)),
+    ("2024. 3. 5. 14:20", date(2024, 3, 5)),
+    ("2024년 3월 5일", date(2024, 3, 5)),
+    ("30분 전", date(2024, 3, 10)),
+    ("3주 전", date(2024, 2, 18)),
+    ("2개월 전", date(2024, 1, 10)),
+    ("방금 전", date(2024, 3, 10)),
+    ("오늘 오후 3:20", date(2024, 3, 10)),
+    ("어제", date(2024, 3, 9)),
+    ("어제 14:05", date(2024, 3, 9)),
+    ("그저께", date(2024, 3, 8)),
+    ("오늘의 추천", None),
+    ("2024.13.40.", None),
+    ("", None),
+])
+def test_parse_date(text, expected):
+    assert parse_date(text, CRAWLED_AT) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1.2만", 12000),
+    ("3,400", 3400),
+    ("1.234", 1234),
+    ("2.5억", 250000000),
+    ("1,234회", 1234),
+    ("조회 1,234", 1234),
+    ("1.2만 읽음", 12000),
+    ("2023.05.03 · 조회 12", 12),
+    ("3시간 전", None),
+    ("2023-5-3", None),
+    ("2023.05.03.", None),
+    ("14:20", None),
+    ("댓글 3", None),
+    ("abc", None),
+])
+def test_parse_view_count(text, expected):
+    assert parse_view_count(text) == expected
+
+
+def test_frame_matches_per_value_parsing():
+    dates = ["3주 전", "2022.08.02.", "방금 전", "오늘 오후 3:20", "어제", "오늘의 추천", "", None]
+    views = ["1.2만", "조회 3,400", "3시간 전", "2023-5-3", "12", "1.234", "", None]
+    df = pd.DataFrame({"작성일": dates, "조회수": views, "실행_시각": CRAWLED_AT})
+
+    result = normalize_content_frame(df, "실행_시각")
+
+    frame_dates = [None if pd.isna(value) else value.date() for value in result[NORMALIZED_DATE_COLUMN]]
+    frame_views = [None if pd.isna(value) else int(value) for value in result[NORMALIZED_VIEW_COLUMN]]
+    assert frame_dates == normalize_dates(dates, CRAWLED_AT)
+    assert frame_views == normalize_view_counts(views)
+
+
+def test_frame_keeps_existing_normalized_values():
+    df = pd.DataFrame({"작성일": ["어제"], "조회수": ["12"], "실행_시각": CRAWLED_AT,
+                       NORMALIZED_DATE_COLUMN: ["2024-01-01"], NORMALIZED_VIEW_COLUMN: [99]})
+
+    result = normalize_content_frame(df, "실행_시각")
+
+    assert result[NORMALIZED_DATE_COLUMN].iloc[0] == pd.Timestamp("2024-01-01")
+    assert result[NORMALIZED_VIEW_COLUMN].iloc[0] == 99
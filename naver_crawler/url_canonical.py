@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+컨텐츠 URL 정규화 (광고/추적 링크)
+
+광고 항목의 URL(adcr.naver.com 등)은 노출마다 다른 리다이렉트 주소이고, 일반 링크에도
+utm_*, NaPm, n_query 같은 추적 파라미터가 붙어 같은 페이지가 여러 URL로 기록된다.
+UrlCanonicalizer는 리다이렉트 URL의 쿼리에 최종 주소(u=, url= 등)가 들어 있으면 그 주소를
+사용하고, 알려진 추적 파라미터와 #조각을 지운 정규화 URL을 만든다.
+원본 URL은 그대로 두고 정규화 URL을 별도 열(정규화_URL)에 기록한다.
+
+최종 주소가 쿼리에 없는 리다이렉트 URL은 resolve=True일 때만 HEAD 요청으로 따라간다.
+광고 클릭 추적 주소에 요청하면 광고주에게 실제 클릭으로 집계될 수 있으므로 기본값은 False이다.
+리다이렉트 결과는 JSON 파일(RedirectCache)에 저장해 다음 실행에서 다시 요청하지 않는다.
+"""
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, unquote_plus, urljoin, urlsplit, urlunsplit
+
+import metrics
+from content_enrichers import make_pool_manager
+
+logger = logging.getLogger(__name__)
+
+# 최종 주소로 이동시키는 리다이렉트(클릭 추적/단축 URL) 호스트
+REDIRECT_HOSTS = ("adcr.naver.com", "ader.naver.com", "cr.naver.com", "cr2.naver.com", "cr3.naver.com",
+                  "naver.me", "me2.do", "bit.ly")
+# 네이버 호스트에서 최종 주소로 이동시키는 경로 (검색 결과 클릭 추적)
+REDIRECT_PATHS = ("/p/crd/rd",)
+
+# 리다이렉트 URL의 쿼리에서 최종 주소를 담는 파라미터
+TARGET_PARAMS = ("u", "url", "target", "targetUrl", "dest", "destination", "redirectUrl")
+
+# 정규화할 때 지우는 추적 파라미터 (utm_*는 접두어로 확인)
+TRACKING_PARAMS = frozenset((
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "yclid",
+    "NaPm", "nclid", "trackingCode", "proxyReferer",
+    "n_media", "n_query", "n_rank", "n_ad_group", "n_ad", "n_keyword_id", "n_keyword",
+    "n_campaign_type", "n_ad_group_type", "n_match", "n_contract", "n_campaign",
+))
+TRACKING_PREFIXES = ("utm_",)
+
+# 리다이렉트 캐시 보관 기간 (일)
+REDIRECT_CACHE_DAYS = 30
+MAX_REDIRECTS = 5
+
+
+def _is_tracking(name):
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def strip_tracking(url):
+    """
+    추적 파라미터와 #조각을 지우고 스킴/호스트를 소문자로 바꾼 URL
+
+    Args:
+        url (str): URL
+
+    Returns:
+        str: 정규화된 URL (http(s) URL이 아니면 그대로 반환)
+    """
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return url
+    # 남는 파라미터는 원래 인코딩과 순서를 유지
+    query = "&".join(pair for pair in parts.query.split("&")
+                     if pair and not _is_tracking(unquote_plus(pair.split("=", 1)[0])))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+def is_redirect_url(url):
+    """리다이렉트 URL(광고 클릭 추적, 단축 URL)인지 여부"""
+    parts = urlsplit(url)
+    host = parts.netloc.lower().split(":")[0]
+    if any(host == redirect_host or host.endswith("." + redirect_host) for redirect_host in REDIRECT_HOSTS):
+        return True
+    return host.endswith("naver.com") and parts.path.startswith(REDIRECT_PATHS)
+
+
+def embedded_target(url):
+    """
+    리다이렉트 URL의 쿼리에 들어 있는 최종 주소 (요청하지 않음)
+
+    최종 주소가 다시 리다이렉트 URL이면 MAX_REDIRECTS번까지 따라간다.
+
+    Args:
+        url (str): URL
+
+    Returns:
+        str: 최종 주소 (리다이렉트 URL이 아니거나 쿼리에 최종 주소가 없으면 None)
+    """
+    target = None
+    for _ in range(MAX_REDIRECTS):
+        if not is_redirect_url(url):
+            break
+        params = dict(parse_qsl(urlsplit(url).query))
+        url = next((params[name] for name in TARGET_PARAMS
+                    if params.get(name, "").startswith(("http://", "https://"))), None)
+        if url is None:
+            break
+        target = url
+    return target
+
+
+class RedirectCache:
+    def __init__(self, path=None, max_age_days=REDIRECT_CACHE_DAYS):
+        """
+        리다이렉트 결과 저장소 초기화
+
+        Args:
+            path (str, optional): 저장할 JSON 파일 경로. 없으면 메모리에서만 유지
+            max_age_days (int): 이보다 오래된 결과는 불러오지 않음
+        """
+        self.path = path
+        self.max_age_days = max_age_days
+        self.entries = {}   # 리다이렉트 URL -> {"location", "updated"}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """저장된 리다이렉트 결과 불러오기 (보관 기간이 지난 항목은 제외)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"리다이렉트 캐시를 불러오지 못했습니다: {e}")
+            return
+        oldest = (datetime.now() - timedelta(days=self.max_age_days)).isoformat(timespec='seconds')
+        self.entries = {url: entry for url, entry in entries.items() if entry.get("updated", "") >= oldest}
+        logger.info(f"리다이렉트 캐시 로드: {len(self.entries)}개 URL ({self.path})")
+
+    def save(self):
+        """리다이렉트 결과를 파일에 저장 (경로가 없으면 무시)"""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = f"{self.path}.tmp"
+        with self._lock:
+            entries = dict(self.entries)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def get(self, url):
+        """저장된 최종 주소 (없으면 None)"""
+        entry = self.entries.get(url)
+        return entry["location"] if entry else None
+
+    def set(self, url, location):
+        """최종 주소 저장"""
+        with self._lock:
+            self.entries[url] = {"location": location, "updated": datetime.now().isoformat(timespec='seconds')}
+
+
+class UrlCanonicalizer:
+    def __init__(self, cache=None, resolve=False, workers=8, timeout=5.0):
+        """
+        URL 정규화 초기화 (연결 풀과 스레드는 처음 리다이렉트를 확인할 때 만든다)
+
+        Args:
+            cache (RedirectCache, optional): 리다이렉트 결과 저장소 (없으면 메모리 저장소)
+            resolve (bool): 쿼리에 최종 주소가 없는 리다이렉트 URL에 요청해 최종 주소를 확인할지 여부.
+                광고 클릭으로 집계될 수 있으므로 기본값은 False (쿼리의 최종 주소와 추적 파라미터 정리만 사용)
+            workers (int): 리다이렉트 최대 동시 요청 수
+            timeout (float): 연결/읽기 시간 제한 (초)
+        """
+        self.cache = cache if cache is not None else RedirectCache()
+        self.resolve = resolve
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self._http = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._http is None:
+                self._http = make_pool_manager(self.workers, self.timeout)
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="redirect")
+            return self._http
+
+    def resolve_redirect(self, url):
+        """
+        HEAD 요청으로 리다이렉트를 따라가 최종 주소 찾기
+
+        리다이렉트 호스트를 벗어나면(광고주 사이트 등) 더 요청하지 않는다.
+        HEAD를 지원하지 않는 서버(405/501)는 본문을 읽지 않는 GET으로 한 번 더 확인한다.
+
+        Args:
+            url (str): 리다이렉트 URL
+
+        Returns:
+            str: 최종 주소 (요청에 실패하면 None)
+        """
+        http = self._pool()
+        current = url
+        try:
+            for _ in range(MAX_REDIRECTS):
+                if current != url and not is_redirect_url(current):
+                    break
+                response = http.request("HEAD", current, redirect=False)
+                if response.status in (405, 501):
+                    response = http.request("GET", current, redirect=False, preload_content=False)
+                    response.release_conn()
+                location = response.headers.get("Location")
+                if not (300 <= response.status < 400 and location):
+                    break
+                current = urljoin(current, location)
+        except Exception as e:
+            logger.warning(f"리다이렉트 확인 실패: {e}")
+            metrics.REDIRECT_ERRORS.inc()
+            # 중간 단계까지 따라간 주소가 있으면 그 주소 사용
+            return current if current != url else None
+        metrics.REDIRECTS_RESOLVED.inc()
+        return current
+
+    def resolve_many(self, urls):
+        """
+        리다이렉트 URL의 최종 주소를 동시에 확인해 캐시에 저장
+
+        Args:
+            urls (iterable): URL 목록 (리다이렉트 URL이 아니거나, 쿼리에 최종 주소가 있거나, 캐시에 있으면 요청하지 않음)
+        """
+        pending = {}
+        for url in urls:
+            if url in pending or not is_redirect_url(url) or embedded_target(url):
+                continue
+            if self.cache.get(url) is not None:
+                metrics.REDIRECT_CACHE_HITS.inc()
+                continue
+            pending[url] = None
+
+        if not pending:
+            return
+        self._pool()
+        for url, location in zip(pending, self._executor.map(self.resolve_redirect, pending)):
+            if location is not None:
+                self.cache.set(url, location)
+
+    def canonicalize_many(self, urls):
+        """
+        URL 목록의 정규화 URL
+
+        Args:
+            urls (iterable): 원본 URL 목록
+
+        Returns:
+            dict: 원본 URL -> 정규화 URL ("링크 없음"처럼 URL이 아닌 값은 제외)
+        """
+        urls = [url for url in dict.fromkeys(urls) if url and url.startswith(("http://", "https://"))]
+        if self.resolve:
+            self.resolve_many(urls)
+        return {url: strip_tracking(embedded_target(url) or self.cache.get(url) or url) for url in urls}
+
+    def close(self):
+        """스레드와 연결 풀을 정리하고 리다이렉트 캐시 저장"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._http is not None:
+                self._http.clear()
+                self._http = None
+        try:
+            self.cache.save()
+        except OSError as e:
+            logger.warning(f"리다이렉트 캐시 저장 중 오류 발생: {e}")
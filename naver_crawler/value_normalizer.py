@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+작성일/조회수 정규화
+
+검색 결과의 작성일은 "3주 전", "2022.08.02.", "어제" 같은 문자열이고 조회수는
+"1.2만", "3,400" 같은 문자열이라 정렬하거나 합계를 내려면 매번 다시 해석해야 한다.
+내보내기 단계에서 원본 문자열은 그대로 두고 다음 두 열을 추가한다.
+
+    작성일_정규화   수집 시각 기준의 절대 날짜 (YYYY-MM-DD)
+    조회수_정규화   정수 조회수
+
+같은 정규식을 두 가지 방식으로 적용한다.
+    normalize_dates / normalize_view_counts   키워드마다 기록하는 컨텐츠 열 (CSV/엑셀 싱크).
+                                              값의 종류가 적으므로 해석 결과를 캐시한다.
+    normalize_content_frame                   여러 실행을 모은 DataFrame 전체 열 (analytics).
+                                              서로 다른 값에만 pandas 문자열 연산을 적용한다.
+
+"N개월 전"은 30일, "N년 전"은 365일로 계산한다.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from serp_script import VIEW_WORDS
+
+NORMALIZED_DATE_COLUMN = "작성일_정규화"
+NORMALIZED_VIEW_COLUMN = "조회수_정규화"
+NORMALIZED_COLUMNS = (NORMALIZED_DATE_COLUMN, NORMALIZED_VIEW_COLUMN)
+
+ABSOLUTE_DATE_PATTERN = re.compile(r'(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})')
+RELATIVE_DATE_PATTERN = re.compile(r'(\d+)\s*(분|시간|일|주|개월|달|년)\s*전')
+# "방금 전", "오늘 오후 3:20", "어제 14:05"처럼 문자열 앞의 단어로 정하는 날짜
+RELATIVE_WORD_PATTERN = re.compile(r'^\s*(그저께|그제|방금|오늘|어제)(?=\s|\d|전|$)')
+VIEW_COUNT_PATTERN = re.compile(r'(\d[\d,.]*)\s*([천만억]?)')
+VIEW_WORD_PATTERN = re.compile("|".join(map(re.escape, VIEW_WORDS)), re.IGNORECASE)
+# 조회수 단어가 없을 때는 숫자(와 단위)만 있는 문자열만 조회수로 본다
+BARE_VIEW_PATTERN = re.compile(r'\s*\d[\d,.]*\s*[천만억]?\s*회?\s*')
+# 조회수 선택자가 잘못 잡은 작성일/시각 ("3시간 전", "2023-5-3", "14:20")
+DATE_LIKE_PATTERN = re.compile(r'\d\s*(?:분|시간|일|주|개월|달|년)\s*전'
+                               r'|\d{4}\s*[.\-/년]\s*\d{1,2}(?:\s*[.\-/월]\s*\d{1,2}\s*[.일]?)?'
+                               r'|\d{1,2}:\d{2}')
+_DOTTED_THOUSANDS = re.compile(r'\d{1,3}(?:\.\d{3})+')
+
+RELATIVE_UNIT_SECONDS = {
+    "분": 60,
+    "시간": 3600,
+    "일": 86400,
+    "주": 7 * 86400,
+    "개월": 30 * 86400,
+    "달": 30 * 86400,
+    "년": 365 * 86400,
+}
+RELATIVE_WORD_DAYS = {"방금": 0, "오늘": 0, "어제": 1, "그제": 2, "그저께": 2}
+VIEW_UNITS = {"": 1, "천": 1000, "만": 10000, "억": 100000000}
+
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_date_text(text):
+    """작성일 문자열을 (절대 날짜, None) 또는 (None, 수집 시각에서 뺄 timedelta)로 해석"""
+    match = ABSOLUTE_DATE_PATTERN.search(text)
+    if match:
+        try:
+            return date(*map(int, match.groups())), None
+        except ValueError:
+            return None, None
+    match = RELATIVE_DATE_PATTERN.search(text)
+    if match:
+        return None, timedelta(seconds=int(match.group(1)) * RELATIVE_UNIT_SECONDS[match.group(2)])
+    match = RELATIVE_WORD_PATTERN.match(text)
+    if match:
+        return None, timedelta(days=RELATIVE_WORD_DAYS[match.group(1)])
+    return None, None
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_view_count(text):
+    """
+    조회수 문자열을 정수로 변환 ("1.2만" -> 12000, "조회 3,400" -> 3400)
+
+    조회수 단어(조회, 읽음 등)가 있으면 작성일/시각 부분을 지운 뒤 숫자를 찾고, 없으면 숫자와
+    단위만 있는 문자열만 변환한다. 조회수 선택자가 작성일("3시간 전", "2023-5-3")을 잡은 경우는 None.
+
+    Args:
+        text (str): 조회수 문자열
+
+    Returns:
+        int: 조회수 (조회수로 볼 수 없으면 None)
+    """
+    if VIEW_WORD_PATTERN.search(text):
+        text = DATE_LIKE_PATTERN.sub(" ", text)
+    elif DATE_LIKE_PATTERN.search(text) or not BARE_VIEW_PATTERN.fullmatch(text):
+        return None
+    match = VIEW_COUNT_PATTERN.search(text)
+    if not match:
+        return None
+    number, unit = match.groups()
+    number = number.rstrip(".,").replace(",", "")
+    if not unit and _DOTTED_THOUSANDS.fullmatch(number):
+        number = number.replace(".", "")
+    try:
+        return int(round(float(number) * VIEW_UNITS[unit]))
+    except ValueError:
+        return None
+
+
+def parse_date(text, crawled_at):
+    """
+    작성일 문자열을 절대 날짜로 변환
+
+    Args:
+        text (str): 작성일 문자열 ("3주 전", "2022.08.02.", "어제" 등)
+        crawled_at (datetime): 수집 시각
+
+    Returns:
+        date: 작성일 (해석할 수 없으면 None)
+    """
+    if not text:
+        return None
+    absolute, offset = _parse_date_text(text)
+    if absolute is not None:
+        return absolute
+    if offset is not None:
+        return (crawled_at - offset).date()
+    return None
+
+
+def normalize_dates(values, crawled_at=None):
+    """
+    작성일 열 전체를 절대 날짜 열로 변환
+
+    Args:
+        values (iterable): 작성일 문자열 목록
+        crawled_at (datetime, optional): 수집 시각 (기본값: 지금)
+
+    Returns:
+        list: date 또는 None 목록
+    """
+    crawled_at = crawled_at or datetime.now()
+    return [parse_date(value, crawled_at) if isinstance(value, str) else None for value in values]
+
+
+def normalize_view_counts(values):
+    """
+    조회수 열 전체를 정수 열로 변환
+
+    Args:
+        values (iterable): 조회수 문자열 목록
+
+    Returns:
+        list: int 또는 None 목록
+    """
+    return [parse_view_count(value) if isinstance(value, str) and value else None for value in values]
+
+
+def normalized_content_rows(items, crawled_at=None, date_format="%Y-%m-%d"):
+    """
+    컨텐츠 항목을 정규화 열이 붙은 내보내기 행으로 변환
+
+    Args:
+        items (list): ContentItem 목록
+        crawled_at (datetime, optional): 수집 시각 (기본값: 지금)
+        date_format (str): 날짜 문자열 형식 (None이면 date 객체 그대로, 엑셀용)
+
+    Returns:
+        list: CONTENT_COLUMNS + NORMALIZED_COLUMNS 순서의 값 목록
+    """
+    dates = normalize_dates([item.date for item in items], crawled_at)
+    views = normalize_view_counts([item.view_count for item in items])
+    rows = []
+    for item, parsed_date, view_count in zip(items, dates, views):
+        if parsed_date is not None and date_format:
+            parsed_date = parsed_date.strftime(date_format)
+        rows.append(item.as_row() + [parsed_date, view_count])
+    return rows
+
+
+def _factorize(df, column):
+    """열의 (행별 코드, 서로 다른 문자열 Series). 열이 없거나 빈 값은 빈 문자열로 취급"""
+    import pandas as pd
+
+    values = df[column].fillna("").astype(str) if column in df.columns else pd.Series("", index=df.index)
+    codes, uniques = pd.factorize(values)
+    return codes, pd.Series(uniques, dtype=object)
+
+
+def normalize_content_frame(df, crawled_at):
+    """
+    컨텐츠 DataFrame에 작성일_정규화(datetime64), 조회수_정규화(Int64) 열 추가
+
+    이미 값이 있는 행(정규화 열이 있는 실행)은 그대로 두고 빈 행만 계산한다.
+
+    Args:
+        df (DataFrame): 작성일, 조회수 열이 있는 컨텐츠 DataFrame
+        crawled_at (str|datetime): 수집 시각 열 이름 또는 모든 행에 쓸 수집 시각
+
+    Returns:
+        DataFrame: 열이 추가된 DataFrame (원본을 수정하지 않음)
+    """
+    import pandas as pd
+
+    df = df.copy()
+    if df.empty:
+        for column in NORMALIZED_COLUMNS:
+            df[column] = pd.Series(dtype="object")
+        return df
+
+    crawled = pd.to_datetime(df[crawled_at] if isinstance(crawled_at, str) else pd.Series(crawled_at, index=df.index))
+
+    # 정규식은 서로 다른 문자열에만 적용하고 결과를 행 위치로 펼친다 (실행이 쌓여도 값의 종류는 적음)
+    date_codes, date_texts = _factorize(df, "작성일")
+    absolute = date_texts.str.extract(ABSOLUTE_DATE_PATTERN.pattern).astype(float)
+    absolute = pd.to_datetime(pd.DataFrame({"year": absolute[0], "month": absolute[1], "day": absolute[2]}),
+                              errors="coerce")
+    relative = date_texts.str.extract(RELATIVE_DATE_PATTERN.pattern)
+    seconds = relative[0].astype(float) * relative[1].map(RELATIVE_UNIT_SECONDS)
+    words = date_texts.str.extract(RELATIVE_WORD_PATTERN.pattern)[0].map(RELATIVE_WORD_DAYS) * 86400.0
+    absolute = pd.Series(absolute.to_numpy()[date_codes], index=df.index)
+    offset = pd.to_timedelta(seconds.fillna(words).to_numpy()[date_codes], unit="s")
+    parsed_dates = absolute.fillna(crawled - offset).dt.normalize()
+
+    view_codes, view_texts = _factorize(df, "조회수")
+    has_word = view_texts.str.contains(VIEW_WORD_PATTERN.pattern, flags=re.IGNORECASE, regex=True)
+    date_like = view_texts.str.contains(DATE_LIKE_PATTERN.pattern, regex=True)
+    bare = view_texts.str.fullmatch(BARE_VIEW_PATTERN.pattern)
+    view_texts = view_texts.where(~has_word, view_texts.str.replace(DATE_LIKE_PATTERN.pattern, " ", regex=True))
+    extracted = view_texts.str.extract(VIEW_COUNT_PATTERN.pattern)
+    numbers = extracted[0].str.rstrip(".,").str.replace(",", "", regex=False)
+    dotted = extracted[1].eq("") & numbers.str.fullmatch(_DOTTED_THOUSANDS.pattern).fillna(False)
+    numbers = numbers.where(~dotted, numbers.str.replace(".", "", regex=False))
+    views = (pd.to_numeric(numbers, errors="coerce") * extracted[1].map(VIEW_UNITS)).round()
+    views = views.where(has_word | (bare & ~date_like))
+    parsed_views = pd.Series(views.to_numpy()[view_codes], index=df.index).astype("Int64")
+
+    if NORMALIZED_DATE_COLUMN in df.columns:
+        parsed_dates = pd.to_datetime(df[NORMALIZED_DATE_COLUMN].replace("", None), errors="coerce").fillna(parsed_dates)
+    if NORMALIZED_VIEW_COLUMN in df.columns:
+        existing = pd.to_numeric(df[NORMALIZED_VIEW_COLUMN].replace("", None), errors="coerce")
+        parsed_views = existing.round().astype("Int64").fillna(parsed_views)
+
+    df[NORMALIZED_DATE_COLUMN] = parsed_dates
+    df[NORMALIZED_VIEW_COLUMN] = parsed_views
+    return df
@@ -1,10 +1,16 @@
 import os
+import sys
 import datetime
 import pandas as pd
 import numpy as np
 import tkinter as tk
-from naver_crawler.naver_crawler_gui import NaverCrawlerGUI
-from naver_crawler.naver_search_crawler_url_analysis import run_crawler
+
+# naver_crawler 폴더의 모듈은 서로를 같은 폴더 기준으로 import하므로 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "naver_crawler"))
+
+from naver_crawler_gui import NaverCrawlerGUI
+from naver_search_crawler_url_analysis import NaverSearchCrawler, run_crawler
+from keyword_normalizer import KeywordIndex
 
 def crawl_and_save_with_params(params, gui=None):
     """조건에 맞게 크롤링을 실행하고 결과를 저장"""
@@ -52,10 +58,22 @@ def crawl_and_save_with_params(params, gui=None):
         
         return df
     
-    # 실제 크롤링 실행
+    # 실제 크롤링 실행 (모든 키워드가 같은 브라우저를 재사용)
     all_results = []
+    crawler = NaverSearchCrawler()
+    keyword_index = KeywordIndex()
+    canonical_results = {}    # 정규형 -> 이미 크롤링한 결과 행
     
     for keyword in keywords:
+        canonical, is_new = keyword_index.add(keyword)
+        if not is_new:
+            # 표기만 다른 중복 키워드는 기존 결과를 재사용
+            results = [dict(row, 키워드=keyword) for row in canonical_results.get(canonical, [])]
+            all_results.extend(results)
+            if gui:
+                gui.update_status(f"'{keyword}' 키워드는 '{canonical}'와 같은 검색어로 기존 결과를 재사용합니다: {len(results)}개")
+            continue
+        
         if gui:
             gui.update_status(f"'{keyword}' 키워드 크롤링 중...")
         
@@ -64,9 +82,12 @@ def crawl_and_save_with_params(params, gui=None):
             results = run_crawler(
                 keyword=keyword,
                 sections=sections,
-                ranks=ranks
+                ranks=ranks,
+                crawler=crawler
             )
             
+            canonical_results[canonical] = results
+            
             if results:
                 all_results.extend(results)
                 
@@ -82,6 +103,8 @@ def crawl_and_save_with_params(params, gui=None):
             if gui:
                 gui.update_status(error_msg)
     
+    crawler.close()
+    
     if gui:
         gui.update_status("모든 키워드 크롤링 완료")
     